@@ -0,0 +1,366 @@
+"""
+Generate a large synthetic bobverse dataset (users, follows, articles, tags,
+favorites and comments) in a new SQLite database.
+
+Like real social graphs, the data is skewed: who gets followed, who writes,
+and which tags are used follow Zipf distributions, while how many accounts a
+user follows and how many favorites and comments an article gets are Pareto
+distributed. The output only depends on the seed, and millions of users load
+in minutes: rows are bulk inserted with journaling off, and the secondary and
+full-text indexes are built once, after the load. Home feed timelines are
+built from the follows, for when `TIMELINE_ENABLED` is on.
+
+Every user's password is `BENCH_PASSWORD`.
+
+Usage:
+    python -m benchmarks.dataset --db bench.db --users 1000000 --articles 2000000
+"""
+
+import argparse
+import dataclasses
+import datetime
+import itertools
+import os
+import random
+import sqlite3
+import time
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from passlib.hash import bcrypt
+from sqlalchemy import create_engine
+from sqlalchemy.schema import CreateIndex
+
+from benchmarks.search import TextGenerator, make_vocabulary
+from bobverse.core.settings.base import BaseAppSettings
+from bobverse.infrastructure.models import ARTICLE_FTS_DDL, Base
+from bobverse.infrastructure.repositories.timeline import rebuild_statements
+
+BENCH_PASSWORD = "password"
+DEFAULT_IMAGE_URL = "https://api.bobnews.io/images/smiley-cyrus.jpeg"
+# Fixed, so that the dataset only depends on the seed.
+EPOCH = datetime.datetime(2024, 1, 1)
+BCRYPT_SALT = "benchmarkdatasetsalt0."
+# Timelines are built as the default settings would have built them.
+TIMELINE_SETTINGS = BaseAppSettings.model_fields
+
+# Only safe for a database being created: a crash leaves it corrupt.
+BULK_LOAD_PRAGMAS = (
+    "PRAGMA journal_mode = OFF",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA locking_mode = EXCLUSIVE",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -262144",
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class DatasetScale:
+    users: int = 1_000
+    # Means; the actual counts are Pareto distributed.
+    follows_per_user: int = 20
+    articles: int = 5_000
+    tags: int = 200
+    tags_per_article: int = 3
+    favorites_per_article: int = 5
+    comments_per_article: int = 3
+    # Zipf exponent of user popularity, authorship and tag usage.
+    skew: float = 1.0
+
+
+def username(user_id: int) -> str:
+    return f"user{user_id}"
+
+
+def email(user_id: int) -> str:
+    return f"user{user_id}@example.com"
+
+
+def article_slug(article_id: int) -> str:
+    return f"article-{article_id}"
+
+
+class ZipfSampler:
+    """Draw items where the item of popularity rank r has weight 1 / r**exponent."""
+
+    def __init__(
+        self, rnd: random.Random, items: Sequence[int], exponent: float
+    ) -> None:
+        self._rnd = rnd
+        # Ranks are assigned at random, so that ids say nothing about popularity.
+        self._items = rnd.sample(items, k=len(items))
+        self._weights = list(
+            itertools.accumulate(
+                1 / rank**exponent for rank in range(1, len(items) + 1)
+            )
+        )
+
+    def sample(self, k: int) -> list[int]:
+        """Up to `k` distinct items (duplicate draws are dropped)."""
+        picks = self._rnd.choices(self._items, cum_weights=self._weights, k=k)
+        return list(dict.fromkeys(picks))
+
+    def one(self) -> int:
+        return self._rnd.choices(self._items, cum_weights=self._weights)[0]
+
+
+class TextPool:
+    """
+    Random windows over one long stretch of Zipf-distributed text: as skewed as
+    drawing every word, at a fraction of the cost.
+    """
+
+    def __init__(
+        self, rnd: random.Random, generator: TextGenerator, words: int = 1_000_000
+    ) -> None:
+        self._rnd = rnd
+        self._words = generator.text(words).split()
+
+    def text(self, words: int) -> str:
+        start = self._rnd.randrange(len(self._words) - words)
+        return " ".join(self._words[start : start + words])
+
+
+def pareto_count(rnd: random.Random, mean: int, limit: int) -> int:
+    # Pareto with alpha = 2 has mean 2 * scale and a long tail.
+    return min(int(rnd.paretovariate(2.0) * mean / 2), limit)
+
+
+def _insert(
+    connection: sqlite3.Connection,
+    table: str,
+    columns: tuple[str, ...],
+    rows: Iterable[tuple[Any, ...]],
+    chunk_size: int,
+) -> int:
+    statement = (
+        f'INSERT INTO "{table}" ({", ".join(columns)}) '
+        f'VALUES ({", ".join("?" * len(columns))})'
+    )
+    count = 0
+    for chunk in itertools.batched(rows, chunk_size):
+        connection.executemany(statement, chunk)
+        count += len(chunk)
+    connection.commit()
+    return count
+
+
+def seed_dataset(
+    db_path: str, scale: DatasetScale, seed: int, chunk_size: int = 50_000
+) -> dict[str, tuple[int, float]]:
+    """
+    Create the schema and bulk insert a dataset of the given scale.
+
+    Returns the rows written and seconds spent per table, and per index build.
+    """
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+    # Built after the load, in one pass each, instead of row by row.
+    deferred_indexes = [
+        index for table in Base.metadata.sorted_tables for index in table.indexes
+    ]
+
+    rnd = random.Random(seed)
+    vocabulary = make_vocabulary(rnd)
+    text = TextPool(rnd, TextGenerator(rnd=rnd, vocabulary=vocabulary))
+    # A single bcrypt hash shared by every user keeps seeding fast. (Hashed with
+    # passlib directly: `bobverse.services.password` needs the app settings.)
+    password_hash = bcrypt.using(salt=BCRYPT_SALT).hash(BENCH_PASSWORD)
+    user_ids = range(1, scale.users + 1)
+    article_ids = range(1, scale.articles + 1)
+    tag_ids = range(1, scale.tags + 1)
+    followed = ZipfSampler(rnd, user_ids, exponent=scale.skew)
+    authors = ZipfSampler(rnd, user_ids, exponent=scale.skew)
+    tags = ZipfSampler(rnd, tag_ids, exponent=scale.skew)
+
+    def following(follower_id: int) -> list[int]:
+        count = pareto_count(rnd, scale.follows_per_user, limit=scale.users)
+        return sorted(set(followed.sample(count)) - {follower_id})
+
+    def timestamp(minutes_ago: int) -> str:
+        return str(EPOCH - datetime.timedelta(minutes=minutes_ago))
+
+    connection = sqlite3.connect(db_path)
+    for pragma in BULK_LOAD_PRAGMAS:
+        connection.execute(pragma)
+    for index in deferred_indexes:
+        connection.execute(f'DROP INDEX "{index.name}"')
+    connection.execute("DROP TRIGGER article_fts_ai")
+
+    timings: dict[str, tuple[int, float]] = {}
+
+    def load(table: str, columns: tuple[str, ...], rows: Iterable[Any]) -> None:
+        started = time.perf_counter()
+        count = _insert(connection, table, columns, rows, chunk_size)
+        timings[table] = (count, time.perf_counter() - started)
+
+    load(
+        "user",
+        ("id", "username", "email", "password_hash", "bio", "image_url")
+        + ("created_at",),
+        (
+            (
+                user_id,
+                username(user_id),
+                email(user_id),
+                password_hash,
+                "",
+                DEFAULT_IMAGE_URL,
+                str(EPOCH),
+            )
+            for user_id in user_ids
+        ),
+    )
+    load(
+        "follower",
+        ("follower_id", "following_id", "created_at"),
+        (
+            (follower_id, following_id, str(EPOCH))
+            for follower_id in user_ids
+            for following_id in following(follower_id)
+        ),
+    )
+    load(
+        "tag",
+        ("id", "tag", "created_at"),
+        zip(
+            tag_ids, rnd.sample(vocabulary, k=scale.tags), itertools.repeat(str(EPOCH))
+        ),
+    )
+    load(
+        "article",
+        ("id", "author_id", "slug", "title", "description", "body")
+        + ("created_at", "updated_at"),
+        (
+            (
+                article_id,
+                authors.one(),
+                article_slug(article_id),
+                text.text(6),
+                text.text(15),
+                text.text(200),
+                created_at := timestamp(minutes_ago=article_id),
+                created_at,
+            )
+            for article_id in article_ids
+        ),
+    )
+    load(
+        "article_tag",
+        ("article_id", "tag_id", "created_at"),
+        (
+            (article_id, tag_id, str(EPOCH))
+            for article_id in article_ids
+            for tag_id in tags.sample(scale.tags_per_article)
+        ),
+    )
+    load(
+        "favorite",
+        ("user_id", "article_id", "created_at"),
+        (
+            (user_id, article_id, str(EPOCH))
+            for article_id in article_ids
+            for user_id in rnd.sample(
+                user_ids,
+                k=pareto_count(rnd, scale.favorites_per_article, limit=scale.users),
+            )
+        ),
+    )
+    load(
+        "comment",
+        ("article_id", "author_id", "body", "created_at", "updated_at"),
+        (
+            (
+                article_id,
+                rnd.choice(user_ids),
+                text.text(30),
+                created_at := timestamp(minutes_ago=article_id - index),
+                created_at,
+            )
+            for article_id in article_ids
+            for index in range(
+                pareto_count(rnd, scale.comments_per_article, limit=1_000)
+            )
+        ),
+    )
+
+    for index in deferred_indexes:
+        started = time.perf_counter()
+        connection.execute(str(CreateIndex(index).compile(dialect=engine.dialect)))
+        timings[f"index {index.name}"] = (0, time.perf_counter() - started)
+    started = time.perf_counter()
+    connection.execute(
+        "UPDATE article SET favorites_count = counts.favorites FROM "
+        "(SELECT article_id, count(*) AS favorites FROM favorite GROUP BY article_id)"
+        " AS counts WHERE counts.article_id = article.id"
+    )
+    connection.commit()
+    timings["article favorites_count"] = (0, time.perf_counter() - started)
+    started = time.perf_counter()
+    connection.execute(
+        "UPDATE tag SET article_count = counts.articles FROM "
+        "(SELECT tag_id, count(*) AS articles FROM article_tag GROUP BY tag_id)"
+        " AS counts WHERE counts.tag_id = tag.id"
+    )
+    connection.commit()
+    timings["tag article_count"] = (0, time.perf_counter() - started)
+    started = time.perf_counter()
+    for statement in rebuild_statements(
+        celebrity_threshold=TIMELINE_SETTINGS["timeline_celebrity_threshold"].default,
+        limit=TIMELINE_SETTINGS["timeline_backfill_limit"].default,
+    ):
+        compiled = statement.compile(dialect=engine.dialect)
+        connection.execute(
+            str(compiled), [compiled.params[name] for name in compiled.positiontup]
+        )
+    connection.commit()
+    timings["timeline"] = (0, time.perf_counter() - started)
+    started = time.perf_counter()
+    connection.execute("INSERT INTO article_fts (article_fts) VALUES ('rebuild')")
+    connection.execute(ARTICLE_FTS_DDL[1])
+    connection.commit()
+    timings["index article_fts"] = (0, time.perf_counter() - started)
+    connection.close()
+    return timings
+
+
+def add_scale_arguments(parser: argparse.ArgumentParser) -> None:
+    for field in dataclasses.fields(DatasetScale):
+        parser.add_argument(
+            f"--{field.name.replace('_', '-')}",
+            type=type(field.default),
+            default=field.default,
+        )
+
+
+def scale_from_arguments(args: argparse.Namespace) -> DatasetScale:
+    return DatasetScale(
+        **{
+            field.name: getattr(args, field.name)
+            for field in dataclasses.fields(DatasetScale)
+        }
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic dataset")
+    parser.add_argument("--db", required=True, help="SQLite database file to create")
+    parser.add_argument("--seed", type=int, default=42)
+    add_scale_arguments(parser)
+    args = parser.parse_args()
+    if os.path.exists(args.db):
+        parser.error(f"{args.db} already exists")
+
+    started = time.perf_counter()
+    timings = seed_dataset(
+        db_path=args.db, scale=scale_from_arguments(args), seed=args.seed
+    )
+    for name, (rows, seconds) in timings.items():
+        throughput = f"{rows / seconds:>12,.0f} rows/s" if rows else ""
+        print(f"{name:<32} {rows:>12,} rows {seconds:>8.1f}s {throughput}")
+    print(f"Seeded {args.db} in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
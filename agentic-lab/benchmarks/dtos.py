@@ -0,0 +1,112 @@
+"""
+Benchmark building article DTOs: dict-backed DTOs + `asdict` vs. slotted DTOs.
+
+Usage:
+    python -m benchmarks.dtos --rows 10000
+"""
+
+import argparse
+import dataclasses
+import datetime
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from bobverse.domain.dtos.article import ArticleAuthorDTO, ArticleDTO, ArticleRecordDTO
+
+
+def _without_slots(cls: type) -> type:
+    """Rebuild a slotted DTO as the plain frozen dataclass it used to be."""
+    fields = [(field.name, field.type, field) for field in dataclasses.fields(cls)]
+    return dataclasses.make_dataclass(f"Legacy{cls.__name__}", fields, frozen=True)
+
+
+LegacyRecordDTO = _without_slots(ArticleRecordDTO)
+LegacyAuthorDTO = _without_slots(ArticleAuthorDTO)
+LegacyArticleDTO = _without_slots(ArticleDTO)
+
+
+def make_rows(rows: int) -> list[dict[str, Any]]:
+    now = datetime.datetime.now()
+    return [
+        {
+            "id": row_id,
+            "author_id": row_id % 100,
+            "slug": f"article-{row_id}",
+            "title": f"Title {row_id}",
+            "description": "Description",
+            "body": "Body " * 50,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for row_id in range(rows)
+    ]
+
+
+def build_legacy(rows: list[dict[str, Any]]) -> list[Any]:
+    articles = []
+    for row in rows:
+        record = LegacyRecordDTO(**row)
+        articles.append(
+            LegacyArticleDTO(
+                **dataclasses.asdict(record),
+                author=LegacyAuthorDTO(username="author"),
+                tags=["tag1", "tag2"],
+                favorited=False,
+                favorites_count=0,
+            )
+        )
+    return articles
+
+
+def build_slotted(rows: list[dict[str, Any]]) -> list[ArticleDTO]:
+    articles = []
+    for row in rows:
+        record = ArticleRecordDTO(**row)
+        articles.append(
+            ArticleDTO.from_record(
+                record=record,
+                author=ArticleAuthorDTO(username="author"),
+                tags=["tag1", "tag2"],
+                favorited=False,
+                favorites_count=0,
+            )
+        )
+    return articles
+
+
+def measure(build: Callable, rows: list[dict[str, Any]], repeat: int) -> None:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        build(rows)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    articles = build(rows)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del articles
+
+    print(
+        f"{build.__name__:>14}: p50 {statistics.median(timings):7.2f} ms   "
+        f"retained {retained / 1024:8.0f} KiB   peak {peak / 1024:8.0f} KiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark article DTO building")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    print(f"{args.rows} rows")
+    for build in (build_legacy, build_slotted):
+        measure(build=build, rows=rows, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,489 @@
+"""
+Load test every API route at a fixed concurrency.
+
+Seeds a synthetic dataset (see `benchmarks.dataset`), serves the application
+in-process against it (or targets a running server with `--base-url`) and
+records p50/p95/p99 latency and throughput per route. Results are written as
+JSON; given a stored baseline, routes that got slower are flagged and the run
+exits with status 1.
+
+Usage:
+    python -m benchmarks.load --requests 200 --concurrency 16 --output baseline.json
+    python -m benchmarks.load --baseline baseline.json --output current.json
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from typing import Any
+
+from httpx import ASGITransport, AsyncClient, Response
+
+from benchmarks.dataset import (
+    BENCH_PASSWORD,
+    DatasetScale,
+    add_scale_arguments,
+    article_slug,
+    email,
+    scale_from_arguments,
+    seed_dataset,
+    username,
+)
+
+# The benchmark user, who logs in and drives the authenticated routes.
+BENCH_USER_ID = 1
+# Users followed (and then unfollowed) per bulk request.
+BULK_FOLLOW_SIZE = 10
+
+
+@dataclasses.dataclass
+class LoadContext:
+    rnd: random.Random
+    scale: DatasetScale
+    sequence: itertools.count = dataclasses.field(default_factory=itertools.count)
+    # Filled by the scenarios creating data, and consumed by the ones deleting it.
+    created_slugs: list[str] = dataclasses.field(default_factory=list)
+    followed: list[str] = dataclasses.field(default_factory=list)
+    bulk_followed: list[list[str]] = dataclasses.field(default_factory=list)
+    favorited: list[str] = dataclasses.field(default_factory=list)
+    comments: list[str] = dataclasses.field(default_factory=list)
+
+    def any_user(self) -> str:
+        return username(self.rnd.randint(BENCH_USER_ID + 1, self.scale.users))
+
+    def any_slug(self) -> str:
+        return article_slug(self.rnd.randint(1, self.scale.articles))
+
+
+@dataclasses.dataclass(frozen=True)
+class RequestArgs:
+    url: str
+    params: dict[str, Any] | None = None
+    json: dict[str, Any] | None = None
+
+
+@dataclasses.dataclass(frozen=True)
+class Scenario:
+    method: str
+    # Route path as declared by the application, e.g. "/api/articles/{slug}".
+    route: str
+    build: Callable[[LoadContext], RequestArgs]
+    collect: Callable[[LoadContext, RequestArgs, Response], None] | None = None
+    # Data this scenario uses up (or picks from), collected by `producer`.
+    consumes: Callable[[LoadContext], list[Any]] | None = None
+    producer: str | None = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.method} {self.route}"
+
+
+def _pop(items: list[Any]) -> Any:
+    return items.pop() if items else None
+
+
+SCENARIOS = [
+    Scenario("GET", "/api/health-check", lambda ctx: RequestArgs("/health-check")),
+    Scenario("GET", "/api/metrics", lambda ctx: RequestArgs("/metrics")),
+    Scenario(
+        "POST",
+        "/api/users",
+        lambda ctx: RequestArgs(
+            "/users",
+            json={
+                "user": {
+                    "username": f"load-{next(ctx.sequence)}",
+                    "email": f"load-{next(ctx.sequence)}@example.com",
+                    "password": BENCH_PASSWORD,
+                }
+            },
+        ),
+    ),
+    Scenario(
+        "POST",
+        "/api/users/login",
+        lambda ctx: RequestArgs(
+            "/users/login",
+            json={"user": {"email": email(BENCH_USER_ID), "password": BENCH_PASSWORD}},
+        ),
+    ),
+    Scenario("GET", "/api/user", lambda ctx: RequestArgs("/user")),
+    Scenario(
+        "PUT",
+        "/api/user",
+        lambda ctx: RequestArgs("/user", json={"user": {"bio": ctx.any_user()}}),
+    ),
+    Scenario(
+        "GET",
+        "/api/profiles/search",
+        lambda ctx: RequestArgs("/profiles/search", params={"q": ctx.any_user()[:6]}),
+    ),
+    Scenario(
+        "GET",
+        "/api/profiles/{username}",
+        lambda ctx: RequestArgs(f"/profiles/{ctx.any_user()}"),
+    ),
+    Scenario(
+        "POST",
+        "/api/profiles/{username}/follow",
+        lambda ctx: RequestArgs(f"/profiles/{ctx.any_user()}/follow"),
+        collect=lambda ctx, args, response: ctx.followed.append(
+            response.json()["profile"]["username"]
+        ),
+    ),
+    Scenario(
+        "DELETE",
+        "/api/profiles/{username}/follow",
+        lambda ctx: RequestArgs(f"/profiles/{_pop(ctx.followed)}/follow"),
+        consumes=lambda ctx: ctx.followed,
+        producer="POST /api/profiles/{username}/follow",
+    ),
+    Scenario(
+        "POST",
+        "/api/profiles/follow",
+        lambda ctx: RequestArgs(
+            "/profiles/follow",
+            json={"usernames": [ctx.any_user() for _ in range(BULK_FOLLOW_SIZE)]},
+        ),
+        collect=lambda ctx, args, response: ctx.bulk_followed.append(
+            [result["username"] for result in response.json()["results"]]
+        ),
+    ),
+    Scenario(
+        "DELETE",
+        "/api/profiles/follow",
+        lambda ctx: RequestArgs(
+            "/profiles/follow", json={"usernames": _pop(ctx.bulk_followed)}
+        ),
+        consumes=lambda ctx: ctx.bulk_followed,
+        producer="POST /api/profiles/follow",
+    ),
+    Scenario("GET", "/api/tags", lambda ctx: RequestArgs("/tags")),
+    Scenario(
+        "GET", "/api/articles", lambda ctx: RequestArgs("/articles", {"limit": 20})
+    ),
+    Scenario(
+        "GET",
+        "/api/articles/feed",
+        lambda ctx: RequestArgs("/articles/feed", {"limit": 20}),
+    ),
+    Scenario(
+        "GET",
+        "/api/articles/search",
+        lambda ctx: RequestArgs("/articles/search", {"q": "ba"}),
+    ),
+    Scenario(
+        "GET",
+        "/api/articles/export",
+        lambda ctx: RequestArgs("/articles/export", {"author": ctx.any_user()}),
+    ),
+    Scenario(
+        "POST",
+        "/api/articles",
+        lambda ctx: RequestArgs(
+            "/articles",
+            json={
+                "article": {
+                    "title": f"Load article {next(ctx.sequence)}",
+                    "description": "Description",
+                    "body": "Body",
+                    "tagList": ["load", "benchmark"],
+                }
+            },
+        ),
+        collect=lambda ctx, args, response: ctx.created_slugs.append(
+            response.json()["article"]["slug"]
+        ),
+    ),
+    Scenario(
+        "GET",
+        "/api/articles/{slug}",
+        lambda ctx: RequestArgs(f"/articles/{ctx.any_slug()}"),
+    ),
+    Scenario(
+        "PUT",
+        "/api/articles/{slug}",
+        lambda ctx: RequestArgs(
+            f"/articles/{ctx.rnd.choice(ctx.created_slugs)}",
+            json={"article": {"body": "Updated body"}},
+        ),
+        consumes=lambda ctx: ctx.created_slugs,
+        producer="POST /api/articles",
+    ),
+    Scenario(
+        "POST",
+        "/api/articles/{slug}/favorite",
+        lambda ctx: RequestArgs(f"/articles/{ctx.any_slug()}/favorite"),
+        collect=lambda ctx, args, response: ctx.favorited.append(
+            response.json()["article"]["slug"]
+        ),
+    ),
+    Scenario(
+        "DELETE",
+        "/api/articles/{slug}/favorite",
+        lambda ctx: RequestArgs(f"/articles/{_pop(ctx.favorited)}/favorite"),
+        consumes=lambda ctx: ctx.favorited,
+        producer="POST /api/articles/{slug}/favorite",
+    ),
+    Scenario(
+        "GET",
+        "/api/articles/{slug}/comments",
+        lambda ctx: RequestArgs(f"/articles/{ctx.any_slug()}/comments"),
+    ),
+    Scenario(
+        "POST",
+        "/api/articles/{slug}/comments",
+        lambda ctx: RequestArgs(
+            f"/articles/{ctx.any_slug()}/comments",
+            json={"comment": {"body": "Load comment"}},
+        ),
+        collect=lambda ctx, args, response: ctx.comments.append(
+            f"{args.url}/{response.json()['comment']['id']}"
+        ),
+    ),
+    Scenario(
+        "DELETE",
+        "/api/articles/{slug}/comments/{id}",
+        lambda ctx: RequestArgs(f"{_pop(ctx.comments)}"),
+        consumes=lambda ctx: ctx.comments,
+        producer="POST /api/articles/{slug}/comments",
+    ),
+    Scenario(
+        "GET",
+        "/api/articles/{slug}/comments/search",
+        lambda ctx: RequestArgs(
+            f"/articles/{ctx.any_slug()}/comments/search", {"query": "ba"}
+        ),
+    ),
+    Scenario(
+        "DELETE",
+        "/api/articles/{slug}",
+        lambda ctx: RequestArgs(f"/articles/{_pop(ctx.created_slugs)}"),
+        consumes=lambda ctx: ctx.created_slugs,
+        producer="POST /api/articles",
+    ),
+]
+SCENARIOS_BY_NAME = {scenario.name: scenario for scenario in SCENARIOS}
+
+# Routes deliberately left out of the load test.
+SKIPPED_ROUTES = {
+    # Intentionally vulnerable demo route; it fails on every request.
+    "GET /api/articles/{slug}/export"
+}
+
+
+async def supply_scenario(
+    client: AsyncClient, scenario: Scenario, ctx: LoadContext, requests: int
+) -> bool:
+    """
+    Make sure there is data for every request of `scenario`, making the
+    requests of its producer (untimed) for what is missing, e.g. when the
+    producer was filtered out with `--route` or failed. Return whether there
+    is any data at all.
+    """
+    if scenario.consumes is None or scenario.producer is None:
+        return True
+    producer = SCENARIOS_BY_NAME[scenario.producer]
+    for _ in range(requests - len(scenario.consumes(ctx))):
+        args = producer.build(ctx)
+        response = await client.request(
+            producer.method, args.url, params=args.params, json=args.json
+        )
+        if response.status_code < 400 and producer.collect is not None:
+            producer.collect(ctx, args, response)
+    return bool(scenario.consumes(ctx))
+
+
+async def run_scenario(
+    client: AsyncClient,
+    scenario: Scenario,
+    ctx: LoadContext,
+    requests: int,
+    concurrency: int,
+) -> dict[str, Any]:
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for _ in remaining:
+            args = scenario.build(ctx)
+            started = time.perf_counter()
+            response = await client.request(
+                scenario.method, args.url, params=args.params, json=args.json
+            )
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+            elif scenario.collect is not None:
+                scenario.collect(ctx, args, response)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "requests": requests,
+        "errors": errors,
+        "rps": round(requests / elapsed, 1),
+        "p50_ms": round(percentiles[49] * 1000, 2),
+        "p95_ms": round(percentiles[94] * 1000, 2),
+        "p99_ms": round(percentiles[98] * 1000, 2),
+    }
+
+
+def _create_app(db_path: str) -> Any:
+    # Settings are read once, when the application modules are imported.
+    os.environ["SQLITE_DB_PATH"] = f"sqlite+aiosqlite:///{db_path}"
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark-jwt-secret-key")
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+    os.environ["RATE_LIMIT_REQUESTS"] = str(sys.maxsize)
+    from bobverse.app import app
+
+    return app
+
+
+def check_route_coverage(app: Any) -> None:
+    declared = {
+        f"{method} {route.path}"
+        for route in app.routes
+        if hasattr(route, "methods") and route.path.startswith("/api")
+        for method in route.methods
+    }
+    benchmarked = {scenario.name for scenario in SCENARIOS} | SKIPPED_ROUTES
+    if missing := sorted(declared - benchmarked):
+        print(f"warning: routes without a load scenario: {', '.join(missing)}")
+
+
+async def run(args: argparse.Namespace, scale: DatasetScale) -> dict[str, Any]:
+    if args.base_url:
+        transport, base_url = None, args.base_url.rstrip("/") + "/api"
+    else:
+        app = _create_app(db_path=args.db)
+        check_route_coverage(app)
+        transport = ASGITransport(app=app, raise_app_exceptions=False)
+        base_url = "http://bench/api"
+
+    ctx = LoadContext(rnd=random.Random(args.seed), scale=scale)
+    results = {}
+    async with AsyncClient(transport=transport, base_url=base_url) as client:
+        response = await client.post(
+            "/users/login",
+            json={"user": {"email": email(BENCH_USER_ID), "password": BENCH_PASSWORD}},
+        )
+        response.raise_for_status()
+        token = response.json()["user"]["token"]
+        client.headers["Authorization"] = f"Token {token}"
+
+        for scenario in SCENARIOS:
+            if args.route and not any(part in scenario.name for part in args.route):
+                continue
+            if not await supply_scenario(
+                client=client, scenario=scenario, ctx=ctx, requests=args.requests
+            ):
+                print(f"{scenario.name:<45} skipped: {scenario.producer} failed")
+                continue
+            results[scenario.name] = result = await run_scenario(
+                client=client,
+                scenario=scenario,
+                ctx=ctx,
+                requests=args.requests,
+                concurrency=args.concurrency,
+            )
+            print(
+                f"{scenario.name:<45} {result['rps']:>8.1f} rps  "
+                f"p50 {result['p50_ms']:>8.2f} ms  p95 {result['p95_ms']:>8.2f} ms  "
+                f"p99 {result['p99_ms']:>8.2f} ms  errors {result['errors']}"
+            )
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "scale": dataclasses.asdict(scale),
+            "target": args.base_url or "in-process",
+        },
+        "results": results,
+    }
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], tolerance: float
+) -> list[str]:
+    """
+    Return the routes whose p95 latency grew, or whose throughput dropped, by
+    more than `tolerance` (a fraction) relative to the baseline.
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        if not (base := baseline["results"].get(name)):
+            continue
+        if result["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p95 {base['p95_ms']:.2f} -> {result['p95_ms']:.2f} ms"
+            )
+        if result["rps"] < base["rps"] * (1 - tolerance):
+            regressions.append(f"{name}: {base['rps']:.1f} -> {result['rps']:.1f} rps")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test the API routes")
+    parser.add_argument("--requests", type=int, default=200, help="Per route")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--route", action="append", help="Only routes containing this (repeatable)"
+    )
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", help="Compare against this results file")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="Allowed regression (fraction)"
+    )
+    parser.add_argument(
+        "--base-url",
+        help="Target a running server (seeded with the same --db) instead of "
+        "serving the application in-process",
+    )
+    parser.add_argument("--db", help="Reuse an existing benchmark database file")
+    add_scale_arguments(parser)
+    args = parser.parse_args()
+
+    scale = scale_from_arguments(args)
+    if not args.db:
+        args.db = os.path.join(tempfile.mkdtemp(), "load-bench.db")
+    if not os.path.exists(args.db):
+        started = time.perf_counter()
+        seed_dataset(db_path=args.db, scale=scale, seed=args.seed)
+        print(f"Seeded {args.db} in {time.perf_counter() - started:.1f}s")
+
+    current = asyncio.run(run(args=args, scale=scale))
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(current, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        if regressions := compare(current, baseline, args.tolerance):
+            print("Regressions against the baseline:")
+            print("\n".join(f"  {regression}" for regression in regressions))
+            sys.exit(1)
+        print("No regressions against the baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Benchmark full-text article search on a synthetic corpus.
+
+Usage:
+    python -m benchmarks.search --articles 1000000 --queries 200
+"""
+
+import argparse
+import asyncio
+import datetime
+import itertools
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from bobverse.infrastructure.mappers.article import ArticleModelMapper
+from bobverse.infrastructure.models import ARTICLE_FTS_DDL, Base
+from bobverse.infrastructure.repositories.article import ArticleRepository
+
+SYLLABLES = "ba be bo da de do ka ke ko la le lo ma me mo na ne no ra re ro ta te to"
+VOCABULARY_SIZE = 20_000
+# Words used in queries: frequent enough to match, rare enough to be selective.
+QUERY_WORDS = slice(50, 2_000)
+
+
+def make_vocabulary(rnd: random.Random) -> list[str]:
+    syllables = SYLLABLES.split()
+    words: set[str] = set()
+    while len(words) < VOCABULARY_SIZE:
+        words.add("".join(rnd.choices(syllables, k=rnd.randint(2, 4))))
+    return sorted(words)
+
+
+class TextGenerator:
+    """Draw words following a Zipf distribution, like natural language text."""
+
+    def __init__(self, rnd: random.Random, vocabulary: list[str]) -> None:
+        self._rnd = rnd
+        self._vocabulary = vocabulary
+        self._weights = list(
+            itertools.accumulate(1 / rank for rank in range(1, len(vocabulary) + 1))
+        )
+
+    def text(self, words: int) -> str:
+        return " ".join(
+            self._rnd.choices(self._vocabulary, cum_weights=self._weights, k=words)
+        )
+
+
+def seed_corpus(
+    db_path: str, articles: int, seed: int, chunk_size: int = 10_000
+) -> None:
+    """
+    Create the schema and bulk insert `articles` synthetic articles.
+
+    The FTS insert trigger is dropped during the load and the index is rebuilt in one
+    pass afterwards, which is much faster than maintaining it row by row.
+    """
+    Base.metadata.create_all(bind=create_engine(f"sqlite:///{db_path}"))
+
+    rnd = random.Random(seed)
+    generator = TextGenerator(rnd=rnd, vocabulary=make_vocabulary(rnd))
+    now = datetime.datetime.now()
+    connection = sqlite3.connect(db_path)
+    connection.execute("DROP TRIGGER article_fts_ai")
+    connection.execute(
+        "INSERT INTO user (id, username, email, password_hash, bio, created_at) "
+        "VALUES (1, 'bench', 'bench@example.com', '', '', ?)",
+        (str(now),),
+    )
+    for start in range(0, articles, chunk_size):
+        rows = [
+            (
+                1,
+                f"article-{article_id}",
+                generator.text(6),
+                generator.text(15),
+                generator.text(200),
+                str(now - datetime.timedelta(seconds=article_id)),
+            )
+            for article_id in range(start, min(start + chunk_size, articles))
+        ]
+        connection.executemany(
+            "INSERT INTO article "
+            "(author_id, slug, title, description, body, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        connection.commit()
+    connection.execute("INSERT INTO article_fts (article_fts) VALUES ('rebuild')")
+    connection.execute(ARTICLE_FTS_DDL[1])
+    connection.commit()
+    connection.close()
+
+
+def _percentile(samples: list[float], percent: int) -> float:
+    return statistics.quantiles(samples, n=100)[percent - 1]
+
+
+async def run_queries(db_path: str, queries: int, limit: int, seed: int) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    repository = ArticleRepository(article_mapper=ArticleModelMapper())
+    rnd = random.Random(seed)
+    query_words = make_vocabulary(random.Random(seed))[QUERY_WORDS]
+
+    first_page: list[float] = []
+    next_page: list[float] = []
+    async with session_maker() as session:
+        for _ in range(queries):
+            query = " ".join(rnd.sample(query_words, k=rnd.randint(1, 2)))
+
+            started = time.perf_counter()
+            hits = await repository.search(
+                session=session, user_id=None, query=query, limit=limit
+            )
+            first_page.append(time.perf_counter() - started)
+            if not hits:
+                continue
+
+            started = time.perf_counter()
+            await repository.search(
+                session=session,
+                user_id=None,
+                query=query,
+                limit=limit,
+                after=(hits[-1].rank, hits[-1].article.id),
+            )
+            next_page.append(time.perf_counter() - started)
+    await engine.dispose()
+
+    for name, samples in (("first page", first_page), ("next page", next_page)):
+        print(
+            f"{name:>10}: n={len(samples)} "
+            f"p50={_percentile(samples, 50) * 1000:.1f}ms "
+            f"p95={_percentile(samples, 95) * 1000:.1f}ms "
+            f"p99={_percentile(samples, 99) * 1000:.1f}ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark article full-text search")
+    parser.add_argument("--articles", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--db", help="Reuse an existing benchmark database file")
+    args = parser.parse_args()
+
+    db_path = args.db or os.path.join(tempfile.mkdtemp(), "search-bench.db")
+    if not os.path.exists(db_path):
+        started = time.perf_counter()
+        seed_corpus(db_path=db_path, articles=args.articles, seed=args.seed)
+        print(
+            f"Seeded {args.articles} articles into {db_path} "
+            f"in {time.perf_counter() - started:.1f}s"
+        )
+
+    asyncio.run(
+        run_queries(
+            db_path=db_path, queries=args.queries, limit=args.limit, seed=args.seed
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark article feed serialization: pydantic response models vs. fast JSON.
+
+Usage:
+    python -m benchmarks.serialization --articles 100 --body-words 2000
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import random
+import statistics
+import time
+from collections.abc import Callable
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from benchmarks.search import TextGenerator, make_vocabulary
+from bobverse.api import responses
+from bobverse.api.schemas.responses.article import ArticlesFeedResponse
+from bobverse.domain.dtos.article import ArticleAuthorDTO, ArticleDTO, ArticlesFeedDTO
+
+
+def make_feed(articles: int, body_words: int, seed: int) -> ArticlesFeedDTO:
+    rnd = random.Random(seed)
+    text = TextGenerator(rnd=rnd, vocabulary=make_vocabulary(rnd))
+    now = datetime.datetime.now()
+    return ArticlesFeedDTO(
+        articles=[
+            ArticleDTO(
+                id=article_id,
+                author_id=article_id,
+                slug=f"article-{article_id}",
+                title=text.text(8),
+                description=text.text(24),
+                body=text.text(body_words),
+                tags=text.text(3).split(),
+                author=ArticleAuthorDTO(
+                    username=f"user-{article_id}", bio=text.text(12), image=None
+                ),
+                created_at=now,
+                updated_at=now,
+                favorited=bool(article_id % 2),
+                favorites_count=article_id,
+            )
+            for article_id in range(1, articles + 1)
+        ],
+        articles_count=articles,
+    )
+
+
+async def render_with_models(dto: ArticlesFeedDTO, field: Any) -> bytes:
+    """What FastAPI does for a route returning `ArticlesFeedResponse.from_dto`."""
+    content = await serialize_response(
+        field=field, response_content=ArticlesFeedResponse.from_dto(dto=dto)
+    )
+    return JSONResponse(content=content).body
+
+
+async def render_fast(dto: ArticlesFeedDTO, field: Any) -> bytes:
+    return responses.render_articles_feed(dto=dto).body
+
+
+async def measure(
+    render: Callable, dto: ArticlesFeedDTO, field: Any, iterations: int
+) -> list[float]:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await render(dto, field)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+async def run(articles: int, body_words: int, iterations: int, seed: int) -> None:
+    dto = make_feed(articles=articles, body_words=body_words, seed=seed)
+    field = create_model_field(
+        name="Response_feed", type_=ArticlesFeedResponse, mode="serialization"
+    )
+    responses.get_app_settings().fast_json_responses = True
+
+    model_body = await render_with_models(dto, field)
+    fast_body = await render_fast(dto, field)
+    assert json.loads(model_body) == json.loads(fast_body), "payloads differ"
+    encoder = "orjson" if responses.orjson is not None else "json"
+    print(
+        f"{articles} articles, {len(fast_body) / 1024:.0f} KiB payload, "
+        f"fast path encoder: {encoder}"
+    )
+
+    results = {}
+    for name, render in (("models", render_with_models), ("fast", render_fast)):
+        samples = await measure(render, dto, field, iterations)
+        results[name] = statistics.median(samples)
+        p95 = statistics.quantiles(samples, n=100)[94]
+        print(f"{name:>6}: p50 {results[name]:8.2f} ms   p95 {p95:8.2f} ms")
+    print(f"speedup: {results['models'] / results['fast']:.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark article serialization")
+    parser.add_argument("--articles", type=int, default=100)
+    parser.add_argument("--body-words", type=int, default=2_000)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    asyncio.run(
+        run(
+            articles=args.articles,
+            body_words=args.body_words,
+            iterations=args.iterations,
+            seed=args.seed,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,32 @@
+import hashlib
+import hmac
+import random
+import re
+import time
+import uuid
+import zlib
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Any, Unpack
 import pickle
 import base64
 
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
 from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from bobverse.core.exceptions import RateLimitExceededException
+from bobverse.core.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_FLIGHT,
+    RATE_LIMIT_REJECTIONS,
+    metrics,
+)
+from bobverse.core.profiling import RequestSampler
+from bobverse.infrastructure.query_stats import start_query_stats
 
 
 class RateLimitingMiddleware(BaseHTTPMiddleware):
@@ -18,8 +37,15 @@ class RateLimitingMiddleware(BaseHTTPMiddleware):
     rate_limit_duration = timedelta(minutes=1)
     rate_limit_requests = 100
 
-    def __init__(self, *args: Unpack[tuple[Any]], **kwargs: Any):
+    def __init__(
+        self,
+        *args: Unpack[tuple[Any]],
+        rate_limit_requests: int | None = None,
+        **kwargs: Any,
+    ):
         super().__init__(*args, **kwargs)
+        if rate_limit_requests is not None:
+            self.rate_limit_requests = rate_limit_requests
         # Dictionary to store request counts for each IP.
         self.request_counts: dict[str, tuple[int, datetime]] = {}
 
@@ -38,6 +64,7 @@ class RateLimitingMiddleware(BaseHTTPMiddleware):
             request_count = 1
         else:
             if request_count >= self.rate_limit_requests:
+                RATE_LIMIT_REJECTIONS.inc()
                 return RateLimitExceededException.get_response()
             request_count += 1
 
@@ -47,6 +74,329 @@ class RateLimitingMiddleware(BaseHTTPMiddleware):
         return response
 
 
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+# Media types worth compressing; `text/*` is always included.
+COMPRESSIBLE_CONTENT_TYPES = frozenset(
+    {
+        "application/json",
+        "application/x-ndjson",
+        "application/javascript",
+        "application/xml",
+        "image/svg+xml",
+    }
+)
+
+
+class _StreamCompressor:
+    """Incremental gzip/brotli compressor flushing after every chunk."""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int) -> None:
+        self._encoding = encoding
+        if encoding == "br":
+            # Only negotiated when brotli is installed.
+            assert brotli is not None
+            self._compressor = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, chunk: bytes, final: bool) -> bytes:
+        # Flushing keeps streamed responses (e.g. NDJSON) incremental.
+        if self._encoding == "br":
+            data = self._compressor.process(chunk)
+            return data + (
+                self._compressor.finish() if final else self._compressor.flush()
+            )
+        data = self._compressor.compress(chunk)
+        return data + self._compressor.flush(
+            zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+        )
+
+
+class CompressionMiddleware:
+    """
+    Middleware that compresses responses with brotli or gzip.
+
+    Only allowlisted content types of at least `minimum_size` bytes are
+    compressed. Streamed bodies are compressed chunk by chunk, while complete
+    bodies are compressed once and kept in an LRU cache keyed by their digest,
+    so hot responses (e.g. popular articles) are not recompressed per request.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        cache_max_bytes: int = 16 * 1024 * 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.cache_max_bytes = cache_max_bytes
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self._cache: OrderedDict[tuple[str, bytes], bytes] = OrderedDict()
+        self._cache_bytes = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        if not (encoding := self._choose_encoding(accept_encoding)):
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(middleware=self, encoding=encoding, send=send)
+        await self.app(scope, receive, responder.send)
+
+    @staticmethod
+    def _choose_encoding(accept_encoding: str) -> str | None:
+        accepted = set()
+        for item in accept_encoding.lower().split(","):
+            coding, _, params = item.strip().partition(";")
+            quality = params.strip().removeprefix("q=")
+            try:
+                if params and float(quality) <= 0:
+                    continue
+            except ValueError:
+                continue
+            accepted.add(coding.strip())
+        if brotli is not None and "br" in accepted:
+            return "br"
+        if "gzip" in accepted:
+            return "gzip"
+        return None
+
+    def is_compressible(self, headers: Headers) -> bool:
+        if "content-encoding" in headers:
+            return False
+        media_type = headers.get("content-type", "").partition(";")[0].strip()
+        if not (
+            media_type.startswith("text/") or media_type in COMPRESSIBLE_CONTENT_TYPES
+        ):
+            return False
+        content_length = headers.get("content-length")
+        return content_length is None or int(content_length) >= self.minimum_size
+
+    def stream_compressor(self, encoding: str) -> _StreamCompressor:
+        return _StreamCompressor(
+            encoding=encoding,
+            gzip_level=self.gzip_level,
+            brotli_quality=self.brotli_quality,
+        )
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        """
+        Compress a complete body, reusing the cached result for known bodies.
+        """
+        key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+        if (compressed := self._cache.get(key)) is not None:
+            self._cache.move_to_end(key)
+            return compressed
+
+        if encoding == "br":
+            assert brotli is not None
+            compressed = brotli.compress(body, quality=self.brotli_quality)
+        else:
+            compressor = zlib.compressobj(self.gzip_level, zlib.DEFLATED, 31)
+            compressed = compressor.compress(body) + compressor.flush()
+
+        if len(compressed) <= self.cache_max_bytes:
+            self._cache[key] = compressed
+            self._cache_bytes += len(compressed)
+            while self._cache_bytes > self.cache_max_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_bytes -= len(evicted)
+        return compressed
+
+
+class _CompressionResponder:
+    """Send wrapper compressing a single response of `CompressionMiddleware`."""
+
+    def __init__(
+        self, middleware: CompressionMiddleware, encoding: str, send: Send
+    ) -> None:
+        self._middleware = middleware
+        self._encoding = encoding
+        self._send = send
+        self._start_message: Message | None = None
+        self._compressor: _StreamCompressor | None = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Hold the headers back until the first body chunk tells whether
+            # the response is worth compressing.
+            self._start_message = message
+            headers = Headers(raw=message["headers"])
+            self._passthrough = not self._middleware.is_compressible(headers)
+            if self._passthrough:
+                await self._send(message)
+            return
+
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._compressor is None and not more_body:
+            # The whole body arrived at once.
+            if len(body) >= self._middleware.minimum_size:
+                body = self._middleware.compress(body=body, encoding=self._encoding)
+                self._set_encoding_headers(content_length=len(body))
+            await self._send(self._start_message)
+            await self._send({"type": "http.response.body", "body": body})
+            return
+
+        if self._compressor is None:
+            self._compressor = self._middleware.stream_compressor(self._encoding)
+            self._set_encoding_headers(content_length=None)
+            await self._send(self._start_message)
+
+        await self._send(
+            {
+                "type": "http.response.body",
+                "body": self._compressor.compress(body, final=not more_body),
+                "more_body": more_body,
+            }
+        )
+
+    def _set_encoding_headers(self, content_length: int | None) -> None:
+        headers = MutableHeaders(scope=self._start_message)
+        headers["Content-Encoding"] = self._encoding
+        headers.add_vary_header("Accept-Encoding")
+        if content_length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(content_length)
+
+
+class QueryStatsMiddleware:
+    """
+    Middleware that reports the SQL statements a request issued.
+
+    Adds `X-DB-Queries` (statement count) and `Server-Timing` (total DB time)
+    headers, counting the statements executed before the response started.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = start_query_stats()
+
+        async def send_with_stats(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-DB-Queries"] = str(stats.count)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.duration_ms:.2f};desc="{stats.count} queries"',
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_stats)
+
+
+class MetricsMiddleware:
+    """
+    Middleware that records request latency (by route template, so that path
+    parameters do not blow up the label cardinality) and in-flight requests.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            # Set by the router once a route matched the request.
+            route = getattr(scope.get("route"), "path", "unmatched")
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - started,
+                method=scope["method"],
+                route=route,
+                status=status_code,
+            )
+            metrics.maybe_flush()
+
+
+class ProfilingMiddleware:
+    """
+    Middleware that profiles requests with a wall-clock stack sampler.
+
+    Requests sent with `X-Profile: <token>`, plus a random `sample_rate` share
+    of all requests, get one collapsed-stacks file in `directory`, named in
+    the `X-Profile-Id` response header. Other requests only pay for the check.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        directory: str,
+        sample_rate: float = 0.0,
+        token: str | None = None,
+        interval: float = 0.005,
+    ) -> None:
+        self.app = app
+        self.directory = Path(directory)
+        self.sample_rate = sample_rate
+        self.token = token
+        self.interval = interval
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        path = re.sub(r"[^A-Za-z0-9]+", "-", scope["path"]).strip("-")
+        name = (
+            f"{time.strftime('%Y%m%dT%H%M%S')}-{scope['method']}-{path}"
+            f"-{uuid.uuid4().hex[:8]}.collapsed"
+        )
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Profile-Id"] = name
+            await send(message)
+
+        with RequestSampler(path=self.directory / name, interval=self.interval):
+            await self.app(scope, receive, send_with_profile_id)
+
+    def _should_profile(self, scope: Scope) -> bool:
+        if self.token and (header := Headers(scope=scope).get("x-profile")):
+            return hmac.compare_digest(header, self.token)
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+
 # CWE-502: Unsafe Deserialization
 class UserPreferencesMiddleware(BaseHTTPMiddleware):
     """
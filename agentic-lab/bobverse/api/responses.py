@@ -0,0 +1,89 @@
+"""
+Fast JSON rendering of article payloads.
+
+Article responses are otherwise built as pydantic models, validated again
+against the route `response_model` and encoded by FastAPI. The helpers below
+encode DTOs straight to JSON bytes, producing the same document.
+"""
+
+import datetime
+import json
+from typing import Any
+
+from starlette.responses import Response
+
+from bobverse.api.schemas.responses.article import ArticleResponse, ArticlesFeedResponse
+from bobverse.core.config import get_app_settings
+from bobverse.core.utils.date import convert_datetime_to_bobnews
+from bobverse.domain.dtos.article import ArticleDTO, ArticlesFeedDTO
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, datetime.datetime):
+        return convert_datetime_to_bobnews(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Encode content to JSON bytes, rendering naive datetimes as UTC ("Z").
+    """
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z)
+    return json.dumps(
+        content, default=_default, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+class PreEncodedJSONResponse(Response):
+    """JSON response whose content is already encoded to bytes."""
+
+    media_type = "application/json"
+
+    def render(self, content: bytes) -> bytes:
+        return content
+
+
+def article_payload(dto: ArticleDTO) -> dict[str, Any]:
+    payload = {
+        "slug": dto.slug,
+        "title": dto.title,
+        "description": dto.description,
+        "body": dto.body,
+        "tagList": dto.tags,
+        "createdAt": dto.created_at,
+        "updatedAt": dto.updated_at,
+        "favorited": dto.favorited,
+        "favoritesCount": dto.favorites_count,
+        "author": {
+            "username": dto.author.username,
+            "bio": dto.author.bio,
+            "image": dto.author.image,
+            "following": dto.author.following,
+        },
+    }
+    if dto.body is None:
+        # Listed without its body ("lite" mode): leave the key out entirely.
+        del payload["body"]
+    return payload
+
+
+def render_article(dto: ArticleDTO) -> Response | ArticleResponse:
+    if get_app_settings().fast_json_responses:
+        return PreEncodedJSONResponse(dumps({"article": article_payload(dto)}))
+    return ArticleResponse.from_dto(dto=dto)
+
+
+def render_articles_feed(dto: ArticlesFeedDTO) -> Response | ArticlesFeedResponse:
+    if get_app_settings().fast_json_responses:
+        payload = {
+            "articles": [article_payload(article) for article in dto.articles],
+            "articlesCount": dto.articles_count,
+        }
+        return PreEncodedJSONResponse(dumps(payload))
+    return ArticlesFeedResponse.from_dto(dto=dto)
@@ -1,18 +1,35 @@
+import datetime
+from collections.abc import AsyncIterator
+
 from fastapi import APIRouter
 from fastapi.params import Query
+from fastapi.responses import Response, StreamingResponse
 from starlette import status
 
+from bobverse.api.responses import (
+    article_payload,
+    dumps,
+    render_article,
+    render_articles_feed,
+)
 from bobverse.api.schemas.requests.article import (
     DEFAULT_ARTICLES_LIMIT,
     DEFAULT_ARTICLES_OFFSET,
+    DEFAULT_SEARCH_LIMIT,
+    MAX_SEARCH_LIMIT,
     CreateArticleRequest,
     UpdateArticleRequest,
 )
-from bobverse.api.schemas.responses.article import ArticleResponse, ArticlesFeedResponse
+from bobverse.api.schemas.responses.article import (
+    ArticleResponse,
+    ArticlesFeedResponse,
+    ArticlesSearchResponse,
+)
 from bobverse.core.dependencies import (
     CurrentOptionalUser,
     CurrentUser,
     DBSession,
+    DBSessionFactory,
     IArticleService,
     QueryFilters,
 )
@@ -20,30 +37,84 @@ from bobverse.core.dependencies import (
 router = APIRouter()
 
 
-@router.get("/feed", response_model=ArticlesFeedResponse)
+@router.get(
+    "/feed", response_model=ArticlesFeedResponse, response_model_exclude_unset=True
+)
 async def get_article_feed(
     session: DBSession,
     current_user: CurrentUser,
     article_service: IArticleService,
     limit: int = Query(DEFAULT_ARTICLES_LIMIT, ge=1),
     offset: int = Query(DEFAULT_ARTICLES_OFFSET, ge=0),
-) -> ArticlesFeedResponse:
+    lite: bool = Query(False, description="Leave article bodies out of the list."),
+) -> ArticlesFeedResponse | Response:
     """
     Get article feed from following users.
     """
     articles_feed_dto = await article_service.get_articles_feed_v2(
-        session=session, current_user=current_user, limit=limit, offset=offset
+        session=session,
+        current_user=current_user,
+        limit=limit,
+        offset=offset,
+        include_body=not lite,
+    )
+    return render_articles_feed(dto=articles_feed_dto)
+
+
+@router.get("/search", response_model=ArticlesSearchResponse)
+async def search_articles(
+    session: DBSession,
+    current_user: CurrentOptionalUser,
+    article_service: IArticleService,
+    q: str = Query(..., min_length=1),
+    limit: int = Query(DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT),
+    cursor: str | None = Query(None),
+) -> ArticlesSearchResponse:
+    """
+    Full-text search over article titles, descriptions and bodies.
+    """
+    articles_search_dto = await article_service.search_articles(
+        session=session, current_user=current_user, query=q, limit=limit, cursor=cursor
     )
-    return ArticlesFeedResponse.from_dto(dto=articles_feed_dto)
+    return ArticlesSearchResponse.from_dto(dto=articles_search_dto)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_articles(
+    session_factory: DBSessionFactory,
+    current_user: CurrentOptionalUser,
+    article_service: IArticleService,
+    tag: str | None = None,
+    author: str | None = None,
+    favorited: str | None = None,
+    since: datetime.datetime | None = None,
+) -> StreamingResponse:
+    """
+    Stream all matching articles as newline-delimited JSON, oldest change first.
+    """
+
+    async def export_lines() -> AsyncIterator[bytes]:
+        async with session_factory() as session:
+            async for article_dto in article_service.export_articles(
+                session=session,
+                current_user=current_user,
+                tag=tag,
+                author=author,
+                favorited=favorited,
+                since=since,
+            ):
+                yield dumps(article_payload(dto=article_dto)) + b"\n"
+
+    return StreamingResponse(export_lines(), media_type="application/x-ndjson")
 
 
-@router.get("", response_model=ArticlesFeedResponse)
+@router.get("", response_model=ArticlesFeedResponse, response_model_exclude_unset=True)
 async def get_global_article_feed(
     articles_filters: QueryFilters,
     session: DBSession,
     current_user: CurrentOptionalUser,
     article_service: IArticleService,
-) -> ArticlesFeedResponse:
+) -> ArticlesFeedResponse | Response:
     """
     Get global article feed.
     """
@@ -55,8 +126,9 @@ async def get_global_article_feed(
         favorited=articles_filters.favorited,
         limit=articles_filters.limit,
         offset=articles_filters.offset,
+        include_body=not articles_filters.lite,
     )
-    return ArticlesFeedResponse.from_dto(dto=articles_feed_dto)
+    return render_articles_feed(dto=articles_feed_dto)
 
 
 @router.get("/{slug}", response_model=ArticleResponse)
@@ -65,14 +137,14 @@ async def get_article(
     session: DBSession,
     current_user: CurrentOptionalUser,
     article_service: IArticleService,
-) -> ArticleResponse:
+) -> ArticleResponse | Response:
     """
     Get new article by slug.
     """
     article_dto = await article_service.get_article_by_slug(
         session=session, slug=slug, current_user=current_user
     )
-    return ArticleResponse.from_dto(dto=article_dto)
+    return render_article(dto=article_dto)
 
 
 @router.post("", response_model=ArticleResponse)
@@ -81,14 +153,14 @@ async def create_article(
     session: DBSession,
     current_user: CurrentUser,
     article_service: IArticleService,
-) -> ArticleResponse:
+) -> ArticleResponse | Response:
     """
     Create new article.
     """
     article_dto = await article_service.create_new_article(
         session=session, author_id=current_user.id, article_to_create=payload.to_dto()
     )
-    return ArticleResponse.from_dto(dto=article_dto)
+    return render_article(dto=article_dto)
 
 
 @router.put("/{slug}", response_model=ArticleResponse)
@@ -98,7 +170,7 @@ async def update_article(
     session: DBSession,
     current_user: CurrentUser,
     article_service: IArticleService,
-) -> ArticleResponse:
+) -> ArticleResponse | Response:
     """
     Update an article.
     """
@@ -108,7 +180,7 @@ async def update_article(
         article_to_update=payload.to_dto(),
         current_user=current_user,
     )
-    return ArticleResponse.from_dto(dto=article_dto)
+    return render_article(dto=article_dto)
 
 
 @router.delete("/{slug}", status_code=status.HTTP_204_NO_CONTENT)
@@ -132,14 +204,14 @@ async def favorite_article(
     session: DBSession,
     current_user: CurrentUser,
     article_service: IArticleService,
-) -> ArticleResponse:
+) -> ArticleResponse | Response:
     """
     Favorite an article.
     """
     article_dto = await article_service.add_article_into_favorites(
         session=session, slug=slug, current_user=current_user
     )
-    return ArticleResponse.from_dto(dto=article_dto)
+    return render_article(dto=article_dto)
 
 
 # CWE-22: Path Traversal
@@ -183,11 +255,11 @@ async def unfavorite_article(
     session: DBSession,
     current_user: CurrentUser,
     article_service: IArticleService,
-) -> ArticleResponse:
+) -> ArticleResponse | Response:
     """
     Unfavorite an article.
     """
     article_dto = await article_service.remove_article_from_favorites(
         session=session, slug=slug, current_user=current_user
     )
-    return ArticleResponse.from_dto(dto=article_dto)
+    return render_article(dto=article_dto)
@@ -1,7 +1,11 @@
-from fastapi import APIRouter, Path
+from fastapi import APIRouter, Path, Query
 from starlette import status
 
-from bobverse.api.schemas.requests.comment import CreateCommentRequest
+from bobverse.api.schemas.requests.comment import (
+    DEFAULT_COMMENTS_LIMIT,
+    MAX_COMMENTS_LIMIT,
+    CreateCommentRequest,
+)
 from bobverse.api.schemas.responses.comment import CommentResponse, CommentsListResponse
 from bobverse.core.dependencies import (
     CurrentOptionalUser,
@@ -19,12 +23,18 @@ async def get_comments(
     session: DBSession,
     current_user: CurrentOptionalUser,
     comment_service: ICommentService,
+    limit: int = Query(DEFAULT_COMMENTS_LIMIT, ge=1, le=MAX_COMMENTS_LIMIT),
+    cursor: str | None = Query(None),
 ) -> CommentsListResponse:
     """
-    Get comments for an article.
+    Get comments for an article, oldest first.
     """
     comment_list_dto = await comment_service.get_article_comments(
-        session=session, slug=slug, current_user=current_user
+        session=session,
+        slug=slug,
+        current_user=current_user,
+        limit=limit,
+        cursor=cursor,
     )
     return CommentsListResponse.from_dto(dto=comment_list_dto)
 
@@ -1,6 +1,15 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 
-from bobverse.api.schemas.responses.profile import ProfileResponse
+from bobverse.api.schemas.requests.profile import (
+    DEFAULT_PROFILES_SEARCH_LIMIT,
+    MAX_PROFILES_SEARCH_LIMIT,
+    BulkFollowRequest,
+)
+from bobverse.api.schemas.responses.profile import (
+    BulkFollowResponse,
+    ProfileResponse,
+    ProfilesListResponse,
+)
 from bobverse.core.dependencies import (
     CurrentOptionalUser,
     CurrentUser,
@@ -11,6 +20,58 @@ from bobverse.core.dependencies import (
 router = APIRouter()
 
 
+@router.get("/search", response_model=ProfilesListResponse)
+async def search_profiles(
+    session: DBSession,
+    current_user: CurrentOptionalUser,
+    profile_service: IProfileService,
+    q: str = Query(..., min_length=1),
+    limit: int = Query(
+        DEFAULT_PROFILES_SEARCH_LIMIT, ge=1, le=MAX_PROFILES_SEARCH_LIMIT
+    ),
+    cursor: str | None = Query(None),
+) -> ProfilesListResponse:
+    """
+    Search profiles by username or email prefix.
+    """
+    profiles_dto = await profile_service.search_profiles(
+        session=session, query=q, limit=limit, current_user=current_user, cursor=cursor
+    )
+    return ProfilesListResponse.from_dto(dto=profiles_dto)
+
+
+@router.post("/follow", response_model=BulkFollowResponse)
+async def follow_usernames(
+    payload: BulkFollowRequest,
+    session: DBSession,
+    current_user: CurrentUser,
+    profile_service: IProfileService,
+) -> BulkFollowResponse:
+    """
+    Follow many profiles at once, with a result per username.
+    """
+    results = await profile_service.follow_users(
+        session=session, usernames=payload.usernames, current_user=current_user
+    )
+    return BulkFollowResponse.from_dtos(dtos=results)
+
+
+@router.delete("/follow", response_model=BulkFollowResponse)
+async def unfollow_usernames(
+    payload: BulkFollowRequest,
+    session: DBSession,
+    current_user: CurrentUser,
+    profile_service: IProfileService,
+) -> BulkFollowResponse:
+    """
+    Unfollow many profiles at once, with a result per username.
+    """
+    results = await profile_service.unfollow_users(
+        session=session, usernames=payload.usernames, current_user=current_user
+    )
+    return BulkFollowResponse.from_dtos(dtos=results)
+
+
 @router.get("/{username}", response_model=ProfileResponse)
 async def get_user_profile(
     username: str,
@@ -37,10 +98,7 @@ async def follow_username(
     """
     Follow profile with specific username.
     """
-    await profile_service.follow_user(
-        session=session, username=username, current_user=current_user
-    )
-    profile_dto = await profile_service.get_profile_by_username(
+    profile_dto = await profile_service.follow_user(
         session=session, username=username, current_user=current_user
     )
     return ProfileResponse.from_dto(dto=profile_dto)
@@ -56,10 +114,7 @@ async def unfollow_username(
     """
     Unfollow profile with specific username
     """
-    await profile_service.unfollow_user(
-        session=session, username=username, current_user=current_user
-    )
-    profile_dto = await profile_service.get_profile_by_username(
+    profile_dto = await profile_service.unfollow_user(
         session=session, username=username, current_user=current_user
     )
     return ProfileResponse.from_dto(dto=profile_dto)
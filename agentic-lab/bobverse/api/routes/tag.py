@@ -1,5 +1,9 @@
+from typing import Literal
+
 from fastapi import APIRouter
+from fastapi.params import Query
 
+from bobverse.api.schemas.requests.tag import DEFAULT_POPULAR_TAGS_LIMIT, MAX_TAGS_LIMIT
 from bobverse.api.schemas.responses.tag import TagsResponse
 from bobverse.core.dependencies import DBSession, ITagService
 
@@ -7,9 +11,21 @@ router = APIRouter()
 
 
 @router.get("", response_model=TagsResponse)
-async def get_all_tags(session: DBSession, tag_service: ITagService) -> TagsResponse:
+async def get_all_tags(
+    session: DBSession,
+    tag_service: ITagService,
+    limit: int | None = Query(None, ge=1, le=MAX_TAGS_LIMIT),
+    order: Literal["popular"] | None = Query(
+        None, description="List the tags of the most articles first."
+    ),
+) -> TagsResponse:
     """
-    Return available all tags.
+    Return available all tags, or the most used ones.
     """
-    tags = await tag_service.get_all_tags(session=session)
+    if order == "popular":
+        tags = await tag_service.get_popular_tags(
+            session=session, limit=limit or DEFAULT_POPULAR_TAGS_LIMIT
+        )
+    else:
+        tags = await tag_service.get_all_tags(session=session, limit=limit)
     return TagsResponse.from_dtos(dtos=tags)
@@ -4,6 +4,8 @@ from bobverse.domain.dtos.article import CreateArticleDTO, UpdateArticleDTO
 
 DEFAULT_ARTICLES_LIMIT = 20
 DEFAULT_ARTICLES_OFFSET = 0
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
 
 
 class ArticlesFilters(BaseModel):
@@ -12,6 +14,7 @@ class ArticlesFilters(BaseModel):
     favorited: str | None = None
     limit: int = Field(DEFAULT_ARTICLES_LIMIT, ge=1)
     offset: int = Field(DEFAULT_ARTICLES_OFFSET, ge=0)
+    lite: bool = False
 
 
 class CreateArticleData(BaseModel):
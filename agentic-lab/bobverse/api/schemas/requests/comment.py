@@ -2,6 +2,9 @@ from pydantic import BaseModel
 
 from bobverse.domain.dtos.comment import CreateCommentDTO
 
+DEFAULT_COMMENTS_LIMIT = 20
+MAX_COMMENTS_LIMIT = 100
+
 
 class CreateCommentData(BaseModel):
     body: str
@@ -0,0 +1,11 @@
+from pydantic import BaseModel, Field
+
+DEFAULT_PROFILES_SEARCH_LIMIT = 20
+MAX_PROFILES_SEARCH_LIMIT = 100
+MAX_BULK_FOLLOW_USERNAMES = 100
+
+
+class BulkFollowRequest(BaseModel):
+    usernames: list[str] = Field(
+        ..., min_length=1, max_length=MAX_BULK_FOLLOW_USERNAMES
+    )
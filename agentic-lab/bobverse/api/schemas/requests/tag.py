@@ -0,0 +1,2 @@
+DEFAULT_POPULAR_TAGS_LIMIT = 20
+MAX_TAGS_LIMIT = 100
@@ -3,7 +3,7 @@ import datetime
 from pydantic import BaseModel, ConfigDict, Field
 
 from bobverse.core.utils.date import convert_datetime_to_bobnews
-from bobverse.domain.dtos.article import ArticleDTO, ArticlesFeedDTO
+from bobverse.domain.dtos.article import ArticleDTO, ArticlesFeedDTO, ArticlesSearchDTO
 
 
 class ArticleAuthorData(BaseModel):
@@ -17,7 +17,7 @@ class ArticleData(BaseModel):
     slug: str
     title: str
     description: str
-    body: str
+    body: str | None = None
     tags: list[str] = Field(alias="tagList")
     created_at: datetime.datetime = Field(alias="createdAt")
     updated_at: datetime.datetime = Field(alias="updatedAt")
@@ -35,11 +35,14 @@ class ArticleResponse(BaseModel):
 
     @classmethod
     def from_dto(cls, dto: ArticleDTO) -> "ArticleResponse":
+        # A body-less ("lite") article leaves `body` unset, so that routes with
+        # `response_model_exclude_unset` omit it instead of sending null.
+        body = {"body": dto.body} if dto.body is not None else {}
         article = ArticleData(
             slug=dto.slug,
             title=dto.title,
             description=dto.description,
-            body=dto.body,
+            **body,
             tagList=dto.tags,
             createdAt=dto.created_at,
             updatedAt=dto.updated_at,
@@ -66,3 +69,37 @@ class ArticlesFeedResponse(BaseModel):
             for article_dto in dto.articles
         ]
         return ArticlesFeedResponse(articles=articles, articlesCount=dto.articles_count)
+
+
+class ArticleSearchHitData(ArticleData):
+    snippet: str
+
+
+class ArticlesSearchResponse(BaseModel):
+    articles: list[ArticleSearchHitData]
+    next_cursor: str | None = Field(alias="nextCursor")
+
+    @classmethod
+    def from_dto(cls, dto: ArticlesSearchDTO) -> "ArticlesSearchResponse":
+        articles = [
+            ArticleSearchHitData(
+                slug=hit.article.slug,
+                title=hit.article.title,
+                description=hit.article.description,
+                body=hit.article.body,
+                tagList=hit.article.tags,
+                createdAt=hit.article.created_at,
+                updatedAt=hit.article.updated_at,
+                favorited=hit.article.favorited,
+                favoritesCount=hit.article.favorites_count,
+                author=ArticleAuthorData(
+                    username=hit.article.author.username,
+                    bio=hit.article.author.bio,
+                    image=hit.article.author.image,
+                    following=hit.article.author.following,
+                ),
+                snippet=hit.snippet,
+            )
+            for hit in dto.hits
+        ]
+        return ArticlesSearchResponse(articles=articles, nextCursor=dto.next_cursor)
@@ -48,6 +48,7 @@ class CommentResponse(BaseModel):
 class CommentsListResponse(BaseModel):
     comments: list[CommentData]
     commentsCount: int
+    next_cursor: str | None = Field(None, alias="nextCursor")
 
     @classmethod
     def from_dto(cls, dto: CommentsListDTO) -> "CommentsListResponse":
@@ -55,4 +56,8 @@ class CommentsListResponse(BaseModel):
             CommentResponse.from_dto(dto=comment_dto).comment
             for comment_dto in dto.comments
         ]
-        return CommentsListResponse(comments=comments, commentsCount=dto.comments_count)
+        return CommentsListResponse(
+            comments=comments,
+            commentsCount=dto.comments_count,
+            nextCursor=dto.next_cursor,
+        )
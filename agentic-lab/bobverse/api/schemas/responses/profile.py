@@ -1,6 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
-from bobverse.domain.dtos.profile import ProfileDTO
+from bobverse.domain.dtos.profile import FollowResultDTO, ProfileDTO, ProfilesListDTO
 
 
 class ProfileData(BaseModel):
@@ -23,3 +23,42 @@ class ProfileResponse(BaseModel):
                 following=dto.following,
             )
         )
+
+
+class ProfilesListResponse(BaseModel):
+    profiles: list[ProfileData]
+    next_cursor: str | None = Field(alias="nextCursor")
+
+    @classmethod
+    def from_dto(cls, dto: ProfilesListDTO) -> "ProfilesListResponse":
+        profiles = [
+            ProfileResponse.from_dto(dto=profile_dto).profile
+            for profile_dto in dto.profiles
+        ]
+        return ProfilesListResponse(profiles=profiles, nextCursor=dto.next_cursor)
+
+
+class FollowResultData(BaseModel):
+    username: str
+    status: str
+    profile: ProfileData | None
+
+
+class BulkFollowResponse(BaseModel):
+    results: list[FollowResultData]
+
+    @classmethod
+    def from_dtos(cls, dtos: list[FollowResultDTO]) -> "BulkFollowResponse":
+        results = [
+            FollowResultData(
+                username=dto.username,
+                status=dto.status,
+                profile=(
+                    ProfileResponse.from_dto(dto=dto.profile).profile
+                    if dto.profile
+                    else None
+                ),
+            )
+            for dto in dtos
+        ]
+        return BulkFollowResponse(results=results)
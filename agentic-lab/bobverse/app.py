@@ -1,11 +1,29 @@
+import contextlib
+from collections.abc import AsyncIterator
+
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
-from bobverse.api.middlewares import RateLimitingMiddleware
+from bobverse.api.middlewares import (
+    CompressionMiddleware,
+    MetricsMiddleware,
+    ProfilingMiddleware,
+    QueryStatsMiddleware,
+    RateLimitingMiddleware,
+)
 from bobverse.api.router import router as api_router
 from bobverse.core.config import get_app_settings
+from bobverse.core.container import container
 from bobverse.core.exceptions import add_exception_handlers
 from bobverse.core.logging import configure_logger
+from bobverse.core.settings.base import AppEnvTypes
+
+
+@contextlib.asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Write what is still buffered (e.g. favorites) before the process exits.
+    await container.close()
 
 
 def create_app() -> FastAPI:
@@ -14,7 +32,7 @@ def create_app() -> FastAPI:
     """
     settings = get_app_settings()
 
-    application = FastAPI(**settings.fastapi_kwargs)
+    application = FastAPI(**settings.fastapi_kwargs, lifespan=lifespan)
 
     application.add_middleware(
         CORSMiddleware,
@@ -23,7 +41,25 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
-    application.add_middleware(RateLimitingMiddleware)
+    application.add_middleware(
+        RateLimitingMiddleware, rate_limit_requests=settings.rate_limit_requests
+    )
+    if settings.app_env != AppEnvTypes.production:
+        application.add_middleware(QueryStatsMiddleware)
+    application.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        cache_max_bytes=settings.compression_cache_max_bytes,
+    )
+    application.add_middleware(MetricsMiddleware)
+    if settings.profiling_dir:
+        application.add_middleware(
+            ProfilingMiddleware,
+            directory=settings.profiling_dir,
+            sample_rate=settings.profiling_sample_rate,
+            token=settings.profiling_token,
+            interval=settings.profiling_interval_ms / 1000,
+        )
 
     application.include_router(api_router, prefix="/api")
 
@@ -1,7 +1,12 @@
 import contextlib
 from collections.abc import AsyncIterator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from bobverse.core.config import get_app_settings
 from bobverse.core.settings.base import BaseAppSettings
@@ -10,8 +15,10 @@ from bobverse.domain.repositories.article import IArticleRepository
 from bobverse.domain.repositories.article_tag import IArticleTagRepository
 from bobverse.domain.repositories.comment import ICommentRepository
 from bobverse.domain.repositories.favorite import IFavoriteRepository
+from bobverse.domain.repositories.favorite_buffer import IFavoriteBuffer
 from bobverse.domain.repositories.follower import IFollowerRepository
 from bobverse.domain.repositories.tag import ITagRepository
+from bobverse.domain.repositories.timeline import ITimelineRepository
 from bobverse.domain.repositories.user import IUserRepository
 from bobverse.domain.services.article import IArticleService
 from bobverse.domain.services.auth import IUserAuthService
@@ -20,17 +27,27 @@ from bobverse.domain.services.comment import ICommentService
 from bobverse.domain.services.profile import IProfileService
 from bobverse.domain.services.tag import ITagService
 from bobverse.domain.services.user import IUserService
+from bobverse.infrastructure.favorite_buffer import FavoriteBuffer
+from bobverse.infrastructure.follower_graph import FollowerGraph
 from bobverse.infrastructure.mappers.article import ArticleModelMapper
 from bobverse.infrastructure.mappers.comment import CommentModelMapper
 from bobverse.infrastructure.mappers.tag import TagModelMapper
 from bobverse.infrastructure.mappers.user import UserModelMapper
+from bobverse.infrastructure.pool_metrics import install_pool_metrics
+from bobverse.infrastructure.popular_tags import PopularTags
+from bobverse.infrastructure.query_stats import install_query_hooks
 from bobverse.infrastructure.repositories.article import ArticleRepository
 from bobverse.infrastructure.repositories.article_tag import ArticleTagRepository
 from bobverse.infrastructure.repositories.comment import CommentRepository
 from bobverse.infrastructure.repositories.favorite import FavoriteRepository
-from bobverse.infrastructure.repositories.follower import FollowerRepository
+from bobverse.infrastructure.repositories.follower import (
+    CachedFollowerRepository,
+    FollowerRepository,
+)
 from bobverse.infrastructure.repositories.tag import TagRepository
+from bobverse.infrastructure.repositories.timeline import TimelineRepository
 from bobverse.infrastructure.repositories.user import UserRepository
+from bobverse.infrastructure.tag_ids import TagIds
 from bobverse.services.article import ArticleService
 from bobverse.services.auth import UserAuthService
 from bobverse.services.auth_token import AuthTokenService
@@ -46,7 +63,45 @@ class Container:
     def __init__(self, settings: BaseAppSettings) -> None:
         self._settings = settings
         self._engine = create_async_engine(**settings.sqlalchemy_engine_props)
+        install_query_hooks(
+            engine=self._engine,
+            slow_query_threshold_ms=settings.slow_query_threshold_ms,
+        )
+        install_pool_metrics(engine=self._engine)
+        # Shared by every request served by this process.
+        self._follower_graph = (
+            FollowerGraph(sync_interval=settings.follower_cache_sync_interval)
+            if settings.follower_cache_enabled
+            else None
+        )
+        self._popular_tags = (
+            PopularTags(refresh_interval=settings.popular_tags_refresh_interval)
+            if settings.popular_tags_cache_enabled
+            else None
+        )
+        self._tag_ids = (
+            TagIds(max_size=settings.tag_id_cache_size)
+            if settings.tag_id_cache_size
+            else None
+        )
         self._session = async_sessionmaker(bind=self._engine, expire_on_commit=False)
+        self._favorite_buffer = (
+            FavoriteBuffer(
+                session_factory=self.context_session,
+                flush_interval=settings.favorites_flush_interval_ms / 1000,
+            )
+            if settings.favorites_write_behind_enabled
+            else None
+        )
+
+    @property
+    def engine(self) -> AsyncEngine:
+        return self._engine
+
+    async def close(self) -> None:
+        """Write what is still buffered, on shutdown."""
+        if self._favorite_buffer is not None:
+            await self._favorite_buffer.close()
 
     @contextlib.asynccontextmanager
     async def context_session(self) -> AsyncIterator[AsyncSession]:
@@ -90,18 +145,25 @@ class Container:
     def user_repository(self) -> IUserRepository:
         return UserRepository(user_mapper=self.user_model_mapper())
 
-    @staticmethod
-    def follower_repository() -> IFollowerRepository:
+    def follower_repository(self) -> IFollowerRepository:
+        if self._follower_graph is not None:
+            return CachedFollowerRepository(graph=self._follower_graph)
         return FollowerRepository()
 
     def tags_repository(self) -> ITagRepository:
-        return TagRepository(tag_mapper=self.tag_model_mapper())
+        return TagRepository(
+            tag_mapper=self.tag_model_mapper(), popular_tags=self._popular_tags
+        )
 
     def article_repository(self) -> IArticleRepository:
         return ArticleRepository(article_mapper=self.article_model_mapper())
 
     def article_tag_repository(self) -> IArticleTagRepository:
-        return ArticleTagRepository(tag_mapper=self.tag_model_mapper())
+        return ArticleTagRepository(
+            tag_mapper=self.tag_model_mapper(),
+            popular_tags=self._popular_tags,
+            tag_ids=self._tag_ids,
+        )
 
     def comment_repository(self) -> ICommentRepository:
         return CommentRepository(comment_mapper=self.comment_model_mapper())
@@ -110,6 +172,12 @@ class Container:
     def favorite_repository() -> IFavoriteRepository:
         return FavoriteRepository()
 
+    def timeline_repository(self) -> ITimelineRepository | None:
+        return TimelineRepository() if self._settings.timeline_enabled else None
+
+    def favorite_buffer(self) -> IFavoriteBuffer | None:
+        return self._favorite_buffer
+
     def auth_token_service(self) -> IAuthTokenService:
         return AuthTokenService(
             secret_key=self._settings.jwt_secret_key,
@@ -128,7 +196,10 @@ class Container:
 
     def profile_service(self) -> IProfileService:
         return ProfileService(
-            user_service=self.user_service(), follower_repo=self.follower_repository()
+            user_service=self.user_service(),
+            follower_repo=self.follower_repository(),
+            timeline_repo=self.timeline_repository(),
+            timeline_backfill_limit=self._settings.timeline_backfill_limit,
         )
 
     def tag_service(self) -> ITagService:
@@ -140,14 +211,13 @@ class Container:
             article_tag_repo=self.article_tag_repository(),
             favorite_repo=self.favorite_repository(),
             profile_service=self.profile_service(),
+            timeline_repo=self.timeline_repository(),
+            timeline_celebrity_threshold=self._settings.timeline_celebrity_threshold,
+            favorite_buffer=self.favorite_buffer(),
         )
 
     def comment_service(self) -> ICommentService:
-        return CommentService(
-            article_repo=self.article_repository(),
-            comment_repo=self.comment_repository(),
-            profile_service=self.profile_service(),
-        )
+        return CommentService(comment_repo=self.comment_repository())
 
 
 container = Container(settings=get_app_settings())
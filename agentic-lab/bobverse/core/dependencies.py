@@ -1,3 +1,5 @@
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
 from typing import Annotated
 
 from fastapi import Depends, Query
@@ -37,6 +39,17 @@ JWTTokenOptional = Annotated[str, Depends(token_security_optional)]
 
 DBSession = Annotated[AsyncSession, Depends(container.session)]
 
+
+def get_session_factory() -> Callable[[], AbstractAsyncContextManager[AsyncSession]]:
+    # For responses streamed after the request-scoped session has been closed.
+    return container.context_session
+
+
+DBSessionFactory = Annotated[
+    Callable[[], AbstractAsyncContextManager[AsyncSession]],
+    Depends(get_session_factory),
+]
+
 IAuthTokenService = Annotated[AuthTokenService, Depends(container.auth_token_service)]
 IUserAuthService = Annotated[UserAuthService, Depends(container.user_auth_service)]
 IUserService = Annotated[UserService, Depends(container.user_service)]
@@ -52,9 +65,15 @@ def get_articles_filters(
     favorited: str | None = None,
     limit: int = Query(DEFAULT_ARTICLES_LIMIT, ge=1),
     offset: int = Query(DEFAULT_ARTICLES_OFFSET, ge=0),
+    lite: bool = Query(False, description="Leave article bodies out of the list."),
 ) -> ArticlesFilters:
     return ArticlesFilters(
-        tag=tag, author=author, favorited=favorited, limit=limit, offset=offset
+        tag=tag,
+        author=author,
+        favorited=favorited,
+        limit=limit,
+        offset=offset,
+        lite=lite,
     )
 
 
@@ -56,20 +56,6 @@ class ArticleNotFoundException(BaseInternalException):
     _message = "Article with this slug does not exist."
 
 
-class ArticleAlreadyFavoritedException(BaseInternalException):
-    """Exception raised when article already marked favorited."""
-
-    _status_code = 400
-    _message = "Article has already been marked as a favorite."
-
-
-class ArticleNotFavoritedException(BaseInternalException):
-    """Exception raised when article is not favorited."""
-
-    _status_code = 400
-    _message = "Article is not favorited."
-
-
 class ArticlePermissionException(BaseInternalException):
     """Exception raised when user does not have permission to access the article."""
 
@@ -147,6 +133,13 @@ class ProfileNotFollowedFollowedException(BaseInternalException):
     _message = "Profile was not followed."
 
 
+class InvalidCursorException(BaseInternalException):
+    """Exception raised when pagination cursor can not be decoded."""
+
+    _status_code = 400
+    _message = "Invalid pagination cursor."
+
+
 class RateLimitExceededException(BaseInternalException):
     """Exception raised when rate limit exceeded during specific time."""
 
@@ -1,4 +1,9 @@
+import atexit
 import logging
+import queue
+import random
+from collections.abc import Mapping
+from logging.handlers import QueueHandler, QueueListener
 
 import structlog
 from structlog.typing import EventDict, Processor
@@ -11,6 +16,20 @@ DEFAULT_LOGGER_NAME = "bobverse-api"
 
 settings = get_app_settings()
 
+# Writer thread of the currently configured queue handler.
+_listener: QueueListener | None = None
+
+
+@atexit.register
+def _stop_listener() -> None:
+    """
+    Write the log records still queued, on exit.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 
 def rename_event_key(_: logging.Logger, __: str, event_dict: EventDict) -> EventDict:
     """
@@ -32,7 +51,46 @@ def drop_color_message_key(
     return event_dict
 
 
-def configure_logger(json_logs: bool = False) -> None:
+class SamplingProcessor:
+    """
+    Keep only a share of high-volume events, by event name.
+
+    Warnings and errors are never dropped.
+
+    Example:
+        SamplingProcessor({"Profile not found": 0.1})  # keeps ~10% of them.
+    """
+
+    def __init__(self, rates: Mapping[str, float]) -> None:
+        self._rates = dict(rates)
+        self._random = random.Random()
+
+    def __call__(
+        self, _: logging.Logger, method_name: str, event_dict: EventDict
+    ) -> EventDict:
+        rate = self._rates.get(event_dict.get("event"))
+        if (
+            rate is not None
+            and method_name in ("debug", "info")
+            and self._random.random() >= rate
+        ):
+            raise structlog.DropEvent
+        return event_dict
+
+
+class _DeferredFormattingQueueHandler(QueueHandler):
+    """
+    Queue handler that hands records over unformatted, so that rendering (and
+    traceback formatting) happens on the writer thread too.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def configure_logger(json_logs: bool | None = None) -> None:
+    if json_logs is None:
+        json_logs = settings.json_logs
     timestamper = structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S")
 
     shared_processors: list[Processor] = [
@@ -54,7 +112,8 @@ def configure_logger(json_logs: bool = False) -> None:
         shared_processors.append(structlog.processors.format_exc_info)
 
     structlog.configure(
-        processors=shared_processors
+        processors=[SamplingProcessor(rates=settings.log_sampling_rates)]
+        + shared_processors
         + [structlog.stdlib.ProcessorFormatter.wrap_for_formatter],
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
@@ -86,13 +145,24 @@ def _configure_default_logging_by_custom(
     # Use structlog `ProcessorFormatter` to format all `logging` entries.
     handler.setFormatter(formatter)
 
+    # Callers only enqueue records: a background thread formats and writes
+    # them, so that log I/O never blocks the event loop.
+    global _listener
+    _stop_listener()
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+
     # Disable the `passlib` logger.
     logging.getLogger("passlib").setLevel(logging.ERROR)
     logging.getLogger("asyncio").setLevel(logging.WARNING)
 
     # Set logging level.
     root_logger = logging.getLogger()
-    root_logger.addHandler(handler)
+    for installed in root_logger.handlers[:]:
+        if isinstance(installed, _DeferredFormattingQueueHandler):
+            root_logger.removeHandler(installed)
+    root_logger.addHandler(_DeferredFormattingQueueHandler(log_queue))
     root_logger.setLevel(settings.logging_level)
 
     for _log in ["uvicorn", "uvicorn.error", "uvicorn.access"]:
@@ -0,0 +1,332 @@
+"""
+Low-overhead in-process metrics, exposed in the Prometheus text format.
+
+Samples live in plain dicts updated under a lock (uncontended on the event
+loop thread), so recording one costs a dict lookup and an addition. With
+`metrics_multiprocess_dir` set, every worker periodically writes a snapshot of
+its metrics to that directory (and a last one on exit), and `/api/metrics`
+serves their sum. Gauges of workers that are gone are left out of the sum,
+while their counters and histograms are kept, so that sums never go down.
+"""
+
+import atexit
+import bisect
+import contextlib
+import json
+import math
+import os
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any
+
+from bobverse.core.config import get_app_settings
+
+__all__ = ["MetricsRegistry", "metrics"]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# (sample name, ((label, value), ...), value)
+Sample = tuple[str, tuple[tuple[str, str], ...], float]
+
+
+class Metric:
+    type_ = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, labels: Sequence[str], lock: threading.Lock
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._lock = lock
+        self._values: dict[tuple[str, ...], Any] = {}
+
+    def _key(self, labels: dict[str, Any]) -> tuple[str, ...]:
+        return tuple(str(labels[label]) for label in self.labels)
+
+    def _label_pairs(self, key: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+        return tuple(zip(self.labels, key))
+
+    def samples(self) -> list[Sample]:
+        with self._lock:
+            return [
+                (self.name, self._label_pairs(key), value)
+                for key, value in self._values.items()
+            ]
+
+
+class Counter(Metric):
+    type_ = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(Metric):
+    """Gauge; summed over workers in multiprocess mode."""
+
+    type_ = "gauge"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    @contextlib.contextmanager
+    def track_in_progress(self, **labels: Any) -> Iterator[None]:
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+
+class Histogram(Metric):
+    type_ = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str],
+        lock: threading.Lock,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labels, lock)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            if (state := self._values.get(key)) is None:
+                # Per-bucket (not cumulative) counts, the last one for +Inf.
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    @contextlib.contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def samples(self) -> list[Sample]:
+        with self._lock:
+            values = [
+                (key, list(counts), total)
+                for key, (counts, total) in self._values.items()
+            ]
+
+        samples: list[Sample] = []
+        for key, counts, total in values:
+            label_pairs = self._label_pairs(key)
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                le = (("le", "+Inf" if bound == math.inf else repr(bound)),)
+                samples.append((f"{self.name}_bucket", label_pairs + le, cumulative))
+            samples.append((f"{self.name}_sum", label_pairs, total))
+            samples.append((f"{self.name}_count", label_pairs, cumulative))
+        return samples
+
+
+class MetricsRegistry:
+    """
+    Registry of process metrics.
+
+    Example:
+        registry = MetricsRegistry()
+        requests = registry.counter("requests_total", "Requests.", labels=["path"])
+        requests.inc(path="/api/tags")
+        registry.render()
+    """
+
+    def __init__(
+        self, multiprocess_dir: str | None = None, flush_interval: float = 1.0
+    ) -> None:
+        self.multiprocess_dir = Path(multiprocess_dir) if multiprocess_dir else None
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._metrics: dict[str, Metric] = {}
+        self._flushed_at = 0.0
+        if self.multiprocess_dir is not None:
+            atexit.register(self.flush)
+
+    def _register(self, metric: Metric) -> Any:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered.")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labels: Sequence[str] = ()
+    ) -> Counter:
+        return self._register(Counter(name, documentation, labels, self._lock))
+
+    def gauge(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labels, self._lock))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(
+            Histogram(name, documentation, labels, self._lock, buckets=buckets)
+        )
+
+    def collect(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "name": metric.name,
+                "type": metric.type_,
+                "help": metric.documentation,
+                "samples": metric.samples(),
+            }
+            for metric in self._metrics.values()
+        ]
+
+    def flush(self) -> None:
+        """
+        Write this worker's snapshot into the multiprocess directory.
+        """
+        if self.multiprocess_dir is None:
+            return
+        self.multiprocess_dir.mkdir(parents=True, exist_ok=True)
+        path = self.multiprocess_dir / f"{os.getpid()}.json"
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.collect()))
+        # Readers never see a partially written snapshot.
+        os.replace(tmp_path, path)
+        self._flushed_at = time.monotonic()
+
+    def maybe_flush(self) -> None:
+        if (
+            self.multiprocess_dir is not None
+            and time.monotonic() - self._flushed_at >= self.flush_interval
+        ):
+            self.flush()
+
+    def _collect_all_workers(self, directory: Path) -> list[dict[str, Any]]:
+        self.flush()
+        families: dict[str, dict[str, Any]] = {}
+        for path in sorted(directory.glob("*.json")):
+            try:
+                snapshot = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+            alive = _is_alive(path.stem)
+            for family in snapshot:
+                # Requests in flight, connections in use, ... died with the worker.
+                if family["type"] == "gauge" and not alive:
+                    continue
+                merged = families.setdefault(family["name"], {**family, "samples": {}})
+                for name, labels, value in family["samples"]:
+                    key = (name, tuple(map(tuple, labels)))
+                    merged["samples"][key] = merged["samples"].get(key, 0.0) + value
+
+        return [
+            {
+                **family,
+                "samples": [
+                    (name, labels, value)
+                    for (name, labels), value in family["samples"].items()
+                ],
+            }
+            for family in families.values()
+        ]
+
+    def render(self) -> str:
+        """
+        Render all metrics (of all workers in multiprocess mode) in the
+        Prometheus text exposition format.
+        """
+        families = (
+            self._collect_all_workers(self.multiprocess_dir)
+            if self.multiprocess_dir is not None
+            else self.collect()
+        )
+        lines = []
+        for family in families:
+            lines.append(f"# HELP {family['name']} {family['help']}")
+            lines.append(f"# TYPE {family['name']} {family['type']}")
+            for name, labels, value in family["samples"]:
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _is_alive(pid: str) -> bool:
+    """Whether the worker of a snapshot (named after its pid) is running."""
+    try:
+        os.kill(int(pid), 0)
+    except (ValueError, ProcessLookupError):
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _format_labels(labels: Sequence[tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (name, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in labels
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+metrics = MetricsRegistry(multiprocess_dir=get_app_settings().metrics_multiprocess_dir)
+
+HTTP_REQUEST_DURATION = metrics.histogram(
+    "bobverse_http_request_duration_seconds",
+    "HTTP request latency by route.",
+    labels=["method", "route", "status"],
+)
+HTTP_REQUESTS_IN_FLIGHT = metrics.gauge(
+    "bobverse_http_requests_in_flight", "HTTP requests being served."
+)
+RATE_LIMIT_REJECTIONS = metrics.counter(
+    "bobverse_rate_limit_rejections_total", "Requests rejected by the rate limiter."
+)
+DB_POOL_CHECKOUT_DURATION = metrics.histogram(
+    "bobverse_db_pool_checkout_seconds",
+    "Time spent waiting for a database connection.",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+DB_POOL_CHECKED_OUT = metrics.gauge(
+    "bobverse_db_pool_checked_out", "Database connections in use."
+)
+DB_POOL_SIZE = metrics.gauge(
+    "bobverse_db_pool_size", "Database connections held open by the pool."
+)
+PASSWORD_HASH_DURATION = metrics.histogram(
+    "bobverse_password_hash_seconds",
+    "Time spent hashing or verifying passwords with bcrypt.",
+    labels=["operation"],
+)
+PASSWORD_HASHES_IN_PROGRESS = metrics.gauge(
+    "bobverse_password_hashes_in_progress",
+    "Password hash computations running or waiting for the CPU.",
+)
@@ -0,0 +1,120 @@
+"""
+Wall-clock stack sampling of single requests.
+
+Profiles are written as collapsed stacks (one `frame;frame;frame count` line
+per distinct stack), which flamegraph.pl and speedscope read directly.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+from collections import Counter
+from contextvars import ContextVar
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+__all__ = ["RequestSampler"]
+
+_profiled_request: ContextVar["RequestSampler | None"] = ContextVar(
+    "profiled_request", default=None
+)
+
+
+class RequestSampler:
+    """
+    Sample the stacks of one request from a background thread.
+
+    The request's tasks are recognised by the context they inherit from the
+    task that started the sampler. While one of them runs, the event loop
+    thread's stack is sampled. While they are all suspended (e.g. waiting for
+    the database), the await chain of the last one seen running is sampled
+    instead, so that waiting time is attributed as well.
+
+    Example:
+        with RequestSampler(path=Path("profiles/request.collapsed")):
+            await handle_request()
+    """
+
+    def __init__(self, path: Path, interval: float = 0.005) -> None:
+        self.path = path
+        self.interval = interval
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_task = asyncio.current_task()
+        self._stacks: Counter[str] = Counter()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="request-sampler", daemon=True
+        )
+
+    def __enter__(self) -> "RequestSampler":
+        self._token = _profiled_request.set(self)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        _profiled_request.reset(self._token)
+        # The sampler thread writes the profile itself, off the event loop.
+        self._stopped.set()
+
+    def join(self, timeout: float | None = None) -> None:
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            if stack := self._sample():
+                self._stacks[stack] += 1
+        self._write()
+
+    def _sample(self) -> str | None:
+        task = asyncio.current_task(self._loop)
+        if task is not None and task.get_context().get(_profiled_request) is self:
+            self._last_task = task
+            frame = sys._current_frames().get(self._loop_thread_id)
+            return _collapse(_running_frames(frame))
+        if self._last_task is not None and not self._last_task.done():
+            return _collapse(_awaiting_frames(self._last_task.get_coro()))
+        return None
+
+    def _write(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with tmp_path.open("w") as file:
+            for stack, count in self._stacks.most_common():
+                file.write(f"{stack} {count}\n")
+        os.replace(tmp_path, self.path)
+
+
+def _running_frames(frame: FrameType | None) -> list[FrameType]:
+    frames = []
+    while frame is not None:
+        # Everything above the callback the event loop runs is loop machinery.
+        if frame.f_code is _HANDLE_RUN_CODE:
+            break
+        frames.append(frame)
+        frame = frame.f_back
+    return frames[::-1]
+
+
+def _awaiting_frames(coro: Any) -> list[FrameType]:
+    frames = []
+    while coro is not None:
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None)
+        if frame is None:
+            break
+        frames.append(frame)
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+    return frames
+
+
+def _collapse(frames: list[FrameType]) -> str:
+    return ";".join(
+        f"{frame.f_code.co_qualname} "
+        f"({os.path.basename(frame.f_code.co_filename)}:{frame.f_code.co_firstlineno})"
+        for frame in frames
+    )
+
+
+_HANDLE_RUN_CODE = asyncio.Handle._run.__code__
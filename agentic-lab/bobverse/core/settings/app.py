@@ -25,6 +25,37 @@ class AppSettings(BaseAppSettings):
     allowed_hosts: list[str] = ["*"]
 
     logging_level: int = logging.INFO
+    json_logs: bool = False
+    # Share of debug/info events kept, by event name, for high-volume events.
+    log_sampling_rates: dict[str, float] = {
+        "Profile not found": 0.1,
+        "User not followed": 0.1,
+    }
+
+    # Requests allowed per client IP and minute.
+    rate_limit_requests: int = 100
+
+    # Encode article responses straight from DTOs (with orjson when installed)
+    # instead of building and re-validating pydantic response models.
+    fast_json_responses: bool = True
+
+    # Responses smaller than this are not worth compressing.
+    compression_minimum_size: int = 1024
+    # Memory budget for compressed bodies of complete (non-streamed) responses.
+    compression_cache_max_bytes: int = 16 * 1024 * 1024
+
+    # Shared directory where every worker writes its metrics, so that
+    # `/api/metrics` reports all workers; unset for a single process.
+    metrics_multiprocess_dir: str | None = None
+
+    # Per-request stack sampling profiles are written into this directory;
+    # profiling is disabled entirely while it is unset.
+    profiling_dir: str | None = None
+    # Share of requests profiled at random.
+    profiling_sample_rate: float = 0.0
+    # Requests sent with `X-Profile: <token>` are always profiled.
+    profiling_token: str | None = None
+    profiling_interval_ms: float = 5.0
 
     class Config:
         validate_assignment = True
@@ -21,6 +21,40 @@ class BaseAppSettings(BaseSettings):
     app_env: str = AppEnvTypes.production
 
     sqlite_db_path: str = "sqlite+aiosqlite:///bobverse.db"
+    # Statements running at least this long are logged as slow queries.
+    slow_query_threshold_ms: float = 100.0
+
+    # Materialize home feeds in the `timeline` table as articles are published
+    # (fan-out on write), instead of assembling them from all followed authors
+    # on every read. Run `rebuild_timelines.py` when turning it on for an
+    # existing database.
+    timeline_enabled: bool = False
+    # Articles of authors with more followers than this are not fanned out, but
+    # merged into their followers' feeds when read.
+    timeline_celebrity_threshold: int = 10_000
+    # Latest articles of an author added to a new follower's timeline.
+    timeline_backfill_limit: int = 100
+
+    # Answer "is following" checks from an in-memory copy of the follower graph.
+    follower_cache_enabled: bool = False
+    # Seconds a worker may go without picking up other workers' follows.
+    follower_cache_sync_interval: float = 1.0
+
+    # Buffer favorites in memory and write them in batches (write-behind), for
+    # articles favorited by many users at once. Favorites a worker has not
+    # written yet are lost if it dies (they are written on shutdown).
+    favorites_write_behind_enabled: bool = False
+    # Milliseconds a favorite may stay buffered before it is written.
+    favorites_flush_interval_ms: float = 5.0
+
+    # Serve the most used tags from an in-memory snapshot.
+    popular_tags_cache_enabled: bool = False
+    # Seconds a worker may go without picking up other workers' tag counts.
+    popular_tags_refresh_interval: float = 60.0
+
+    # Tag ids remembered per worker, so that tagging articles with known tags
+    # skips the tag upsert (0 disables).
+    tag_id_cache_size: int = 10_000
 
     jwt_secret_key: str
     jwt_token_expiration_minutes: int = 60 * 24 * 7  # one week.
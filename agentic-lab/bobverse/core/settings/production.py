@@ -6,5 +6,7 @@ class ProdAppSettings(AppSettings):
     Production application settings.
     """
 
+    json_logs: bool = True
+
     class Config(AppSettings.Config):
         env_file = ".env"
@@ -17,6 +17,12 @@ class TestAppSettings(AppSettings):
 
     logging_level: int = logging.WARNING
 
+    # The whole suite talks to a single application from a single client IP.
+    rate_limit_requests: int = 10_000
+
+    # Every test starts from an empty database, where cached tag ids are wrong.
+    tag_id_cache_size: int = 0
+
     class Config(AppSettings.Config):
         env_file = ".env.test"
 
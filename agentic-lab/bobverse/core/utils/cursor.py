@@ -0,0 +1,37 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+from bobverse.core.exceptions import InvalidCursorException
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode keyset pagination values into an opaque cursor.
+
+    Example:
+        encode_cursor(-1.5, 42)
+        "Wy0xLjUsNDJd"
+    """
+    payload = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """
+    Decode an opaque cursor back into its keyset pagination values.
+
+    Example:
+        decode_cursor("Wy0xLjUsNDJd", size=2)
+        [-1.5, 42]
+    """
+    padding = "=" * (-len(cursor) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + padding))
+    except (binascii.Error, ValueError):
+        raise InvalidCursorException()
+
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorException()
+    return values
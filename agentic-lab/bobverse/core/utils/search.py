@@ -0,0 +1,55 @@
+import string
+import sys
+
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+_SURROGATES_START, _SURROGATES_END = 0xD800, 0xDFFF
+
+
+def make_fts_query(text: str) -> str:
+    """
+    Convert free text into a safe FTS5 query.
+
+    Every term is quoted so that FTS5 operators in the input are matched literally,
+    and the last term is prefix-matched to support search-as-you-type.
+
+    Example:
+        make_fts_query("custom mod")
+        '"custom" "mod"*'
+    """
+    phrases = ['"{}"'.format(term.replace('"', '""')) for term in text.split()]
+    if phrases:
+        phrases[-1] += "*"
+    return " ".join(phrases)
+
+
+def lower_ascii(text: str) -> str:
+    """
+    Lower-case the ASCII letters of `text` only, the way SQLite's `lower()` does,
+    so that it compares consistently against a `lower(column)` expression.
+
+    Example:
+        lower_ascii("Élise Bob")
+        "Élise bob"
+    """
+    return text.translate(_ASCII_LOWER)
+
+
+def make_prefix_upper_bound(prefix: str) -> str | None:
+    """
+    Return the smallest string greater than every string starting with `prefix`,
+    or None if there is none (the prefix is only made of U+10FFFF).
+
+    Together with the prefix itself it forms a half-open range that an ordinary
+    B-tree index can serve, unlike `LIKE 'prefix%'`.
+
+    Example:
+        make_prefix_upper_bound("bob")
+        "boc"
+    """
+    if not (prefix := prefix.rstrip(chr(sys.maxunicode))):
+        return None
+    code_point = ord(prefix[-1]) + 1
+    if _SURROGATES_START <= code_point <= _SURROGATES_END:
+        # Skip the surrogates, which can not be stored as text.
+        code_point = _SURROGATES_END + 1
+    return prefix[:-1] + chr(code_point)
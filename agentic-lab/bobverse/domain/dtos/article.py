@@ -3,7 +3,7 @@ from dataclasses import dataclass, replace
 
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArticleRecordDTO:
     id: int
     author_id: int
@@ -13,9 +13,10 @@ class ArticleRecordDTO:
     body: str
     created_at: datetime.datetime
     updated_at: datetime.datetime
+    favorites_count: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArticleAuthorDTO:
     username: str
     bio: str = ""
@@ -24,14 +25,15 @@ class ArticleAuthorDTO:
     id: int | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArticleDTO:
     id: int
     author_id: int
     slug: str
     title: str
     description: str
-    body: str
+    # None when the article was listed without its body.
+    body: str | None
     tags: list[str]
     author: ArticleAuthorDTO
     created_at: datetime.datetime
@@ -39,6 +41,31 @@ class ArticleDTO:
     favorited: bool
     favorites_count: int
 
+    @classmethod
+    def from_record(
+        cls,
+        record: ArticleRecordDTO,
+        author: ArticleAuthorDTO,
+        tags: list[str],
+        favorited: bool,
+        favorites_count: int,
+    ) -> "ArticleDTO":
+        # Explicit field copies: `asdict` would deep-copy the record per call.
+        return cls(
+            id=record.id,
+            author_id=record.author_id,
+            slug=record.slug,
+            title=record.title,
+            description=record.description,
+            body=record.body,
+            tags=tags,
+            author=author,
+            created_at=record.created_at,
+            updated_at=record.updated_at,
+            favorited=favorited,
+            favorites_count=favorites_count,
+        )
+
     @classmethod
     def with_updated_fields(
         cls, dto: "ArticleDTO", updated_fields: dict
@@ -46,13 +73,26 @@ class ArticleDTO:
         return replace(dto, **updated_fields)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArticlesFeedDTO:
     articles: list[ArticleDTO]
     articles_count: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class ArticleSearchHitDTO:
+    article: ArticleDTO
+    snippet: str
+    rank: float
+
+
+@dataclass(frozen=True, slots=True)
+class ArticlesSearchDTO:
+    hits: list[ArticleSearchHitDTO]
+    next_cursor: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
 class CreateArticleDTO:
     title: str
     description: str
@@ -62,7 +102,7 @@ class CreateArticleDTO:
     updated_at: datetime.datetime | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UpdateArticleDTO:
     title: str | None
     description: str | None
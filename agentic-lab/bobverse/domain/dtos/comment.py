@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from bobverse.domain.dtos.profile import ProfileDTO
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommentRecordDTO:
     id: int
     body: str
@@ -14,7 +14,7 @@ class CommentRecordDTO:
     updated_at: datetime.datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommentDTO:
     id: int
     body: str
@@ -23,12 +23,13 @@ class CommentDTO:
     updated_at: datetime.datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommentsListDTO:
     comments: list[CommentDTO]
     comments_count: int
+    next_cursor: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreateCommentDTO:
     body: str
@@ -1,10 +1,36 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileDTO:
     user_id: int
     username: str
     bio: str = ""
     image: str | None = None
     following: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class ProfilesListDTO:
+    profiles: list[ProfileDTO]
+    next_cursor: str | None = None
+
+
+class FollowStatus:
+    """
+    Outcome of following (or unfollowing) one user in a bulk request.
+    """
+
+    followed = "followed"
+    already_followed = "already_followed"
+    unfollowed = "unfollowed"
+    not_followed = "not_followed"
+    not_found = "not_found"
+    own_profile = "own_profile"
+
+
+@dataclass(frozen=True, slots=True)
+class FollowResultDTO:
+    username: str
+    status: str
+    profile: ProfileDTO | None = None
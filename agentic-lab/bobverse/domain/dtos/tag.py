@@ -2,8 +2,9 @@ import datetime
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TagDTO:
     id: int
     tag: str
     created_at: datetime.datetime
+    article_count: int = 0
@@ -2,7 +2,7 @@ import datetime
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class UserDTO:
     id: int = field(init=False)
     username: str
@@ -13,7 +13,7 @@ class UserDTO:
     created_at: datetime.datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreatedUserDTO:
     id: int
     email: str
@@ -23,7 +23,7 @@ class CreatedUserDTO:
     token: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LoggedInUserDTO:
     email: str
     username: str
@@ -32,7 +32,7 @@ class LoggedInUserDTO:
     token: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UpdatedUserDTO:
     id: int
     email: str
@@ -41,20 +41,20 @@ class UpdatedUserDTO:
     image: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreateUserDTO:
     username: str
     email: str
     password: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LoginUserDTO:
     email: str
     password: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UpdateUserDTO:
     username: str | None = None
     email: str | None = None
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
 
 M_ = TypeVar("M_")
 D_ = TypeVar("D_")
@@ -8,6 +9,12 @@ D_ = TypeVar("D_")
 class IModelMapper(ABC, Generic[M_, D_]):
     """Interface for model mapping."""
 
+    # Columns selected for `from_row`, in place of whole ORM entities.
+    columns: tuple[Any, ...]
+    # Builds a DTO from a result row of `columns` (usually generated, see
+    # `make_row_mapper`).
+    from_row: Callable[[Any], D_]
+
     @staticmethod
     @abstractmethod
     def to_dto(model: M_) -> D_: ...
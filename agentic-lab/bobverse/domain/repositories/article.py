@@ -1,9 +1,12 @@
 import abc
+import datetime
+from collections.abc import AsyncIterator
 from typing import Any
 
 from bobverse.domain.dtos.article import (
     ArticleDTO,
     ArticleRecordDTO,
+    ArticleSearchHitDTO,
     CreateArticleDTO,
     UpdateArticleDTO,
 )
@@ -33,6 +36,11 @@ class IArticleRepository(abc.ABC):
         self, session: Any, slug: str, update_item: UpdateArticleDTO
     ) -> ArticleRecordDTO: ...
 
+    @abc.abstractmethod
+    async def add_to_favorites_count(
+        self, session: Any, article_id: int, delta: int
+    ) -> ArticleRecordDTO: ...
+
     @abc.abstractmethod
     async def list_by_followings(
         self, session: Any, user_id: int, limit: int, offset: int
@@ -40,7 +48,22 @@ class IArticleRepository(abc.ABC):
 
     @abc.abstractmethod
     async def list_by_followings_v2(
-        self, session: Any, user_id: int, limit: int, offset: int
+        self,
+        session: Any,
+        user_id: int,
+        limit: int,
+        offset: int,
+        include_body: bool = True,
+    ) -> list[ArticleDTO]: ...
+
+    @abc.abstractmethod
+    async def list_by_timeline(
+        self,
+        session: Any,
+        user_id: int,
+        limit: int,
+        offset: int,
+        include_body: bool = True,
     ) -> list[ArticleDTO]: ...
 
     @abc.abstractmethod
@@ -64,11 +87,36 @@ class IArticleRepository(abc.ABC):
         tag: str | None = None,
         author: str | None = None,
         favorited: str | None = None,
+        include_body: bool = True,
     ) -> list[ArticleDTO]: ...
 
+    @abc.abstractmethod
+    async def search(
+        self,
+        session: Any,
+        user_id: int | None,
+        query: str,
+        limit: int,
+        after: tuple[float, int] | None = None,
+    ) -> list[ArticleSearchHitDTO]: ...
+
+    @abc.abstractmethod
+    def stream_by_filters(
+        self,
+        session: Any,
+        user_id: int | None,
+        tag: str | None = None,
+        author: str | None = None,
+        favorited: str | None = None,
+        since: datetime.datetime | None = None,
+    ) -> AsyncIterator[ArticleDTO]: ...
+
     @abc.abstractmethod
     async def count_by_followings(self, session: Any, user_id: int) -> int: ...
 
+    @abc.abstractmethod
+    async def count_by_timeline(self, session: Any, user_id: int) -> int: ...
+
     @abc.abstractmethod
     async def count_by_filters(
         self,
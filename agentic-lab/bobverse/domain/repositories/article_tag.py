@@ -12,5 +12,8 @@ class IArticleTagRepository(abc.ABC):
         self, session: Any, article_id: int, tags: list[str]
     ) -> list[TagDTO]: ...
 
+    @abc.abstractmethod
+    async def delete_many(self, session: Any, article_id: int) -> None: ...
+
     @abc.abstractmethod
     async def list(self, session: Any, article_id: int) -> list[TagDTO]: ...
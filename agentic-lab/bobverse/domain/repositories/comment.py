@@ -1,7 +1,12 @@
 import abc
+import datetime
 from typing import Any
 
-from bobverse.domain.dtos.comment import CommentRecordDTO, CreateCommentDTO
+from bobverse.domain.dtos.comment import (
+    CommentRecordDTO,
+    CommentsListDTO,
+    CreateCommentDTO,
+)
 
 
 class ICommentRepository(abc.ABC):
@@ -16,6 +21,11 @@ class ICommentRepository(abc.ABC):
         create_item: CreateCommentDTO,
     ) -> CommentRecordDTO: ...
 
+    @abc.abstractmethod
+    async def add_by_article_slug(
+        self, session: Any, author_id: int, slug: str, create_item: CreateCommentDTO
+    ) -> CommentRecordDTO: ...
+
     @abc.abstractmethod
     async def get_or_none(
         self, session: Any, comment_id: int
@@ -24,11 +34,31 @@ class ICommentRepository(abc.ABC):
     @abc.abstractmethod
     async def get(self, session: Any, comment_id: int) -> CommentRecordDTO: ...
 
+    @abc.abstractmethod
+    async def get_by_article_slug(
+        self, session: Any, slug: str, comment_id: int
+    ) -> CommentRecordDTO: ...
+
     @abc.abstractmethod
     async def list(self, session: Any, article_id: int) -> list[CommentRecordDTO]: ...
 
+    @abc.abstractmethod
+    async def list_with_authors(
+        self,
+        session: Any,
+        slug: str,
+        user_id: int | None,
+        limit: int | None = None,
+        after: tuple[datetime.datetime, int] | None = None,
+    ) -> CommentsListDTO: ...
+
     @abc.abstractmethod
     async def delete(self, session: Any, comment_id: int) -> None: ...
 
+    @abc.abstractmethod
+    async def delete_by_article_slug(
+        self, session: Any, slug: str, comment_id: int, author_id: int
+    ) -> bool: ...
+
     @abc.abstractmethod
     async def count(self, session: Any, article_id: int) -> int: ...
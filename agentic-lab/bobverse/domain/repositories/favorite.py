@@ -12,7 +12,11 @@ class IFavoriteRepository(abc.ABC):
     async def count(self, session: Any, article_id: int) -> int: ...
 
     @abc.abstractmethod
-    async def create(self, session: Any, article_id: int, user_id: int) -> None: ...
+    async def create_by_slug(
+        self, session: Any, slug: str, user_id: int
+    ) -> int | None: ...
 
     @abc.abstractmethod
-    async def delete(self, session: Any, article_id: int, user_id: int) -> None: ...
+    async def delete_by_slug(
+        self, session: Any, slug: str, user_id: int
+    ) -> int | None: ...
@@ -0,0 +1,16 @@
+import abc
+
+
+class IFavoriteBuffer(abc.ABC):
+    """Write-behind buffer of favorites interface."""
+
+    @abc.abstractmethod
+    def favorited(self, user_id: int, article_id: int) -> bool | None: ...
+
+    @abc.abstractmethod
+    def count_delta(self, article_id: int) -> int: ...
+
+    @abc.abstractmethod
+    def record(
+        self, user_id: int, article_id: int, favorited: bool, was_favorited: bool
+    ) -> None: ...
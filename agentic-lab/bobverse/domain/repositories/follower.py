@@ -10,6 +10,16 @@ class IFollowerRepository(abc.ABC):
         self, session: Any, follower_id: int, following_id: int
     ) -> bool: ...
 
+    @abc.abstractmethod
+    async def create_many(
+        self, session: Any, follower_id: int, following_ids: list[int]
+    ) -> list[int]: ...
+
+    @abc.abstractmethod
+    async def delete_many(
+        self, session: Any, follower_id: int, following_ids: list[int]
+    ) -> list[int]: ...
+
     @abc.abstractmethod
     async def list(
         self, session: Any, follower_id: int, following_ids: list[int]
@@ -18,9 +28,9 @@ class IFollowerRepository(abc.ABC):
     @abc.abstractmethod
     async def create(
         self, session: Any, follower_id: int, following_id: int
-    ) -> None: ...
+    ) -> bool: ...
 
     @abc.abstractmethod
     async def delete(
         self, session: Any, follower_id: int, following_id: int
-    ) -> None: ...
+    ) -> bool: ...
@@ -8,4 +8,9 @@ from bobverse.domain.dtos.tag import TagDTO
 class ITagRepository(abc.ABC):
 
     @abc.abstractmethod
-    async def list(self, session: AsyncSession) -> list[TagDTO]: ...
+    async def list_popular(self, session: AsyncSession, limit: int) -> list[TagDTO]: ...
+
+    @abc.abstractmethod
+    async def list(
+        self, session: AsyncSession, limit: int | None = None
+    ) -> list[TagDTO]: ...
@@ -0,0 +1,37 @@
+import abc
+import datetime
+from typing import Any
+
+
+class ITimelineRepository(abc.ABC):
+    """Timeline (materialized home feed) repository interface."""
+
+    @abc.abstractmethod
+    async def count_followers(
+        self, session: Any, author_id: int, limit: int
+    ) -> int: ...
+
+    @abc.abstractmethod
+    async def add_for_followers(
+        self,
+        session: Any,
+        author_id: int,
+        article_id: int,
+        created_at: datetime.datetime,
+    ) -> None: ...
+
+    @abc.abstractmethod
+    async def add_fan_in_author(self, session: Any, author_id: int) -> None: ...
+
+    @abc.abstractmethod
+    async def backfill(
+        self, session: Any, user_id: int, author_id: int, limit: int
+    ) -> None: ...
+
+    @abc.abstractmethod
+    async def trim(self, session: Any, user_id: int, author_id: int) -> None: ...
+
+    @abc.abstractmethod
+    async def rebuild(
+        self, session: Any, celebrity_threshold: int, limit: int
+    ) -> None: ...
@@ -30,6 +30,11 @@ class IUserRepository(abc.ABC):
         self, session: Any, user_ids: Collection[int]
     ) -> list[UserDTO]: ...
 
+    @abc.abstractmethod
+    async def list_by_usernames(
+        self, session: Any, usernames: Collection[str]
+    ) -> list[UserDTO]: ...
+
     @abc.abstractmethod
     async def get_by_username_or_none(
         self, session: Any, username: str
@@ -38,6 +43,15 @@ class IUserRepository(abc.ABC):
     @abc.abstractmethod
     async def get_by_username(self, session: Any, username: str) -> UserDTO: ...
 
+    @abc.abstractmethod
+    async def search_by_prefix(
+        self,
+        session: Any,
+        prefix: str,
+        limit: int,
+        after: tuple[str, int] | None = None,
+    ) -> list[UserDTO]: ...
+
     @abc.abstractmethod
     async def update(
         self, session: Any, user_id: int, update_item: UpdateUserDTO
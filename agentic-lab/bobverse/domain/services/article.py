@@ -1,9 +1,12 @@
 import abc
+import datetime
+from collections.abc import AsyncIterator
 from typing import Any
 
 from bobverse.domain.dtos.article import (
     ArticleDTO,
     ArticlesFeedDTO,
+    ArticlesSearchDTO,
     CreateArticleDTO,
     UpdateArticleDTO,
 )
@@ -34,7 +37,12 @@ class IArticleService(abc.ABC):
 
     @abc.abstractmethod
     async def get_articles_feed_v2(
-        self, session: Any, current_user: UserDTO, limit: int, offset: int
+        self,
+        session: Any,
+        current_user: UserDTO,
+        limit: int,
+        offset: int,
+        include_body: bool = True,
     ) -> ArticlesFeedDTO: ...
 
     @abc.abstractmethod
@@ -59,8 +67,30 @@ class IArticleService(abc.ABC):
         tag: str | None = None,
         author: str | None = None,
         favorited: str | None = None,
+        include_body: bool = True,
     ) -> ArticlesFeedDTO: ...
 
+    @abc.abstractmethod
+    async def search_articles(
+        self,
+        session: Any,
+        current_user: UserDTO | None,
+        query: str,
+        limit: int,
+        cursor: str | None = None,
+    ) -> ArticlesSearchDTO: ...
+
+    @abc.abstractmethod
+    def export_articles(
+        self,
+        session: Any,
+        current_user: UserDTO | None,
+        tag: str | None = None,
+        author: str | None = None,
+        favorited: str | None = None,
+        since: datetime.datetime | None = None,
+    ) -> AsyncIterator[ArticleDTO]: ...
+
     @abc.abstractmethod
     async def update_article_by_slug(
         self,
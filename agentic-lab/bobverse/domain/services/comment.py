@@ -18,7 +18,12 @@ class ICommentService(abc.ABC):
 
     @abc.abstractmethod
     async def get_article_comments(
-        self, session: Any, slug: str, current_user: UserDTO | None
+        self,
+        session: Any,
+        slug: str,
+        current_user: UserDTO | None,
+        limit: int | None = None,
+        cursor: str | None = None,
     ) -> CommentsListDTO: ...
 
     @abc.abstractmethod
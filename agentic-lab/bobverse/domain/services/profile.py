@@ -1,7 +1,7 @@
 import abc
 from typing import Any
 
-from bobverse.domain.dtos.profile import ProfileDTO
+from bobverse.domain.dtos.profile import FollowResultDTO, ProfileDTO, ProfilesListDTO
 from bobverse.domain.dtos.user import UserDTO
 
 
@@ -22,12 +22,32 @@ class IProfileService(abc.ABC):
         self, session: Any, user_ids: list[int], current_user: UserDTO | None
     ) -> list[ProfileDTO]: ...
 
+    @abc.abstractmethod
+    async def search_profiles(
+        self,
+        session: Any,
+        query: str,
+        limit: int,
+        current_user: UserDTO | None,
+        cursor: str | None = None,
+    ) -> ProfilesListDTO: ...
+
     @abc.abstractmethod
     async def follow_user(
         self, session: Any, username: str, current_user: UserDTO
-    ) -> None: ...
+    ) -> ProfileDTO: ...
 
     @abc.abstractmethod
     async def unfollow_user(
         self, session: Any, username: str, current_user: UserDTO
-    ) -> None: ...
+    ) -> ProfileDTO: ...
+
+    @abc.abstractmethod
+    async def follow_users(
+        self, session: Any, usernames: list[str], current_user: UserDTO
+    ) -> list[FollowResultDTO]: ...
+
+    @abc.abstractmethod
+    async def unfollow_users(
+        self, session: Any, usernames: list[str], current_user: UserDTO
+    ) -> list[FollowResultDTO]: ...
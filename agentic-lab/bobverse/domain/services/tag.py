@@ -7,4 +7,9 @@ from bobverse.domain.dtos.tag import TagDTO
 class ITagService(abc.ABC):
 
     @abc.abstractmethod
-    async def get_all_tags(self, session: Any) -> list[TagDTO]: ...
+    async def get_all_tags(
+        self, session: Any, limit: int | None = None
+    ) -> list[TagDTO]: ...
+
+    @abc.abstractmethod
+    async def get_popular_tags(self, session: Any, limit: int) -> list[TagDTO]: ...
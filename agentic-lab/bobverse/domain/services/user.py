@@ -31,6 +31,20 @@ class IUserService(abc.ABC):
         self, session: Any, user_ids: Collection[int]
     ) -> list[UserDTO]: ...
 
+    @abc.abstractmethod
+    async def get_users_by_usernames(
+        self, session: Any, usernames: Collection[str]
+    ) -> list[UserDTO]: ...
+
+    @abc.abstractmethod
+    async def search_users_by_prefix(
+        self,
+        session: Any,
+        prefix: str,
+        limit: int,
+        after: tuple[str, int] | None = None,
+    ) -> list[UserDTO]: ...
+
     @abc.abstractmethod
     async def update_user(
         self, session: Any, current_user: UserDTO, user_to_update: UpdateUserDTO
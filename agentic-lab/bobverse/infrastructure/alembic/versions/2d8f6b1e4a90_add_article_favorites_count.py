@@ -0,0 +1,32 @@
+"""add article favorites count
+
+Revision ID: 2d8f6b1e4a90
+Revises: 9c4e2a7d5f13
+Create Date: 2026-10-19 16:12:08.930417
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "2d8f6b1e4a90"
+down_revision: str | None = "9c4e2a7d5f13"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "article",
+        sa.Column("favorites_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        "UPDATE article SET favorites_count = "
+        "(SELECT count(*) FROM favorite WHERE favorite.article_id = article.id)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("article", "favorites_count")
@@ -0,0 +1,63 @@
+"""add article full-text search index
+
+Revision ID: 3f1c2a9d7b84
+Revises: 666cc53a93be
+Create Date: 2026-10-19 10:12:31.402117
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "3f1c2a9d7b84"
+down_revision: str | None = "666cc53a93be"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE VIRTUAL TABLE article_fts USING fts5(
+            title, description, body,
+            content='article', content_rowid='id', tokenize='porter unicode61'
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER article_fts_ai AFTER INSERT ON article BEGIN
+            INSERT INTO article_fts (rowid, title, description, body)
+            VALUES (new.id, new.title, new.description, new.body);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER article_fts_ad AFTER DELETE ON article BEGIN
+            INSERT INTO article_fts (article_fts, rowid, title, description, body)
+            VALUES ('delete', old.id, old.title, old.description, old.body);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER article_fts_au
+        AFTER UPDATE OF title, description, body ON article BEGIN
+            INSERT INTO article_fts (article_fts, rowid, title, description, body)
+            VALUES ('delete', old.id, old.title, old.description, old.body);
+            INSERT INTO article_fts (rowid, title, description, body)
+            VALUES (new.id, new.title, new.description, new.body);
+        END
+        """
+    )
+    # Index the articles that existed before the triggers were installed.
+    op.execute("INSERT INTO article_fts (article_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS article_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS article_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS article_fts_ai")
+    op.execute("DROP TABLE IF EXISTS article_fts")
@@ -0,0 +1,49 @@
+"""add timeline
+
+Revision ID: 5b9d3e8f1c27
+Revises: e7b2f40c1a63
+Create Date: 2026-10-19 14:32:08.417263
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "5b9d3e8f1c27"
+down_revision: str | None = "e7b2f40c1a63"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "timeline",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("article_id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["article_id"], ["article.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"]),
+        sa.PrimaryKeyConstraint("user_id", "article_id"),
+    )
+    op.create_index(
+        "ix_timeline_user_id_created_at", "timeline", ["user_id", "created_at"]
+    )
+    op.create_table(
+        "timeline_fan_in",
+        sa.Column("author_id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["author_id"], ["user.id"]),
+        sa.PrimaryKeyConstraint("author_id"),
+    )
+    op.create_index(
+        "ix_article_author_id_created_at", "article", ["author_id", "created_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_article_author_id_created_at", table_name="article")
+    op.drop_table("timeline_fan_in")
+    op.drop_index("ix_timeline_user_id_created_at", table_name="timeline")
+    op.drop_table("timeline")
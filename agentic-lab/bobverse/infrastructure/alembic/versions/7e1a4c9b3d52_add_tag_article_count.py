@@ -0,0 +1,38 @@
+"""add tag article count
+
+Revision ID: 7e1a4c9b3d52
+Revises: 2d8f6b1e4a90
+Create Date: 2026-10-19 18:03:41.271954
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "7e1a4c9b3d52"
+down_revision: str | None = "2d8f6b1e4a90"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tag",
+        sa.Column("article_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    # Links of deleted articles were left behind: foreign keys are not enforced.
+    op.execute(
+        "DELETE FROM article_tag WHERE article_id NOT IN (SELECT id FROM article)"
+    )
+    op.execute(
+        "UPDATE tag SET article_count = "
+        "(SELECT count(*) FROM article_tag WHERE article_tag.tag_id = tag.id)"
+    )
+    op.create_index("ix_tag_article_count", "tag", ["article_count"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tag_article_count", table_name="tag")
+    op.drop_column("tag", "article_count")
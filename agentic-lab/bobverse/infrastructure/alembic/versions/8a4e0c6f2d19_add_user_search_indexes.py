@@ -0,0 +1,27 @@
+"""add user search indexes
+
+Revision ID: 8a4e0c6f2d19
+Revises: 3f1c2a9d7b84
+Create Date: 2026-10-19 11:02:47.118230
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "8a4e0c6f2d19"
+down_revision: str | None = "3f1c2a9d7b84"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_user_username_lower", "user", [sa.text("lower(username)")])
+    op.create_index("ix_user_email_lower", "user", [sa.text("lower(email)")])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_email_lower", table_name="user")
+    op.drop_index("ix_user_username_lower", table_name="user")
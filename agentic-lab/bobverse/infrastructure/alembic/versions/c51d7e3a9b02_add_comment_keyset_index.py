@@ -0,0 +1,28 @@
+"""add comment keyset index
+
+Revision ID: c51d7e3a9b02
+Revises: 8a4e0c6f2d19
+Create Date: 2026-10-19 11:48:05.630914
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "c51d7e3a9b02"
+down_revision: str | None = "8a4e0c6f2d19"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_comment_article_id_created_at_id",
+        "comment",
+        ["article_id", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_comment_article_id_created_at_id", table_name="comment")
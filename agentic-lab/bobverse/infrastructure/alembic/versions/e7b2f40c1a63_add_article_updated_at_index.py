@@ -0,0 +1,24 @@
+"""add article updated_at index
+
+Revision ID: e7b2f40c1a63
+Revises: c51d7e3a9b02
+Create Date: 2026-10-19 13:41:26.208734
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "e7b2f40c1a63"
+down_revision: str | None = "c51d7e3a9b02"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_article_updated_at", "article", ["updated_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_article_updated_at", table_name="article")
@@ -0,0 +1,164 @@
+"""
+Write-behind buffer for favorites, so that a burst of favorites of a trending
+article does not queue up on the database write lock.
+
+Requests record favorites and unfavorites in the buffer instead of writing
+them: only a user's latest change of an article is kept, and every article's
+favorites count is adjusted by a single delta. At most `flush_interval` seconds
+later, everything recorded is written in one transaction.
+
+Until then, the acting user sees their changes (reads overlay the buffer), but
+other workers do not; a count read while a flush commits may briefly include
+its delta twice. Changes still buffered when the process dies are lost;
+`close`, called on shutdown, writes them.
+"""
+
+import asyncio
+import itertools
+from collections import Counter
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime
+
+from sqlalchemy import bindparam, delete, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from structlog import get_logger
+
+from bobverse.domain.repositories.favorite_buffer import IFavoriteBuffer
+from bobverse.infrastructure.models import Article, Favorite
+
+__all__ = ["FavoriteBuffer"]
+
+logger = get_logger()
+
+# Keeps every statement well under SQLite's limit of bound parameters.
+FLUSH_CHUNK_SIZE = 1_000
+
+
+class FavoriteBuffer(IFavoriteBuffer):
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]],
+        flush_interval: float = 0.005,
+    ) -> None:
+        self.flush_interval = flush_interval
+        self._session_factory = session_factory
+        # Latest change recorded per (user id, article id), and the resulting
+        # favorites count delta per article id.
+        self._pending: dict[tuple[int, int], bool] = {}
+        self._pending_deltas: Counter[int] = Counter()
+        # Changes being written: still overlaid on reads until committed.
+        self._flushing: dict[tuple[int, int], bool] = {}
+        self._flushing_deltas: Counter[int] = Counter()
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    def favorited(self, user_id: int, article_id: int) -> bool | None:
+        """Whether the user favorited the article, or None if not recorded."""
+        key = (user_id, article_id)
+        if (favorited := self._pending.get(key)) is not None:
+            return favorited
+        return self._flushing.get(key)
+
+    def count_delta(self, article_id: int) -> int:
+        """Change of the article's favorites count not written yet."""
+        return self._pending_deltas[article_id] + self._flushing_deltas[article_id]
+
+    def record(
+        self, user_id: int, article_id: int, favorited: bool, was_favorited: bool
+    ) -> None:
+        self._pending[(user_id, article_id)] = favorited
+        if favorited != was_favorited:
+            self._pending_deltas[article_id] += 1 if favorited else -1
+        self._start()
+
+    async def flush(self) -> None:
+        """Write the changes recorded so far, in a single transaction."""
+        async with self._lock:
+            if not self._pending:
+                return
+            self._flushing, self._pending = self._pending, {}
+            self._flushing_deltas = self._pending_deltas
+            self._pending_deltas = Counter()
+            try:
+                async with self._session_factory() as session:
+                    await self._write(session=session, changes=self._flushing)
+            except BaseException:
+                # Retried with the next flush (also when cancelled midway);
+                # changes recorded meanwhile win.
+                self._pending = self._flushing | self._pending
+                self._flushing_deltas.update(self._pending_deltas)
+                self._pending_deltas = self._flushing_deltas
+                raise
+            finally:
+                self._flushing, self._flushing_deltas = {}, Counter()
+
+    async def close(self) -> None:
+        """Stop flushing in the background, and write what is left."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self.flush()
+
+    def _start(self) -> None:
+        # The task stops once there is nothing left to flush.
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._task = loop.create_task(self._flush_periodically())
+
+    async def _flush_periodically(self) -> None:
+        while self._pending:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Favorites flush failed")
+
+    @staticmethod
+    async def _write(
+        session: AsyncSession, changes: dict[tuple[int, int], bool]
+    ) -> None:
+        # Counts are adjusted by the rows actually written, which other workers
+        # may have written already.
+        deltas: Counter[int] = Counter()
+        created_at = datetime.now()
+        favorited = [key for key, favorite in changes.items() if favorite]
+        for chunk in itertools.batched(favorited, FLUSH_CHUNK_SIZE):
+            query = (
+                insert(Favorite)
+                .values(
+                    [
+                        dict(
+                            user_id=user_id,
+                            article_id=article_id,
+                            created_at=created_at,
+                        )
+                        for user_id, article_id in chunk
+                    ]
+                )
+                .on_conflict_do_nothing()
+                .returning(Favorite.article_id)
+            )
+            deltas.update((await session.execute(query)).scalars())
+        unfavorited = [key for key, favorite in changes.items() if not favorite]
+        for chunk in itertools.batched(unfavorited, FLUSH_CHUNK_SIZE):
+            query = (
+                delete(Favorite)
+                .where(tuple_(Favorite.user_id, Favorite.article_id).in_(chunk))
+                .returning(Favorite.article_id)
+            )
+            deltas.subtract((await session.execute(query)).scalars())
+
+        if counts := [
+            dict(changed_id=article_id, delta=delta)
+            for article_id, delta in deltas.items()
+            if delta
+        ]:
+            article = Article.__table__
+            query = (
+                update(article)
+                .where(article.c.id == bindparam("changed_id"))
+                .values(favorites_count=article.c.favorites_count + bindparam("delta"))
+            )
+            await session.execute(query, counts)
@@ -0,0 +1,124 @@
+"""
+In-memory copy of the follower graph, for answering "does A follow B" without
+a query.
+
+Every follower's followings are kept as a sorted array of ints, so a check is
+a binary search. The graph is loaded from the database on first use. Follows
+and unfollows are also written to the `follower_change` log: at most once per
+`sync_interval`, a worker replays the changes logged since it last looked,
+which keeps workers in step with each other. A worker sees its own changes as
+soon as they are committed.
+
+The log is pruned of changes older than `CHANGE_RETENTION` as new ones are
+logged. A worker that has not synced for half of that (e.g. an idle one)
+reloads the whole graph instead, as changes it missed may be gone.
+"""
+
+import asyncio
+import bisect
+import datetime
+import time
+from array import array
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.functions import max as max_
+
+from bobverse.infrastructure.models import Follower, FollowerChange
+
+__all__ = ["FollowerGraph"]
+
+_EMPTY = array("I")
+
+CHANGE_RETENTION = datetime.timedelta(hours=1)
+# Seconds without syncing after which the graph is reloaded; the margin covers
+# clock differences between workers.
+RELOAD_AFTER = CHANGE_RETENTION.total_seconds() / 2
+# Seconds between two prunings of the log by a worker.
+PRUNE_INTERVAL = 60.0
+
+
+class FollowerGraph:
+    def __init__(self, sync_interval: float = 1.0) -> None:
+        self.sync_interval = sync_interval
+        self._followings: dict[int, array] = {}
+        self._loaded = False
+        # Id of the last `follower_change` row applied.
+        self._last_change_id = 0
+        self._synced_at = 0.0
+        self._pruned_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    def follows(self, follower_id: int, following_id: int) -> bool:
+        followings = self._followings.get(follower_id, _EMPTY)
+        index = bisect.bisect_left(followings, following_id)
+        return index < len(followings) and followings[index] == following_id
+
+    def apply(self, follower_id: int, following_id: int, following: bool) -> None:
+        """Record a follow (or unfollow), unless already recorded."""
+        followings = self._followings.setdefault(follower_id, array("I"))
+        index = bisect.bisect_left(followings, following_id)
+        present = index < len(followings) and followings[index] == following_id
+        if following and not present:
+            followings.insert(index, following_id)
+        elif not following and present:
+            del followings[index]
+
+    async def sync(self, session: AsyncSession) -> None:
+        """Load the graph, or replay the changes made by other workers."""
+        if self._loaded and time.monotonic() - self._synced_at < self.sync_interval:
+            return
+        async with self._lock:
+            if not self._loaded:
+                await self._load(session)
+            elif time.monotonic() - self._synced_at >= RELOAD_AFTER:
+                await self._load(session)
+            elif time.monotonic() - self._synced_at >= self.sync_interval:
+                await self._replay(session)
+
+    async def prune(self, session: AsyncSession) -> None:
+        """Delete the logged changes older than `CHANGE_RETENTION`, now and then."""
+        now = time.monotonic()
+        if self._pruned_at is not None and now - self._pruned_at < PRUNE_INTERVAL:
+            return
+        self._pruned_at = now
+        await session.execute(
+            delete(FollowerChange).where(
+                FollowerChange.created_at < datetime.datetime.now() - CHANGE_RETENTION
+            )
+        )
+
+    async def _load(self, session: AsyncSession) -> None:
+        # Changes logged while the edges are read are replayed on top of them,
+        # which is harmless: applying a change is idempotent.
+        result = await session.execute(select(max_(FollowerChange.id)))
+        self._last_change_id = result.scalar() or 0
+        rows = await session.execute(
+            select(Follower.follower_id, Follower.following_id).order_by(
+                Follower.follower_id, Follower.following_id
+            )
+        )
+        followings: dict[int, array] = {}
+        for follower_id, following_id in rows:
+            if (ids := followings.get(follower_id)) is None:
+                ids = followings[follower_id] = array("I")
+            ids.append(following_id)
+        self._followings = followings
+        self._loaded = True
+        await self._replay(session)
+
+    async def _replay(self, session: AsyncSession) -> None:
+        rows = await session.execute(
+            select(
+                FollowerChange.id,
+                FollowerChange.follower_id,
+                FollowerChange.following_id,
+                FollowerChange.following,
+            )
+            .where(FollowerChange.id > self._last_change_id)
+            .order_by(FollowerChange.id)
+        )
+        for change_id, follower_id, following_id, following in rows:
+            self.apply(follower_id, following_id, following)
+            self._last_change_id = change_id
+        self._synced_at = time.monotonic()
@@ -1,9 +1,22 @@
 from bobverse.domain.dtos.article import ArticleRecordDTO
 from bobverse.domain.mapper import IModelMapper
+from bobverse.infrastructure.mappers.row import make_row_mapper
 from bobverse.infrastructure.models import Article
 
 
 class ArticleModelMapper(IModelMapper[Article, ArticleRecordDTO]):
+    columns = (
+        Article.id,
+        Article.author_id,
+        Article.slug,
+        Article.title,
+        Article.description,
+        Article.body,
+        Article.created_at,
+        Article.updated_at,
+        Article.favorites_count,
+    )
+    from_row = staticmethod(make_row_mapper(ArticleRecordDTO, columns))
 
     @staticmethod
     def to_dto(model: Article) -> ArticleRecordDTO:
@@ -16,6 +29,7 @@ class ArticleModelMapper(IModelMapper[Article, ArticleRecordDTO]):
             body=model.body,
             created_at=model.created_at,
             updated_at=model.updated_at,
+            favorites_count=model.favorites_count,
         )
         return dto
 
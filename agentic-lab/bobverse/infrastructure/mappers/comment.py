@@ -1,9 +1,19 @@
 from bobverse.domain.dtos.comment import CommentRecordDTO
 from bobverse.domain.mapper import IModelMapper
+from bobverse.infrastructure.mappers.row import make_row_mapper
 from bobverse.infrastructure.models import Comment
 
 
 class CommentModelMapper(IModelMapper[Comment, CommentRecordDTO]):
+    columns = (
+        Comment.id,
+        Comment.body,
+        Comment.author_id,
+        Comment.article_id,
+        Comment.created_at,
+        Comment.updated_at,
+    )
+    from_row = staticmethod(make_row_mapper(CommentRecordDTO, columns))
 
     @staticmethod
     def to_dto(model: Comment) -> CommentRecordDTO:
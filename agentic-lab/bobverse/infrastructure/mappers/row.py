@@ -0,0 +1,40 @@
+from collections.abc import Callable, Sequence
+from dataclasses import fields
+from typing import Any, ClassVar, Protocol, TypeVar
+
+
+class _Dataclass(Protocol):
+    __dataclass_fields__: ClassVar[dict[str, Any]]
+
+
+D_ = TypeVar("D_", bound=_Dataclass)
+
+
+def make_row_mapper(dto_class: type[D_], columns: Sequence[Any]) -> Callable[[Any], D_]:
+    """
+    Generate a function building `dto_class` instances from result rows of
+    `columns`, reading the row items by position.
+
+    Example:
+        from_row = make_row_mapper(TagDTO, (Tag.id, Tag.tag, Tag.created_at))
+        from_row(row)  # TagDTO(id=row[0], tag=row[1], created_at=row[2])
+    """
+    init_fields = {field.name for field in fields(dto_class) if field.init}
+    arguments, assignments = [], []
+    for index, column in enumerate(columns):
+        if column.key in init_fields:
+            arguments.append(f"{column.key}=row[{index}]")
+        else:
+            assignments.append(f"    dto.{column.key} = row[{index}]")
+
+    source = "\n".join(
+        [
+            "def from_row(row):",
+            f"    dto = dto_class({', '.join(arguments)})",
+            *assignments,
+            "    return dto",
+        ]
+    )
+    namespace = {"dto_class": dto_class}
+    exec(source, namespace)
+    return namespace["from_row"]
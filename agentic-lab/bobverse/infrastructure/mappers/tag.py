@@ -1,13 +1,21 @@
 from bobverse.domain.dtos.tag import TagDTO
 from bobverse.domain.mapper import IModelMapper
+from bobverse.infrastructure.mappers.row import make_row_mapper
 from bobverse.infrastructure.models import Tag
 
 
 class TagModelMapper(IModelMapper[Tag, TagDTO]):
+    columns = (Tag.id, Tag.tag, Tag.created_at, Tag.article_count)
+    from_row = staticmethod(make_row_mapper(TagDTO, columns))
 
     @staticmethod
     def to_dto(model: Tag) -> TagDTO:
-        dto = TagDTO(id=model.id, tag=model.tag, created_at=model.created_at)
+        dto = TagDTO(
+            id=model.id,
+            tag=model.tag,
+            created_at=model.created_at,
+            article_count=model.article_count,
+        )
         return dto
 
     @staticmethod
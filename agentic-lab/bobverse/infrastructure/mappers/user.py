@@ -1,9 +1,20 @@
 from bobverse.domain.dtos.user import UserDTO
 from bobverse.domain.mapper import IModelMapper
+from bobverse.infrastructure.mappers.row import make_row_mapper
 from bobverse.infrastructure.models import User
 
 
 class UserModelMapper(IModelMapper[User, UserDTO]):
+    columns = (
+        User.id,
+        User.username,
+        User.email,
+        User.password_hash,
+        User.bio,
+        User.image_url,
+        User.created_at,
+    )
+    from_row = staticmethod(make_row_mapper(UserDTO, columns))
 
     @staticmethod
     def to_dto(model: User) -> UserDTO:
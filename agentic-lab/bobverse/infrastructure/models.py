@@ -1,7 +1,7 @@
 from datetime import datetime
 from functools import partial
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import DDL, ForeignKey, Index, column, event, func, table
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -25,6 +25,11 @@ class User(Base):
     updated_at: Mapped[datetime] = mapped_column(nullable=True)
 
 
+# Expression indexes backing case-insensitive prefix search over users.
+Index("ix_user_username_lower", func.lower(User.username))
+Index("ix_user_email_lower", func.lower(User.email))
+
+
 class Follower(Base):
     __tablename__ = "follower"
 
@@ -35,6 +40,19 @@ class Follower(Base):
     created_at: Mapped[datetime]
 
 
+# Log of follows and unfollows, which workers caching the follower graph in
+# memory replay to stay in step with each other.
+class FollowerChange(Base):
+    __tablename__ = "follower_change"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    follower_id: Mapped[int]
+    following_id: Mapped[int]
+    # True for a follow, False for an unfollow.
+    following: Mapped[bool]
+    created_at: Mapped[datetime]
+
+
 class Article(Base):
     __tablename__ = "article"
 
@@ -46,6 +64,68 @@ class Article(Base):
     body: Mapped[str]
     created_at: Mapped[datetime]
     updated_at: Mapped[datetime] = mapped_column(nullable=True)
+    # Kept in step with the `favorite` rows by favoriting and unfavoriting.
+    favorites_count: Mapped[int] = mapped_column(
+        nullable=False, default=0, server_default="0"
+    )
+
+
+# Serves the (updated_at, id) ordering and `since` filter of the article export.
+Index("ix_article_updated_at", Article.updated_at)
+# Serves an author's latest articles (timeline backfill and fan-in).
+Index("ix_article_author_id_created_at", Article.author_id, Article.created_at)
+
+
+# External-content FTS5 index over the article text columns. It is not a mapped
+# model: it is created together with the `article` table and kept in sync by the
+# triggers below, and queried through this lightweight table construct.
+article_fts = table(
+    "article_fts",
+    column("rowid"),
+    column("title"),
+    column("description"),
+    column("body"),
+)
+
+ARTICLE_FTS_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS article_fts USING fts5(
+        title, description, body,
+        content='article', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS article_fts_ai AFTER INSERT ON article BEGIN
+        INSERT INTO article_fts (rowid, title, description, body)
+        VALUES (new.id, new.title, new.description, new.body);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS article_fts_ad AFTER DELETE ON article BEGIN
+        INSERT INTO article_fts (article_fts, rowid, title, description, body)
+        VALUES ('delete', old.id, old.title, old.description, old.body);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS article_fts_au
+    AFTER UPDATE OF title, description, body ON article BEGIN
+        INSERT INTO article_fts (article_fts, rowid, title, description, body)
+        VALUES ('delete', old.id, old.title, old.description, old.body);
+        INSERT INTO article_fts (rowid, title, description, body)
+        VALUES (new.id, new.title, new.description, new.body);
+    END
+    """,
+)
+
+for statement in ARTICLE_FTS_DDL:
+    event.listen(
+        Article.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite")
+    )
+event.listen(
+    Article.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS article_fts").execute_if(dialect="sqlite"),
+)
 
 
 class Tag(Base):
@@ -54,6 +134,14 @@ class Tag(Base):
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     tag: Mapped[str] = mapped_column(nullable=False, unique=True)
     created_at: Mapped[datetime]
+    # Kept in step with the `article_tag` rows by creating and deleting articles.
+    article_count: Mapped[int] = mapped_column(
+        nullable=False, default=0, server_default="0"
+    )
+
+
+# Serves the most used tags (ties broken by the rowid the index ends with).
+Index("ix_tag_article_count", Tag.article_count)
 
 
 class ArticleTag(Base):
@@ -87,3 +175,38 @@ class Comment(Base):
     body: Mapped[str]
     created_at: Mapped[datetime]
     updated_at: Mapped[datetime] = mapped_column(nullable=True)
+
+
+# Keyset index for paginating an article's comments in (created_at, id) order.
+Index(
+    "ix_comment_article_id_created_at_id",
+    Comment.article_id,
+    Comment.created_at,
+    Comment.id,
+)
+
+
+# Materialized home feeds: the articles of followed authors, written to every
+# follower's timeline when an article is published (fan-out on write).
+class Timeline(Base):
+    __tablename__ = "timeline"
+
+    # The user whose feed lists the article.
+    user_id: Mapped[int] = mapped_column(ForeignKey("user.id"), primary_key=True)
+    article_id: Mapped[int] = mapped_column(
+        ForeignKey("article.id", ondelete="CASCADE"), primary_key=True
+    )
+    # Copied from the article, so that a feed page is read off the index below.
+    created_at: Mapped[datetime]
+
+
+Index("ix_timeline_user_id_created_at", Timeline.user_id, Timeline.created_at)
+
+
+# Authors with too many followers to fan their articles out: their articles are
+# merged into their followers' feeds when read instead (fan-in).
+class TimelineFanIn(Base):
+    __tablename__ = "timeline_fan_in"
+
+    author_id: Mapped[int] = mapped_column(ForeignKey("user.id"), primary_key=True)
+    created_at: Mapped[datetime]
@@ -0,0 +1,45 @@
+"""
+Connection pool metrics: checkout wait time and connections in use / open.
+"""
+
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import PoolProxiedConnection
+
+from bobverse.core.metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUT_DURATION,
+    DB_POOL_SIZE,
+)
+
+
+def install_pool_metrics(engine: AsyncEngine) -> None:
+    sync_engine = engine.sync_engine
+    raw_connection = sync_engine.raw_connection
+
+    # There is no pool event fired before a checkout, so time the call every
+    # `Connection` makes to get its DBAPI connection (waiting included).
+    def timed_raw_connection() -> PoolProxiedConnection:
+        with DB_POOL_CHECKOUT_DURATION.time():
+            return raw_connection()
+
+    sync_engine.raw_connection = timed_raw_connection
+
+    def update_pool_size() -> None:
+        pool = sync_engine.pool
+        # Only queue pools keep connections open; `NullPool` has no size.
+        if hasattr(pool, "checkedin"):
+            DB_POOL_SIZE.set(pool.checkedin() + pool.checkedout())
+
+    @event.listens_for(sync_engine, "checkout")
+    def on_checkout(*args: Any) -> None:
+        DB_POOL_CHECKED_OUT.inc()
+        update_pool_size()
+
+    @event.listens_for(sync_engine, "checkin")
+    def on_checkin(*args: Any) -> None:
+        DB_POOL_CHECKED_OUT.dec()
+        update_pool_size()
@@ -0,0 +1,73 @@
+"""
+In-memory snapshot of the most used tags, for listing popular tags without a
+query.
+
+The snapshot holds the `size` tags used by the most articles and is loaded from
+the database on first use. When a worker changes tag counts, it patches the
+changed tags into its own snapshot once the transaction commits. Changes made
+by other workers are picked up when the snapshot is reloaded, at most
+`refresh_interval` seconds later. The reload also covers a tag outside the
+snapshot that overtakes one inside it by count alone.
+"""
+
+import time
+from collections.abc import Iterable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from bobverse.domain.dtos.tag import TagDTO
+
+__all__ = ["PopularTags"]
+
+_PENDING_TAGS_KEY = "pending_popular_tags"
+
+
+class PopularTags:
+    def __init__(self, size: int = 100, refresh_interval: float = 60.0) -> None:
+        self.size = size
+        self.refresh_interval = refresh_interval
+        self._tags: list[TagDTO] = []
+        self._loaded_at: float | None = None
+
+    @property
+    def stale(self) -> bool:
+        return (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at >= self.refresh_interval
+        )
+
+    def top(self, limit: int) -> list[TagDTO]:
+        return self._tags[:limit]
+
+    def load(self, tags: list[TagDTO]) -> None:
+        """Replace the snapshot with the `size` most used tags."""
+        self._tags = tags[: self.size]
+        self._loaded_at = time.monotonic()
+
+    def apply(self, tags: Iterable[TagDTO]) -> None:
+        """Patch the current counts of the given tags into the snapshot."""
+        changed = {tag.id: tag for tag in tags}
+        merged = [tag for tag in self._tags if tag.id not in changed]
+        merged.extend(tag for tag in changed.values() if tag.article_count > 0)
+        merged.sort(key=lambda tag: (tag.article_count, tag.id), reverse=True)
+        self._tags = merged[: self.size]
+
+    def apply_on_commit(self, session: AsyncSession, tags: Iterable[TagDTO]) -> None:
+        """Patch the tags into the snapshot once the session's transaction commits."""
+        self._pending_tags(session).update((tag.id, tag) for tag in tags)
+
+    def _pending_tags(self, session: AsyncSession) -> dict[int, TagDTO]:
+        if (pending := session.info.get(_PENDING_TAGS_KEY)) is not None:
+            return pending
+        tags: dict[int, TagDTO] = {}
+        session.info[_PENDING_TAGS_KEY] = tags
+
+        def apply(_: Session) -> None:
+            self.apply(tags.values())
+            tags.clear()
+
+        event.listen(session.sync_session, "after_commit", apply)
+        event.listen(session.sync_session, "after_rollback", lambda _: tags.clear())
+        return tags
@@ -0,0 +1,95 @@
+"""
+Per-request SQL statement counting and slow statement logging.
+
+`install_query_hooks` attaches cursor execution listeners to an engine. Every
+statement is added to the `QueryStats` of the current context (when one was
+started, e.g. by `QueryStatsMiddleware`), and statements slower than the
+threshold are logged with the shape of their bound parameters.
+"""
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+from structlog import get_logger
+
+logger = get_logger()
+
+_STARTED_AT_KEY = "query_stats_started_at"
+
+_query_stats: ContextVar["QueryStats | None"] = ContextVar("query_stats", default=None)
+
+
+@dataclass(slots=True)
+class QueryStats:
+    count: int = 0
+    duration: float = 0.0  # seconds.
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration * 1000
+
+
+def start_query_stats() -> QueryStats:
+    """
+    Start counting the statements executed in the current context.
+    """
+    stats = QueryStats()
+    _query_stats.set(stats)
+    return stats
+
+
+def get_query_stats() -> QueryStats | None:
+    return _query_stats.get()
+
+
+def parameters_shape(parameters: Any) -> Any:
+    """
+    Describe bound parameters by their types, so that values (passwords,
+    emails, bodies) never end up in the logs.
+
+    Example:
+        parameters_shape({"slug": "a", "limit": 20}) -> {"slug": "str", "limit": "int"}
+    """
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, list):
+        # `executemany`: one parameter set per row.
+        return {
+            "rows": len(parameters),
+            "shape": parameters_shape(parameters[0]) if parameters else None,
+        }
+    if isinstance(parameters, tuple):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def install_query_hooks(engine: AsyncEngine, slow_query_threshold_ms: float) -> None:
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(
+        conn: Connection, cursor: Any, statement: str, parameters: Any, *args: Any
+    ) -> None:
+        conn.info.setdefault(_STARTED_AT_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(
+        conn: Connection, cursor: Any, statement: str, parameters: Any, *args: Any
+    ) -> None:
+        duration = time.perf_counter() - conn.info[_STARTED_AT_KEY].pop()
+        if stats := _query_stats.get():
+            stats.count += 1
+            stats.duration += duration
+
+        if duration * 1000 >= slow_query_threshold_ms:
+            logger.warning(
+                "Slow query",
+                duration_ms=round(duration * 1000, 2),
+                statement=statement,
+                parameters=parameters_shape(parameters),
+            )
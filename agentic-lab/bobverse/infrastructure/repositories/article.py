@@ -1,12 +1,28 @@
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import case, delete, exists, func, insert, select, true, update
+from sqlalchemy import (
+    Select,
+    case,
+    delete,
+    exists,
+    func,
+    insert,
+    literal_column,
+    null,
+    select,
+    true,
+    tuple_,
+    union,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 from sqlalchemy.sql.functions import count
 
 from bobverse.core.exceptions import ArticleNotFoundException
+from bobverse.core.utils.search import make_fts_query
 from bobverse.core.utils.slug import (
     get_slug_unique_part,
     make_slug_from_title,
@@ -16,6 +32,7 @@ from bobverse.domain.dtos.article import (
     ArticleAuthorDTO,
     ArticleDTO,
     ArticleRecordDTO,
+    ArticleSearchHitDTO,
     CreateArticleDTO,
     UpdateArticleDTO,
 )
@@ -27,12 +44,34 @@ from bobverse.infrastructure.models import (
     Favorite,
     Follower,
     Tag,
+    Timeline,
+    TimelineFanIn,
     User,
+    article_fts,
 )
 
 # Aliases for the models if needed.
 FavoriteAlias = aliased(Favorite)
 
+# BM25 column weights for the (title, description, body) FTS columns.
+SEARCH_RANK_WEIGHTS = (10.0, 5.0, 1.0)
+SEARCH_SNIPPET_TOKENS = 16
+# Rows fetched from the database cursor at a time while streaming an export.
+EXPORT_BATCH_SIZE = 500
+
+
+def select_article_id_by_slug(slug: str) -> Select:
+    """
+    Select the id of the article a slug resolves to. A slug is matched by its
+    unique part, so it still resolves after the title part changed.
+    """
+    return (
+        select(Article.id)
+        .where(Article.slug.contains(get_slug_unique_part(slug=slug)))
+        .order_by(Article.id)
+        .limit(1)
+    )
+
 
 class ArticleRepository(IArticleRepository):
 
@@ -55,29 +94,27 @@ class ArticleRepository(IArticleRepository):
                 created_at=created_at,
                 updated_at=updated_at,
             )
-            .returning(Article)
+            .returning(*self._article_mapper.columns)
         )
         result = await session.execute(query)
-        return self._article_mapper.to_dto(result.scalar())
+        return self._article_mapper.from_row(result.one())
 
     async def get_by_slug_or_none(
         self, session: AsyncSession, slug: str
     ) -> ArticleRecordDTO | None:
-        slug_unique_part = get_slug_unique_part(slug=slug)
-        query = select(Article).where(
-            Article.slug == slug or Article.slug.contains(slug_unique_part)
+        query = select(*self._article_mapper.columns).where(
+            Article.id == select_article_id_by_slug(slug=slug).scalar_subquery()
         )
-        if article := await session.scalar(query):
-            return self._article_mapper.to_dto(article)
+        if row := (await session.execute(query)).first():
+            return self._article_mapper.from_row(row)
 
     async def get_by_slug(self, session: AsyncSession, slug: str) -> ArticleRecordDTO:
-        slug_unique_part = get_slug_unique_part(slug=slug)
-        query = select(Article).where(
-            Article.slug == slug or Article.slug.contains(slug_unique_part)
+        query = select(*self._article_mapper.columns).where(
+            Article.id == select_article_id_by_slug(slug=slug).scalar_subquery()
         )
-        if not (article := await session.scalar(query)):
+        if not (row := (await session.execute(query)).first()):
             raise ArticleNotFoundException()
-        return self._article_mapper.to_dto(article)
+        return self._article_mapper.from_row(row)
 
     async def delete_by_slug(self, session: AsyncSession, slug: str) -> None:
         query = delete(Article).where(Article.slug == slug)
@@ -91,7 +128,7 @@ class ArticleRepository(IArticleRepository):
             update(Article)
             .where(Article.slug == slug)
             .values(updated_at=updated_at)
-            .returning(Article)
+            .returning(*self._article_mapper.columns)
         )
         if update_item.title is not None:
             updated_slug = make_slug_from_title_and_code(
@@ -103,8 +140,20 @@ class ArticleRepository(IArticleRepository):
         if update_item.body is not None:
             query = query.values(body=update_item.body)
 
-        article = await session.scalar(query)
-        return self._article_mapper.to_dto(article)
+        result = await session.execute(query)
+        return self._article_mapper.from_row(result.one())
+
+    async def add_to_favorites_count(
+        self, session: AsyncSession, article_id: int, delta: int
+    ) -> ArticleRecordDTO:
+        query = (
+            update(Article)
+            .where(Article.id == article_id)
+            .values(favorites_count=Article.favorites_count + delta)
+            .returning(*self._article_mapper.columns)
+        )
+        result = await session.execute(query)
+        return self._article_mapper.from_row(result.one())
 
     async def list_by_followings(
         self, session: AsyncSession, user_id: int, limit: int, offset: int
@@ -112,14 +161,7 @@ class ArticleRepository(IArticleRepository):
         query = (
             (
                 select(
-                    Article.id,
-                    Article.author_id,
-                    Article.slug,
-                    Article.title,
-                    Article.description,
-                    Article.body,
-                    Article.created_at,
-                    Article.updated_at,
+                    *self._article_mapper.columns,
                     User.username,
                     User.bio,
                     User.image_url,
@@ -136,66 +178,22 @@ class ArticleRepository(IArticleRepository):
             .order_by(Article.created_at.desc())
         )
         query = query.limit(limit).offset(offset)
-        articles = await session.execute(query)
-        return [self._article_mapper.to_dto(article) for article in articles]
+        result = await session.execute(query)
+        return [self._article_mapper.from_row(row) for row in result]
 
     async def list_by_followings_v2(
-        self, session: AsyncSession, user_id: int, limit: int, offset: int
+        self,
+        session: AsyncSession,
+        user_id: int,
+        limit: int,
+        offset: int,
+        include_body: bool = True,
     ) -> list[ArticleDTO]:
-        query = (
-            select(
-                Article.id.label("id"),
-                Article.author_id.label("author_id"),
-                Article.slug.label("slug"),
-                Article.title.label("title"),
-                Article.description.label("description"),
-                Article.body.label("body"),
-                Article.created_at.label("created_at"),
-                Article.updated_at.label("updated_at"),
-                User.id.label("user_id"),
-                User.username.label("username"),
-                User.bio.label("bio"),
-                User.email.label("email"),
-                User.image_url.label("image_url"),
-                true().label("following"),
-                # Subquery for favorites count.
-                select(func.count(Favorite.article_id))
-                .where(Favorite.article_id == Article.id)
+        query = self._feed_query(user_id=user_id, include_body=include_body).filter(
+            User.id.in_(
+                select(Follower.following_id)
+                .where(Follower.follower_id == user_id)
                 .scalar_subquery()
-                .label("favorites_count"),
-                # Subquery to check if favorited by user with id `user_id`.
-                exists()
-                .where(
-                    (Favorite.user_id == user_id) & (Favorite.article_id == Article.id)
-                )
-                .label("favorited"),
-                # Concatenate tags.
-                func.string_agg(Tag.tag, ", ").label("tags"),
-            )
-            .join(User, Article.author_id == User.id)
-            .join(ArticleTag, Article.id == ArticleTag.article_id)
-            .join(Tag, Tag.id == ArticleTag.tag_id)
-            .filter(
-                User.id.in_(
-                    select(Follower.following_id)
-                    .where(Follower.follower_id == user_id)
-                    .scalar_subquery()
-                )
-            )
-            .group_by(
-                Article.id,
-                Article.author_id,
-                Article.slug,
-                Article.title,
-                Article.description,
-                Article.body,
-                Article.created_at,
-                Article.updated_at,
-                User.id,
-                User.username,
-                User.bio,
-                User.email,
-                User.image_url,
             )
         )
         query = query.limit(limit).offset(offset)
@@ -203,6 +201,50 @@ class ArticleRepository(IArticleRepository):
 
         return [self._to_article_dto(article) for article in articles]
 
+    async def list_by_timeline(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        limit: int,
+        offset: int,
+        include_body: bool = True,
+    ) -> list[ArticleDTO]:
+        # Newest first, from the articles pushed to the user's timeline and those
+        # of followed fan-in authors. Each side only needs its first page.
+        window = offset + limit
+        pushed = (
+            select(Timeline.article_id.label("id"), Timeline.created_at)
+            # Skips timeline rows of deleted articles.
+            .join(Article, Article.id == Timeline.article_id)
+            .where(Timeline.user_id == user_id)
+            .order_by(Timeline.created_at.desc())
+            .limit(window)
+        )
+        pulled = (
+            select(Article.id, Article.created_at)
+            .join(TimelineFanIn, TimelineFanIn.author_id == Article.author_id)
+            .join(
+                Follower,
+                (Follower.following_id == Article.author_id)
+                & (Follower.follower_id == user_id),
+            )
+            .order_by(Article.created_at.desc())
+            .limit(window)
+        )
+        timeline = union(
+            select(pushed.subquery()), select(pulled.subquery())
+        ).subquery()
+        query = (
+            self._feed_query(user_id=user_id, include_body=include_body)
+            .join(timeline, timeline.c.id == Article.id)
+            .order_by(Article.created_at.desc(), Article.id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        articles = await session.execute(query)
+
+        return [self._to_article_dto(article) for article in articles]
+
     async def list_by_filters(
         self,
         session: AsyncSession,
@@ -213,16 +255,7 @@ class ArticleRepository(IArticleRepository):
         favorited: str | None = None,
     ) -> list[ArticleRecordDTO]:
         query = (
-            select(
-                Article.id,
-                Article.author_id,
-                Article.slug,
-                Article.title,
-                Article.description,
-                Article.body,
-                Article.created_at,
-                Article.updated_at,
-            )
+            select(*self._article_mapper.columns)
         ).order_by(Article.created_at.desc())
 
         if tag:
@@ -260,8 +293,8 @@ class ArticleRepository(IArticleRepository):
             # fmt: on
 
         query = query.limit(limit).offset(offset)
-        articles = await session.execute(query)
-        return [self._article_mapper.to_dto(article) for article in articles]
+        result = await session.execute(query)
+        return [self._article_mapper.from_row(row) for row in result]
 
     async def list_by_filters_v2(
         self,
@@ -272,7 +305,10 @@ class ArticleRepository(IArticleRepository):
         tag: str | None = None,
         author: str | None = None,
         favorited: str | None = None,
+        include_body: bool = True,
     ) -> list[ArticleDTO]:
+        # Without the body, its (possibly overflowing) pages are never read.
+        body = Article.body if include_body else null()
         query = (
             # fmt: off
             select(
@@ -281,7 +317,7 @@ class ArticleRepository(IArticleRepository):
                 Article.slug.label("slug"),
                 Article.title.label("title"),
                 Article.description.label("description"),
-                Article.body.label("body"),
+                body.label("body"),
                 Article.created_at.label("created_at"),
                 Article.updated_at.label("updated_at"),
                 User.id.label("user_id"),
@@ -295,12 +331,7 @@ class ArticleRepository(IArticleRepository):
                     (Follower.following_id == Article.author_id)
                 )
                 .label("following"),
-                # Subquery for favorites count.
-                select(
-                    func.count(Favorite.article_id)
-                ).where(
-                    Favorite.article_id == Article.id).scalar_subquery()
-                .label("favorites_count"),
+                Article.favorites_count.label("favorites_count"),
                 # Subquery to check if favorited by user with id `user_id`.
                 exists()
                 .where(
@@ -337,9 +368,9 @@ class ArticleRepository(IArticleRepository):
                 Article.slug,
                 Article.title,
                 Article.description,
-                Article.body,
                 Article.created_at,
                 Article.updated_at,
+                Article.favorites_count,
                 User.id,
                 User.username,
                 User.bio,
@@ -354,6 +385,170 @@ class ArticleRepository(IArticleRepository):
         articles = await session.execute(query)
         return [self._to_article_dto(article) for article in articles]
 
+    async def search(
+        self,
+        session: AsyncSession,
+        user_id: int | None,
+        query: str,
+        limit: int,
+        after: tuple[float, int] | None = None,
+    ) -> list[ArticleSearchHitDTO]:
+        if not (match := make_fts_query(query)):
+            return []
+
+        fts_table = literal_column(article_fts.name)
+        rank = func.bm25(fts_table, *SEARCH_RANK_WEIGHTS)
+        # Rank and paginate on the FTS index alone, so that the per-article
+        # subqueries below are evaluated for the returned page only.
+        ranked = (
+            select(article_fts.c.rowid.label("id"), rank.label("rank"))
+            .where(fts_table.match(match))
+            .order_by(rank, article_fts.c.rowid)
+            .limit(limit)
+        )
+        if after is not None:
+            # Keyset pagination: continue right after the last returned hit.
+            ranked = ranked.where(tuple_(rank, article_fts.c.rowid) > tuple_(*after))
+        ranked = ranked.subquery("ranked")
+
+        stmt = (
+            # fmt: off
+            select(
+                Article.id.label("id"),
+                Article.author_id.label("author_id"),
+                Article.slug.label("slug"),
+                Article.title.label("title"),
+                Article.description.label("description"),
+                Article.body.label("body"),
+                Article.created_at.label("created_at"),
+                Article.updated_at.label("updated_at"),
+                User.username.label("username"),
+                User.bio.label("bio"),
+                User.image_url.label("image_url"),
+                exists()
+                .where(
+                    (Follower.follower_id == user_id) &
+                    (Follower.following_id == Article.author_id)
+                )
+                .label("following"),
+                Article.favorites_count.label("favorites_count"),
+                # Subquery to check if favorited by user with id `user_id`.
+                exists()
+                .where(
+                    (Favorite.user_id == user_id) &
+                    (Favorite.article_id == Article.id)
+                )
+                .label("favorited"),
+                # Concatenate tags of the matched article only.
+                select(
+                    func.group_concat(Tag.tag, ", ")
+                ).join(
+                    ArticleTag, ArticleTag.tag_id == Tag.id
+                ).where(
+                    ArticleTag.article_id == Article.id
+                ).scalar_subquery()
+                .label("tags"),
+                ranked.c.rank,
+                func.snippet(
+                    fts_table, -1, "<mark>", "</mark>", "…", SEARCH_SNIPPET_TOKENS
+                ).label("snippet"),
+            )
+            .select_from(ranked)
+            # Snippets need the MATCH context, the rowid lookup keeps it cheap.
+            .join(article_fts, article_fts.c.rowid == ranked.c.id)
+            .join(Article, Article.id == ranked.c.id)
+            .join(User, User.id == Article.author_id)
+            .where(fts_table.match(match))
+            .order_by(ranked.c.rank, ranked.c.id)
+            # fmt: on
+        )
+        hits = await session.execute(stmt)
+        return [
+            ArticleSearchHitDTO(
+                article=self._to_article_dto(hit), snippet=hit.snippet, rank=hit.rank
+            )
+            for hit in hits
+        ]
+
+    async def stream_by_filters(
+        self,
+        session: AsyncSession,
+        user_id: int | None,
+        tag: str | None = None,
+        author: str | None = None,
+        favorited: str | None = None,
+        since: datetime | None = None,
+    ) -> AsyncIterator[ArticleDTO]:
+        stmt = (
+            # fmt: off
+            select(
+                Article.id.label("id"),
+                Article.author_id.label("author_id"),
+                Article.slug.label("slug"),
+                Article.title.label("title"),
+                Article.description.label("description"),
+                Article.body.label("body"),
+                Article.created_at.label("created_at"),
+                Article.updated_at.label("updated_at"),
+                User.username.label("username"),
+                User.bio.label("bio"),
+                User.image_url.label("image_url"),
+                exists()
+                .where(
+                    (Follower.follower_id == user_id) &
+                    (Follower.following_id == Article.author_id)
+                )
+                .label("following"),
+                Article.favorites_count.label("favorites_count"),
+                # Subquery to check if favorited by user with id `user_id`.
+                exists()
+                .where(
+                    (Favorite.user_id == user_id) &
+                    (Favorite.article_id == Article.id)
+                )
+                .label("favorited"),
+                # Concatenate tags of the current article only.
+                select(
+                    func.group_concat(Tag.tag, ", ")
+                ).join(
+                    ArticleTag, ArticleTag.tag_id == Tag.id
+                ).where(
+                    ArticleTag.article_id == Article.id
+                ).scalar_subquery()
+                .label("tags"),
+            )
+            .join(User, User.id == Article.author_id)
+            # Oldest changes first, so that a consumer can resume with `since`.
+            .order_by(Article.updated_at, Article.id)
+            # fmt: on
+        )
+        if tag:
+            stmt = stmt.where(
+                exists().where(
+                    (ArticleTag.article_id == Article.id)
+                    & (ArticleTag.tag_id == Tag.id)
+                    & (Tag.tag == tag)
+                )
+            )
+        if author:
+            stmt = stmt.where(User.username == author)
+        if favorited:
+            # The outer query already selects the author from `User`.
+            favorited_by = aliased(User)
+            stmt = stmt.where(
+                exists().where(
+                    (FavoriteAlias.article_id == Article.id)
+                    & (FavoriteAlias.user_id == favorited_by.id)
+                    & (favorited_by.username == favorited)
+                )
+            )
+        if since:
+            stmt = stmt.where(Article.updated_at > since)
+
+        rows = await session.stream(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        async for row in rows:
+            yield self._to_article_dto(row)
+
     async def count_by_followings(self, session: AsyncSession, user_id: int) -> int:
         query = select(count(Article.id)).join(
             Follower,
@@ -365,6 +560,25 @@ class ArticleRepository(IArticleRepository):
         result = await session.execute(query)
         return result.scalar()
 
+    async def count_by_timeline(self, session: AsyncSession, user_id: int) -> int:
+        pushed = (
+            select(Timeline.article_id)
+            .join(Article, Article.id == Timeline.article_id)
+            .where(Timeline.user_id == user_id)
+        )
+        pulled = (
+            select(Article.id)
+            .join(TimelineFanIn, TimelineFanIn.author_id == Article.author_id)
+            .join(
+                Follower,
+                (Follower.following_id == Article.author_id)
+                & (Follower.follower_id == user_id),
+            )
+        )
+        query = select(count()).select_from(union(pushed, pulled).subquery())
+        result = await session.execute(query)
+        return result.scalar()
+
     async def count_by_filters(
         self,
         session: AsyncSession,
@@ -411,6 +625,60 @@ class ArticleRepository(IArticleRepository):
         result = await session.execute(query)
         return result.scalar()
 
+    @staticmethod
+    def _feed_query(user_id: int, include_body: bool) -> Select:
+        """
+        Articles of followed authors (rows for `_to_article_dto`), to be
+        filtered down to the feed's articles.
+        """
+        # Without the body, its (possibly overflowing) pages are never read.
+        body = Article.body if include_body else null()
+        return (
+            select(
+                Article.id.label("id"),
+                Article.author_id.label("author_id"),
+                Article.slug.label("slug"),
+                Article.title.label("title"),
+                Article.description.label("description"),
+                body.label("body"),
+                Article.created_at.label("created_at"),
+                Article.updated_at.label("updated_at"),
+                User.id.label("user_id"),
+                User.username.label("username"),
+                User.bio.label("bio"),
+                User.email.label("email"),
+                User.image_url.label("image_url"),
+                true().label("following"),
+                Article.favorites_count.label("favorites_count"),
+                # Subquery to check if favorited by user with id `user_id`.
+                exists()
+                .where(
+                    (Favorite.user_id == user_id) & (Favorite.article_id == Article.id)
+                )
+                .label("favorited"),
+                # Concatenate tags.
+                func.string_agg(Tag.tag, ", ").label("tags"),
+            )
+            .join(User, Article.author_id == User.id)
+            .join(ArticleTag, Article.id == ArticleTag.article_id)
+            .join(Tag, Tag.id == ArticleTag.tag_id)
+            .group_by(
+                Article.id,
+                Article.author_id,
+                Article.slug,
+                Article.title,
+                Article.description,
+                Article.created_at,
+                Article.updated_at,
+                Article.favorites_count,
+                User.id,
+                User.username,
+                User.bio,
+                User.email,
+                User.image_url,
+            )
+        )
+
     @staticmethod
     def _to_article_dto(res: Any) -> ArticleDTO:
         return ArticleDTO(
@@ -1,6 +1,7 @@
+from collections.abc import Collection
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import delete, select, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -8,27 +9,42 @@ from bobverse.domain.dtos.tag import TagDTO
 from bobverse.domain.mapper import IModelMapper
 from bobverse.domain.repositories.article_tag import IArticleTagRepository
 from bobverse.infrastructure.models import ArticleTag, Tag
+from bobverse.infrastructure.popular_tags import PopularTags
+from bobverse.infrastructure.tag_ids import TagIds
 
 
 class ArticleTagRepository(IArticleTagRepository):
     """Repository for Article Tag model."""
 
-    def __init__(self, tag_mapper: IModelMapper[Tag, TagDTO]):
+    def __init__(
+        self,
+        tag_mapper: IModelMapper[Tag, TagDTO],
+        popular_tags: PopularTags | None = None,
+        tag_ids: TagIds | None = None,
+    ):
         self._tag_mapper = tag_mapper
+        self._popular_tags = popular_tags
+        self._tag_ids = tag_ids
 
     async def add_many(
         self, session: AsyncSession, article_id: int, tags: list[str]
     ) -> list[TagDTO]:
-        insert_query = (
-            insert(Tag)
-            .on_conflict_do_nothing()
-            .values([dict(tag=tag, created_at=datetime.now()) for tag in tags])
-        )
-        await session.execute(insert_query)
-
-        select_query = select(Tag).where(Tag.tag.in_(tags))
-        tags = await session.scalars(select_query)
-        tags = [self._tag_mapper.to_dto(tag) for tag in tags]
+        tags = list(dict.fromkeys(tags))
+        created_at = datetime.now()
+        tag_ids = self._tag_ids.get_many(tags) if self._tag_ids is not None else {}
+        if missing := [tag for tag in tags if tag not in tag_ids]:
+            upsert_query = insert(Tag).values(
+                [dict(tag=tag, created_at=created_at) for tag in missing]
+            )
+            # A no-op update rather than DO NOTHING, which would not return the
+            # tags that exist already.
+            upsert_query = upsert_query.on_conflict_do_update(
+                index_elements=[Tag.tag], set_=dict(tag=upsert_query.excluded.tag)
+            ).returning(Tag.tag, Tag.id)
+            upserted_ids = dict((await session.execute(upsert_query)).tuples().all())
+            if self._tag_ids is not None:
+                self._tag_ids.add_on_commit(session=session, ids=upserted_ids)
+            tag_ids |= upserted_ids
 
         link_query = (
             insert(ArticleTag)
@@ -36,23 +52,55 @@ class ArticleTagRepository(IArticleTagRepository):
             .values(
                 [
                     dict(
-                        article_id=article_id, tag_id=tag.id, created_at=datetime.now()
+                        article_id=article_id,
+                        tag_id=tag_ids[tag],
+                        created_at=created_at,
                     )
                     for tag in tags
                 ]
             )
+            .returning(ArticleTag.tag_id)
+        )
+        linked_ids = (await session.execute(link_query)).scalars().all()
+        return await self._add_to_article_counts(
+            session=session, tag_ids=linked_ids, delta=1
+        )
+
+    async def delete_many(self, session: AsyncSession, article_id: int) -> None:
+        query = (
+            delete(ArticleTag)
+            .where(ArticleTag.article_id == article_id)
+            .returning(ArticleTag.tag_id)
+        )
+        unlinked_ids = (await session.execute(query)).scalars().all()
+        await self._add_to_article_counts(
+            session=session, tag_ids=unlinked_ids, delta=-1
         )
-        await session.execute(link_query)
 
+    async def _add_to_article_counts(
+        self, session: AsyncSession, tag_ids: Collection[int], delta: int
+    ) -> list[TagDTO]:
+        if not tag_ids:
+            return []
+        query = (
+            update(Tag)
+            .where(Tag.id.in_(tag_ids))
+            .values(article_count=Tag.article_count + delta)
+            .returning(*self._tag_mapper.columns)
+        )
+        result = await session.execute(query)
+        tags = [self._tag_mapper.from_row(row) for row in result]
+        if self._popular_tags is not None:
+            self._popular_tags.apply_on_commit(session=session, tags=tags)
         return tags
 
     async def list(self, session: AsyncSession, article_id: int) -> list[TagDTO]:
         query = (
-            select(Tag, ArticleTag)
+            select(*self._tag_mapper.columns)
             .where(
                 (ArticleTag.article_id == article_id) & (ArticleTag.tag_id == Tag.id)
             )
             .order_by(Tag.created_at.desc())
         )
-        tags = await session.scalars(query)
-        return [self._tag_mapper.to_dto(tag) for tag in tags]
+        result = await session.execute(query)
+        return [self._tag_mapper.from_row(row) for row in result]
@@ -1,14 +1,25 @@
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import delete, insert, select
+from sqlalchemy import delete, exists, insert, literal, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 from sqlalchemy.sql.functions import count
 
-from bobverse.core.exceptions import CommentNotFoundException
-from bobverse.domain.dtos.comment import CommentRecordDTO, CreateCommentDTO
+from bobverse.core.exceptions import ArticleNotFoundException, CommentNotFoundException
+from bobverse.domain.dtos.comment import (
+    CommentDTO,
+    CommentRecordDTO,
+    CommentsListDTO,
+    CreateCommentDTO,
+)
+from bobverse.domain.dtos.profile import ProfileDTO
 from bobverse.domain.mapper import IModelMapper
 from bobverse.domain.repositories.comment import ICommentRepository
-from bobverse.infrastructure.models import Comment
+from bobverse.infrastructure.models import Article, Comment, Follower, User
+
+# Counts all of the article's comments next to the (paginated) joined rows.
+CommentAlias = aliased(Comment)
 
 
 class CommentRepository(ICommentRepository):
@@ -32,36 +43,162 @@ class CommentRepository(ICommentRepository):
                 created_at=datetime.now(),
                 updated_at=datetime.now(),
             )
-            .returning(Comment)
+            .returning(*self._comment_mapper.columns)
         )
         result = await session.execute(query)
-        return self._comment_mapper.to_dto(result.scalar())
+        return self._comment_mapper.from_row(result.one())
+
+    async def add_by_article_slug(
+        self,
+        session: AsyncSession,
+        author_id: int,
+        slug: str,
+        create_item: CreateCommentDTO,
+    ) -> CommentRecordDTO:
+        now = datetime.now()
+        query = (
+            insert(Comment)
+            .from_select(
+                ["article_id", "author_id", "body", "created_at", "updated_at"],
+                select(
+                    Article.id,
+                    literal(author_id),
+                    literal(create_item.body),
+                    literal(now),
+                    literal(now),
+                ).where(Article.slug == slug),
+            )
+            .returning(*self._comment_mapper.columns)
+        )
+        if not (row := (await session.execute(query)).first()):
+            raise ArticleNotFoundException()
+        return self._comment_mapper.from_row(row)
 
     async def get_or_none(
         self, session: AsyncSession, comment_id: int
     ) -> CommentRecordDTO | None:
-        query = select(Comment).where(Comment.id == comment_id)
-        if comment := await session.scalar(query):
-            return self._comment_mapper.to_dto(comment)
+        query = select(*self._comment_mapper.columns).where(Comment.id == comment_id)
+        if row := (await session.execute(query)).first():
+            return self._comment_mapper.from_row(row)
 
     async def get(self, session: AsyncSession, comment_id: int) -> CommentRecordDTO:
-        query = select(Comment).where(Comment.id == comment_id)
-        if not (comment := await session.scalar(query)):
+        query = select(*self._comment_mapper.columns).where(Comment.id == comment_id)
+        if not (row := (await session.execute(query)).first()):
+            raise CommentNotFoundException()
+        return self._comment_mapper.from_row(row)
+
+    async def get_by_article_slug(
+        self, session: AsyncSession, slug: str, comment_id: int
+    ) -> CommentRecordDTO:
+        query = (
+            # The comment columns come first so that `from_row` can read them.
+            select(*self._comment_mapper.columns, Article.id.label("found_article_id"))
+            .select_from(Article)
+            .outerjoin(
+                Comment, (Comment.article_id == Article.id) & (Comment.id == comment_id)
+            )
+            .where(Article.slug == slug)
+        )
+        if not (row := (await session.execute(query)).first()):
+            raise ArticleNotFoundException()
+        if row.id is None:
             raise CommentNotFoundException()
-        return self._comment_mapper.to_dto(comment)
+        return self._comment_mapper.from_row(row)
 
     async def list(
         self, session: AsyncSession, article_id: int
     ) -> list[CommentRecordDTO]:
-        query = select(Comment).where(Comment.article_id == article_id)
-        comments = await session.scalars(query)
-        return [self._comment_mapper.to_dto(comment) for comment in comments]
+        query = select(*self._comment_mapper.columns).where(
+            Comment.article_id == article_id
+        )
+        result = await session.execute(query)
+        return [self._comment_mapper.from_row(row) for row in result]
+
+    async def list_with_authors(
+        self,
+        session: AsyncSession,
+        slug: str,
+        user_id: int | None,
+        limit: int | None = None,
+        after: tuple[datetime, int] | None = None,
+    ) -> CommentsListDTO:
+        # The article is outer-joined so that a missing article (no rows) can be
+        # told apart from an article without comments (a single all-NULL row).
+        on_clause = Comment.article_id == Article.id
+        if after:
+            on_clause &= tuple_(Comment.created_at, Comment.id) > after
+        query = (
+            select(
+                Comment.id,
+                Comment.body,
+                Comment.created_at,
+                Comment.updated_at,
+                User.id.label("user_id"),
+                User.username,
+                User.bio,
+                User.image_url,
+                exists()
+                .where(
+                    (Follower.follower_id == user_id)
+                    & (Follower.following_id == Comment.author_id)
+                )
+                .label("following"),
+                select(count(CommentAlias.id))
+                .where(CommentAlias.article_id == Article.id)
+                .scalar_subquery()
+                .label("comments_count"),
+            )
+            .select_from(Article)
+            .outerjoin(Comment, on_clause)
+            .outerjoin(User, User.id == Comment.author_id)
+            .where(Article.slug == slug)
+            .order_by(Comment.created_at, Comment.id)
+            .limit(limit)
+        )
+        rows = (await session.execute(query)).all()
+        if not rows:
+            raise ArticleNotFoundException()
+        return CommentsListDTO(
+            comments=[self._to_comment_dto(row) for row in rows if row.id is not None],
+            comments_count=rows[0].comments_count,
+        )
 
     async def delete(self, session: AsyncSession, comment_id: int) -> None:
         query = delete(Comment).where(Comment.id == comment_id)
         await session.execute(query)
 
+    async def delete_by_article_slug(
+        self, session: AsyncSession, slug: str, comment_id: int, author_id: int
+    ) -> bool:
+        query = (
+            delete(Comment)
+            .where(
+                (Comment.id == comment_id)
+                & (Comment.author_id == author_id)
+                & Comment.article_id.in_(select(Article.id).where(Article.slug == slug))
+            )
+            .returning(Comment.id)
+        )
+        result = await session.execute(query)
+        return result.scalar() is not None
+
     async def count(self, session: AsyncSession, article_id: int) -> int:
         query = select(count(Comment.id)).where(Comment.article_id == article_id)
         result = await session.execute(query)
         return result.scalar()
+
+    @staticmethod
+    def _to_comment_dto(row: Any) -> CommentDTO:
+        return CommentDTO(
+            id=row.id,
+            body=row.body,
+            author=ProfileDTO(
+                user_id=row.user_id,
+                username=row.username,
+                bio=row.bio,
+                image=row.image_url,
+                following=row.following,
+            ),
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
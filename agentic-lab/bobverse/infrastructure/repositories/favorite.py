@@ -1,11 +1,13 @@
 from datetime import datetime
 
-from sqlalchemy import delete, exists, insert, select
+from sqlalchemy import delete, exists, literal, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.functions import count
 
 from bobverse.domain.repositories.favorite import IFavoriteRepository
-from bobverse.infrastructure.models import Favorite
+from bobverse.infrastructure.models import Article, Favorite
+from bobverse.infrastructure.repositories.article import select_article_id_by_slug
 
 
 class FavoriteRepository(IFavoriteRepository):
@@ -27,18 +29,39 @@ class FavoriteRepository(IFavoriteRepository):
         result = await session.execute(query)
         return result.scalar()
 
-    async def create(
-        self, session: AsyncSession, article_id: int, user_id: int
-    ) -> None:
-        query = insert(Favorite).values(
-            user_id=user_id, article_id=article_id, created_at=datetime.now()
+    async def create_by_slug(
+        self, session: AsyncSession, slug: str, user_id: int
+    ) -> int | None:
+        """
+        Favorite the article, returning its id; None if there is no such
+        article, or it is favorited already.
+        """
+        query = (
+            insert(Favorite)
+            .from_select(
+                ["user_id", "article_id", "created_at"],
+                select(literal(user_id), Article.id, literal(datetime.now())).where(
+                    Article.id == select_article_id_by_slug(slug=slug).scalar_subquery()
+                ),
+            )
+            .on_conflict_do_nothing()
+            .returning(Favorite.article_id)
         )
-        await session.execute(query)
+        result = await session.execute(query)
+        return result.scalar()
 
-    async def delete(
-        self, session: AsyncSession, article_id: int, user_id: int
-    ) -> None:
-        query = delete(Favorite).where(
-            Favorite.user_id == user_id, Favorite.article_id == article_id
+    async def delete_by_slug(
+        self, session: AsyncSession, slug: str, user_id: int
+    ) -> int | None:
+        """
+        Unfavorite the article, returning its id; None if there is no such
+        article, or it is not favorited.
+        """
+        article_id = select_article_id_by_slug(slug=slug).scalar_subquery()
+        query = (
+            delete(Favorite)
+            .where(Favorite.user_id == user_id, Favorite.article_id == article_id)
+            .returning(Favorite.article_id)
         )
-        await session.execute(query)
+        result = await session.execute(query)
+        return result.scalar()
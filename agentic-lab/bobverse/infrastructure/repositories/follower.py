@@ -1,10 +1,16 @@
+from collections.abc import Collection
 from datetime import datetime
 
-from sqlalchemy import delete, exists, insert, select
+from sqlalchemy import delete, event, exists, insert, select
+from sqlalchemy.dialects.postgresql import insert as upsert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from bobverse.domain.repositories.follower import IFollowerRepository
-from bobverse.infrastructure.models import Follower
+from bobverse.infrastructure.follower_graph import FollowerGraph
+from bobverse.infrastructure.models import Follower, FollowerChange
+
+_PENDING_CHANGES_KEY = "pending_follower_changes"
 
 
 class FollowerRepository(IFollowerRepository):
@@ -24,6 +30,41 @@ class FollowerRepository(IFollowerRepository):
         result = await session.execute(query)
         return result.scalar()
 
+    async def create_many(
+        self, session: AsyncSession, follower_id: int, following_ids: list[int]
+    ) -> list[int]:
+        query = (
+            upsert(Follower)
+            .values(
+                [
+                    dict(
+                        follower_id=follower_id,
+                        following_id=following_id,
+                        created_at=datetime.now(),
+                    )
+                    for following_id in following_ids
+                ]
+            )
+            .on_conflict_do_nothing()
+            .returning(Follower.following_id)
+        )
+        result = await session.execute(query)
+        return list(result.scalars())
+
+    async def delete_many(
+        self, session: AsyncSession, follower_id: int, following_ids: list[int]
+    ) -> list[int]:
+        query = (
+            delete(Follower)
+            .where(
+                Follower.follower_id == follower_id,
+                Follower.following_id.in_(following_ids),
+            )
+            .returning(Follower.following_id)
+        )
+        result = await session.execute(query)
+        return list(result.scalars())
+
     async def list(
         self, session: AsyncSession, follower_id: int, following_ids: list[int]
     ) -> list[int]:
@@ -36,18 +77,149 @@ class FollowerRepository(IFollowerRepository):
 
     async def create(
         self, session: AsyncSession, follower_id: int, following_id: int
-    ) -> None:
-        query = insert(Follower).values(
-            follower_id=follower_id,
-            following_id=following_id,
-            created_at=datetime.now(),
+    ) -> bool:
+        query = (
+            upsert(Follower)
+            .values(
+                follower_id=follower_id,
+                following_id=following_id,
+                created_at=datetime.now(),
+            )
+            .on_conflict_do_nothing()
+            .returning(Follower.following_id)
         )
-        await session.execute(query)
+        result = await session.execute(query)
+        return result.first() is not None
 
     async def delete(
         self, session: AsyncSession, follower_id: int, following_id: int
+    ) -> bool:
+        query = (
+            delete(Follower)
+            .where(
+                Follower.follower_id == follower_id,
+                Follower.following_id == following_id,
+            )
+            .returning(Follower.following_id)
+        )
+        result = await session.execute(query)
+        return result.first() is not None
+
+
+class CachedFollowerRepository(IFollowerRepository):
+    """
+    Repository for Follower model answering following checks from an in-memory
+    `FollowerGraph`. Follows and unfollows are also written to the change log,
+    and applied to the graph once their transaction commits.
+    """
+
+    def __init__(self, graph: FollowerGraph) -> None:
+        self._graph = graph
+        self._repository = FollowerRepository()
+
+    async def exists(
+        self, session: AsyncSession, follower_id: int, following_id: int
+    ) -> bool:
+        pending = self._pending_changes(session)
+        if (following := pending.get((follower_id, following_id))) is not None:
+            return following
+        await self._graph.sync(session)
+        return self._graph.follows(follower_id, following_id)
+
+    async def create_many(
+        self, session: AsyncSession, follower_id: int, following_ids: list[int]
+    ) -> list[int]:
+        created_ids = await self._repository.create_many(
+            session=session, follower_id=follower_id, following_ids=following_ids
+        )
+        await self._log_changes(session, follower_id, created_ids, following=True)
+        return created_ids
+
+    async def delete_many(
+        self, session: AsyncSession, follower_id: int, following_ids: list[int]
+    ) -> list[int]:
+        deleted_ids = await self._repository.delete_many(
+            session=session, follower_id=follower_id, following_ids=following_ids
+        )
+        await self._log_changes(session, follower_id, deleted_ids, following=False)
+        return deleted_ids
+
+    async def list(
+        self, session: AsyncSession, follower_id: int, following_ids: list[int]
+    ) -> list[int]:
+        await self._graph.sync(session)
+        pending = self._pending_changes(session)
+        return [
+            following_id
+            for following_id in following_ids
+            if pending.get(
+                (follower_id, following_id),
+                self._graph.follows(follower_id, following_id),
+            )
+        ]
+
+    async def create(
+        self, session: AsyncSession, follower_id: int, following_id: int
+    ) -> bool:
+        if created := await self._repository.create(
+            session=session, follower_id=follower_id, following_id=following_id
+        ):
+            await self._log_changes(
+                session, follower_id, [following_id], following=True
+            )
+        return created
+
+    async def delete(
+        self, session: AsyncSession, follower_id: int, following_id: int
+    ) -> bool:
+        if deleted := await self._repository.delete(
+            session=session, follower_id=follower_id, following_id=following_id
+        ):
+            await self._log_changes(
+                session, follower_id, [following_id], following=False
+            )
+        return deleted
+
+    async def _log_changes(
+        self,
+        session: AsyncSession,
+        follower_id: int,
+        following_ids: Collection[int],
+        following: bool,
     ) -> None:
-        query = delete(Follower).where(
-            Follower.follower_id == follower_id, Follower.following_id == following_id
+        if not following_ids:
+            return
+        query = insert(FollowerChange).values(
+            [
+                dict(
+                    follower_id=follower_id,
+                    following_id=following_id,
+                    following=following,
+                    created_at=datetime.now(),
+                )
+                for following_id in following_ids
+            ]
         )
         await session.execute(query)
+        await self._graph.prune(session)
+        pending = self._pending_changes(session)
+        for following_id in following_ids:
+            pending[(follower_id, following_id)] = following
+
+    def _pending_changes(self, session: AsyncSession) -> dict[tuple[int, int], bool]:
+        """
+        Changes made in the session's transaction, so far visible to it only.
+        """
+        if (pending := session.info.get(_PENDING_CHANGES_KEY)) is not None:
+            return pending
+        changes: dict[tuple[int, int], bool] = {}
+        session.info[_PENDING_CHANGES_KEY] = changes
+
+        def apply(_: Session) -> None:
+            for (follower_id, following_id), following in changes.items():
+                self._graph.apply(follower_id, following_id, following)
+            changes.clear()
+
+        event.listen(session.sync_session, "after_commit", apply)
+        event.listen(session.sync_session, "after_rollback", lambda _: changes.clear())
+        return changes
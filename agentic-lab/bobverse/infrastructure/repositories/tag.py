@@ -5,15 +5,44 @@ from bobverse.domain.dtos.tag import TagDTO
 from bobverse.domain.mapper import IModelMapper
 from bobverse.domain.repositories.tag import ITagRepository
 from bobverse.infrastructure.models import Tag
+from bobverse.infrastructure.popular_tags import PopularTags
 
 
 class TagRepository(ITagRepository):
     """Repository for Tag model."""
 
-    def __init__(self, tag_mapper: IModelMapper[Tag, TagDTO]):
+    def __init__(
+        self,
+        tag_mapper: IModelMapper[Tag, TagDTO],
+        popular_tags: PopularTags | None = None,
+    ):
         self._tag_mapper = tag_mapper
+        self._popular_tags = popular_tags
 
-    async def list(self, session: AsyncSession) -> list[TagDTO]:
-        query = select(Tag)
-        tags = await session.scalars(query)
-        return [self._tag_mapper.to_dto(tag) for tag in tags]
+    async def list_popular(self, session: AsyncSession, limit: int) -> list[TagDTO]:
+        popular_tags = self._popular_tags
+        if popular_tags is None or limit > popular_tags.size:
+            return await self._list_popular(session=session, limit=limit)
+        if popular_tags.stale:
+            popular_tags.load(
+                await self._list_popular(session=session, limit=popular_tags.size)
+            )
+        return popular_tags.top(limit)
+
+    async def _list_popular(self, session: AsyncSession, limit: int) -> list[TagDTO]:
+        # Tags of no article (any more) are left out.
+        query = (
+            select(*self._tag_mapper.columns)
+            .where(Tag.article_count > 0)
+            .order_by(Tag.article_count.desc(), Tag.id.desc())
+            .limit(limit)
+        )
+        result = await session.execute(query)
+        return [self._tag_mapper.from_row(row) for row in result]
+
+    async def list(
+        self, session: AsyncSession, limit: int | None = None
+    ) -> list[TagDTO]:
+        query = select(*self._tag_mapper.columns).order_by(Tag.tag).limit(limit)
+        result = await session.execute(query)
+        return [self._tag_mapper.from_row(row) for row in result]
@@ -0,0 +1,126 @@
+import datetime
+
+from sqlalchemy import Executable, delete, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.functions import count
+
+from bobverse.domain.repositories.timeline import ITimelineRepository
+from bobverse.infrastructure.models import Article, Follower, Timeline, TimelineFanIn
+
+
+def rebuild_statements(celebrity_threshold: int, limit: int) -> list[Executable]:
+    """
+    Statements rebuilding every timeline from the current follows: authors
+    with more followers than `celebrity_threshold` are marked for fan-in, and
+    the followers of the others get their latest `limit` articles, as a new
+    follower does.
+    """
+    fan_in_authors = (
+        select(Follower.following_id, func.now())
+        .group_by(Follower.following_id)
+        .having(count() > celebrity_threshold)
+    )
+    latest_articles = select(
+        Article.id,
+        Article.author_id,
+        Article.created_at,
+        func.row_number()
+        .over(partition_by=Article.author_id, order_by=Article.created_at.desc())
+        .label("position"),
+    ).subquery()
+    timelines = (
+        select(Follower.follower_id, latest_articles.c.id, latest_articles.c.created_at)
+        .join(latest_articles, latest_articles.c.author_id == Follower.following_id)
+        .where(
+            latest_articles.c.position <= limit,
+            Follower.following_id.not_in(select(TimelineFanIn.author_id)),
+        )
+    )
+    return [
+        delete(Timeline),
+        delete(TimelineFanIn),
+        insert(TimelineFanIn).from_select(["author_id", "created_at"], fan_in_authors),
+        insert(Timeline).from_select(
+            ["user_id", "article_id", "created_at"], timelines
+        ),
+    ]
+
+
+class TimelineRepository(ITimelineRepository):
+    """Repository for Timeline and TimelineFanIn models."""
+
+    async def count_followers(
+        self, session: AsyncSession, author_id: int, limit: int
+    ) -> int:
+        # Stops counting at `limit`: only whether an author is past the
+        # celebrity threshold matters, not by how much.
+        followers = (
+            select(Follower.follower_id)
+            .where(Follower.following_id == author_id)
+            .limit(limit)
+            .subquery()
+        )
+        result = await session.execute(select(count()).select_from(followers))
+        return result.scalar()
+
+    async def add_for_followers(
+        self,
+        session: AsyncSession,
+        author_id: int,
+        article_id: int,
+        created_at: datetime.datetime,
+    ) -> None:
+        query = (
+            insert(Timeline)
+            .from_select(
+                ["user_id", "article_id", "created_at"],
+                select(
+                    Follower.follower_id, literal(article_id), literal(created_at)
+                ).where(Follower.following_id == author_id),
+            )
+            .on_conflict_do_nothing()
+        )
+        await session.execute(query)
+
+    async def add_fan_in_author(self, session: AsyncSession, author_id: int) -> None:
+        query = (
+            insert(TimelineFanIn)
+            .values(author_id=author_id, created_at=datetime.datetime.now())
+            .on_conflict_do_nothing()
+        )
+        await session.execute(query)
+
+    async def backfill(
+        self, session: AsyncSession, user_id: int, author_id: int, limit: int
+    ) -> None:
+        # The author's latest `limit` articles, for a new follower.
+        query = (
+            insert(Timeline)
+            .from_select(
+                ["user_id", "article_id", "created_at"],
+                select(literal(user_id), Article.id, Article.created_at)
+                .where(Article.author_id == author_id)
+                .order_by(Article.created_at.desc())
+                .limit(limit),
+            )
+            .on_conflict_do_nothing()
+        )
+        await session.execute(query)
+
+    async def trim(self, session: AsyncSession, user_id: int, author_id: int) -> None:
+        query = delete(Timeline).where(
+            Timeline.user_id == user_id,
+            Timeline.article_id.in_(
+                select(Article.id).where(Article.author_id == author_id)
+            ),
+        )
+        await session.execute(query)
+
+    async def rebuild(
+        self, session: AsyncSession, celebrity_threshold: int, limit: int
+    ) -> None:
+        for query in rebuild_statements(
+            celebrity_threshold=celebrity_threshold, limit=limit
+        ):
+            await session.execute(query)
@@ -1,10 +1,11 @@
 from collections.abc import Collection
 from datetime import datetime
 
-from sqlalchemy import insert, select, update
+from sqlalchemy import ColumnElement, func, insert, or_, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bobverse.core.exceptions import UserNotFoundException
+from bobverse.core.utils.search import make_prefix_upper_bound
 from bobverse.domain.dtos.user import CreateUserDTO, UpdateUserDTO, UserDTO
 from bobverse.domain.mapper import IModelMapper
 from bobverse.domain.repositories.user import IUserRepository
@@ -29,54 +30,91 @@ class UserRepository(IUserRepository):
                 bio="",
                 created_at=datetime.now(),
             )
-            .returning(User)
+            .returning(*self._user_mapper.columns)
         )
         result = await session.execute(query)
-        return self._user_mapper.to_dto(result.scalar())
+        return self._user_mapper.from_row(result.one())
 
     async def get_by_email_or_none(
         self, session: AsyncSession, email: str
     ) -> UserDTO | None:
-        query = select(User).where(User.email == email)
-        if user := await session.scalar(query):
-            return self._user_mapper.to_dto(user)
+        query = select(*self._user_mapper.columns).where(User.email == email)
+        if row := (await session.execute(query)).first():
+            return self._user_mapper.from_row(row)
 
     async def get_by_email(self, session: AsyncSession, email: str) -> UserDTO:
-        query = select(User).where(User.email == email)
-        if not (user := await session.scalar(query)):
+        query = select(*self._user_mapper.columns).where(User.email == email)
+        if not (row := (await session.execute(query)).first()):
             raise UserNotFoundException()
-        return self._user_mapper.to_dto(user)
+        return self._user_mapper.from_row(row)
 
     async def get_or_none(self, session: AsyncSession, user_id: int) -> UserDTO | None:
-        query = select(User).where(User.id == user_id)
-        if user := await session.scalar(query):
-            return self._user_mapper.to_dto(user)
+        query = select(*self._user_mapper.columns).where(User.id == user_id)
+        if row := (await session.execute(query)).first():
+            return self._user_mapper.from_row(row)
 
     async def get(self, session: AsyncSession, user_id: int) -> UserDTO:
-        query = select(User).where(User.id == user_id)
-        if not (user := await session.scalar(query)):
+        query = select(*self._user_mapper.columns).where(User.id == user_id)
+        if not (row := (await session.execute(query)).first()):
             raise UserNotFoundException()
-        return self._user_mapper.to_dto(user)
+        return self._user_mapper.from_row(row)
 
     async def list_by_users(
         self, session: AsyncSession, user_ids: Collection[int]
     ) -> list[UserDTO]:
-        query = select(User).where(User.id.in_(user_ids))
-        users = await session.scalars(query)
-        return [self._user_mapper.to_dto(user) for user in users]
+        query = select(*self._user_mapper.columns).where(User.id.in_(user_ids))
+        result = await session.execute(query)
+        return [self._user_mapper.from_row(row) for row in result]
+
+    async def list_by_usernames(
+        self, session: AsyncSession, usernames: Collection[str]
+    ) -> list[UserDTO]:
+        query = select(*self._user_mapper.columns).where(User.username.in_(usernames))
+        result = await session.execute(query)
+        return [self._user_mapper.from_row(row) for row in result]
 
     async def get_by_username_or_none(
         self, session: AsyncSession, username: str
     ) -> UserDTO | None:
-        query = select(User).where(User.username == username)
-        if user := await session.scalar(query):
-            return self._user_mapper.to_dto(user)
+        query = select(*self._user_mapper.columns).where(User.username == username)
+        if row := (await session.execute(query)).first():
+            return self._user_mapper.from_row(row)
 
     async def get_by_username(self, session: AsyncSession, username: str) -> UserDTO:
-        query = select(User).where(User.username == username)
-        if not (user := await session.scalar(query)):
+        query = select(*self._user_mapper.columns).where(User.username == username)
+        if not (row := (await session.execute(query)).first()):
             raise UserNotFoundException()
-        return self._user_mapper.to_dto(user)
+        return self._user_mapper.from_row(row)
+
+    async def search_by_prefix(
+        self,
+        session: AsyncSession,
+        prefix: str,
+        limit: int,
+        after: tuple[str, int] | None = None,
+    ) -> list[UserDTO]:
+        # Half-open ranges over the lower-cased expression indexes instead of
+        # `LIKE`, so that SQLite can seek the `ix_user_*_lower` indexes.
+        upper_bound = make_prefix_upper_bound(prefix)
+        username = func.lower(User.username)
+        email = func.lower(User.email)
+
+        def starts_with_prefix(column: ColumnElement[str]) -> ColumnElement[bool]:
+            if upper_bound is None:
+                return column >= prefix
+            return (column >= prefix) & (column < upper_bound)
+
+        query = (
+            select(*self._user_mapper.columns)
+            .where(or_(starts_with_prefix(username), starts_with_prefix(email)))
+            .order_by(username, User.id)
+            .limit(limit)
+        )
+        if after is not None:
+            query = query.where(tuple_(username, User.id) > tuple_(*after))
+
+        result = await session.execute(query)
+        return [self._user_mapper.from_row(row) for row in result]
 
     async def update(
         self, session: AsyncSession, user_id: int, update_item: UpdateUserDTO
@@ -85,7 +123,7 @@ class UserRepository(IUserRepository):
             update(User)
             .where(User.id == user_id)
             .values(updated_at=datetime.now())
-            .returning(User)
+            .returning(*self._user_mapper.columns)
         )
         if update_item.username is not None:
             query = query.values(username=update_item.username)
@@ -99,7 +137,7 @@ class UserRepository(IUserRepository):
             query = query.values(image_url=update_item.image_url)
 
         result = await session.execute(query)
-        return self._user_mapper.to_dto(result.scalar())
+        return self._user_mapper.from_row(result.one())
         
     # CWE-89: SQL Injection
     async def search_users_by_keyword(self, session: AsyncSession, keyword: str) -> list[UserDTO]:
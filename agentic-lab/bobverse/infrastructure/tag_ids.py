@@ -0,0 +1,60 @@
+"""
+In-memory map of tag names to ids, so tagging an article with tags a worker
+has seen before skips the tag upsert.
+
+A tag's id never changes and tags are never deleted, so a cached id never goes
+stale. Ids are only remembered once the transaction that read them commits; a
+rolled-back transaction may have created the tag itself. The `max_size` most
+recently used tags are kept.
+"""
+
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+__all__ = ["TagIds"]
+
+_PENDING_TAG_IDS_KEY = "pending_tag_ids"
+
+
+class TagIds:
+    def __init__(self, max_size: int = 10_000) -> None:
+        self.max_size = max_size
+        self._ids: OrderedDict[str, int] = OrderedDict()
+
+    def get_many(self, tags: Iterable[str]) -> dict[str, int]:
+        """Ids of the given tags, for those cached."""
+        found = {}
+        for tag in tags:
+            if (tag_id := self._ids.get(tag)) is not None:
+                self._ids.move_to_end(tag)
+                found[tag] = tag_id
+        return found
+
+    def add(self, ids: dict[str, int]) -> None:
+        self._ids.update(ids)
+        for tag in ids:
+            self._ids.move_to_end(tag)
+        while len(self._ids) > self.max_size:
+            self._ids.popitem(last=False)
+
+    def add_on_commit(self, session: AsyncSession, ids: dict[str, int]) -> None:
+        """Remember the ids once the session's transaction commits."""
+        self._pending_ids(session).update(ids)
+
+    def _pending_ids(self, session: AsyncSession) -> dict[str, int]:
+        if (pending := session.info.get(_PENDING_TAG_IDS_KEY)) is not None:
+            return pending
+        ids: dict[str, int] = {}
+        session.info[_PENDING_TAG_IDS_KEY] = ids
+
+        def add(_: Session) -> None:
+            self.add(ids)
+            ids.clear()
+
+        event.listen(session.sync_session, "after_commit", add)
+        event.listen(session.sync_session, "after_rollback", lambda _: ids.clear())
+        return ids
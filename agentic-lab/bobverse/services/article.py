@@ -1,17 +1,19 @@
-from dataclasses import asdict
+import datetime
+from collections.abc import AsyncIterator
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bobverse.core.exceptions import (
-    ArticleAlreadyFavoritedException,
-    ArticleNotFavoritedException,
     ArticlePermissionException,
+    InvalidCursorException,
 )
+from bobverse.core.utils.cursor import decode_cursor, encode_cursor
 from bobverse.domain.dtos.article import (
     ArticleAuthorDTO,
     ArticleDTO,
     ArticleRecordDTO,
     ArticlesFeedDTO,
+    ArticlesSearchDTO,
     CreateArticleDTO,
     UpdateArticleDTO,
 )
@@ -20,6 +22,8 @@ from bobverse.domain.dtos.user import UserDTO
 from bobverse.domain.repositories.article import IArticleRepository
 from bobverse.domain.repositories.article_tag import IArticleTagRepository
 from bobverse.domain.repositories.favorite import IFavoriteRepository
+from bobverse.domain.repositories.favorite_buffer import IFavoriteBuffer
+from bobverse.domain.repositories.timeline import ITimelineRepository
 from bobverse.domain.services.article import IArticleService
 from bobverse.domain.services.profile import IProfileService
 
@@ -33,11 +37,19 @@ class ArticleService(IArticleService):
         article_tag_repo: IArticleTagRepository,
         favorite_repo: IFavoriteRepository,
         profile_service: IProfileService,
+        timeline_repo: ITimelineRepository | None = None,
+        timeline_celebrity_threshold: int = 0,
+        favorite_buffer: IFavoriteBuffer | None = None,
     ) -> None:
         self._article_repo = article_repo
         self._article_tag_repo = article_tag_repo
         self._favorite_repo = favorite_repo
         self._profile_service = profile_service
+        # Home feeds are read from materialized timelines when set.
+        self._timeline_repo = timeline_repo
+        self._timeline_celebrity_threshold = timeline_celebrity_threshold
+        # Favorites are recorded here and written in batches when set.
+        self._favorite_buffer = favorite_buffer
 
     async def create_new_article(
         self, session: AsyncSession, author_id: int, article_to_create: CreateArticleDTO
@@ -52,8 +64,12 @@ class ArticleService(IArticleService):
             await self._article_tag_repo.add_many(
                 session=session, article_id=article.id, tags=article_to_create.tags
             )
-        return ArticleDTO(
-            **asdict(article),
+        if self._timeline_repo is not None:
+            await self._fan_out_article(
+                session=session, article=article, timeline_repo=self._timeline_repo
+            )
+        return ArticleDTO.from_record(
+            record=article,
             author=ArticleAuthorDTO(
                 username=profile.username,
                 bio=profile.bio,
@@ -87,6 +103,11 @@ class ArticleService(IArticleService):
         if article.author_id != current_user.id:
             raise ArticlePermissionException()
 
+        # Unlinks the tags (and updates their counts) rather than relying on
+        # ON DELETE CASCADE, which SQLite only honours with foreign keys on.
+        await self._article_tag_repo.delete_many(
+            session=session, article_id=article.id
+        )
         await self._article_repo.delete_by_slug(session=session, slug=slug)
 
     async def update_article_by_slug(
@@ -157,6 +178,7 @@ class ArticleService(IArticleService):
         tag: str | None = None,
         author: str | None = None,
         favorited: str | None = None,
+        include_body: bool = True,
     ) -> ArticlesFeedDTO:
         articles = await self._article_repo.list_by_filters_v2(
             session=session,
@@ -166,11 +188,17 @@ class ArticleService(IArticleService):
             tag=tag,
             author=author,
             favorited=favorited,
+            include_body=include_body,
         )
         articles_count = await self._article_repo.count_by_filters(
             session=session, tag=tag, author=author, favorited=favorited
         )
-        return ArticlesFeedDTO(articles=articles, articles_count=articles_count)
+        return ArticlesFeedDTO(
+            articles=self._with_buffered_favorites(
+                articles=articles, user_id=current_user.id if current_user else None
+            ),
+            articles_count=articles_count,
+        )
 
     async def get_articles_feed(
         self, session: AsyncSession, current_user: UserDTO, limit: int, offset: int
@@ -198,53 +226,234 @@ class ArticleService(IArticleService):
         )
 
     async def get_articles_feed_v2(
-        self, session: AsyncSession, current_user: UserDTO, limit: int, offset: int
+        self,
+        session: AsyncSession,
+        current_user: UserDTO,
+        limit: int,
+        offset: int,
+        include_body: bool = True,
     ) -> ArticlesFeedDTO:
-        articles = await self._article_repo.list_by_followings_v2(
-            session=session, user_id=current_user.id, limit=limit, offset=offset
+        if self._timeline_repo is not None:
+            articles = await self._article_repo.list_by_timeline(
+                session=session,
+                user_id=current_user.id,
+                limit=limit,
+                offset=offset,
+                include_body=include_body,
+            )
+            articles_count = await self._article_repo.count_by_timeline(
+                session=session, user_id=current_user.id
+            )
+        else:
+            articles = await self._article_repo.list_by_followings_v2(
+                session=session,
+                user_id=current_user.id,
+                limit=limit,
+                offset=offset,
+                include_body=include_body,
+            )
+            articles_count = await self._article_repo.count_by_followings(
+                session=session, user_id=current_user.id
+            )
+        return ArticlesFeedDTO(
+            articles=self._with_buffered_favorites(
+                articles=articles, user_id=current_user.id
+            ),
+            articles_count=articles_count,
         )
-        articles_count = await self._article_repo.count_by_followings(
-            session=session, user_id=current_user.id
+
+    async def search_articles(
+        self,
+        session: AsyncSession,
+        current_user: UserDTO | None,
+        query: str,
+        limit: int,
+        cursor: str | None = None,
+    ) -> ArticlesSearchDTO:
+        after = None
+        if cursor:
+            rank, article_id = decode_cursor(cursor=cursor, size=2)
+            if not isinstance(rank, int | float) or not isinstance(article_id, int):
+                raise InvalidCursorException()
+            after = (rank, article_id)
+
+        # Fetch one extra hit to find out whether there is a next page.
+        hits = await self._article_repo.search(
+            session=session,
+            user_id=current_user.id if current_user else None,
+            query=query,
+            limit=limit + 1,
+            after=after,
+        )
+        next_cursor = None
+        if len(hits) > limit:
+            hits = hits[:limit]
+            next_cursor = encode_cursor(hits[-1].rank, hits[-1].article.id)
+        return ArticlesSearchDTO(hits=hits, next_cursor=next_cursor)
+
+    def export_articles(
+        self,
+        session: AsyncSession,
+        current_user: UserDTO | None,
+        tag: str | None = None,
+        author: str | None = None,
+        favorited: str | None = None,
+        since: datetime.datetime | None = None,
+    ) -> AsyncIterator[ArticleDTO]:
+        return self._article_repo.stream_by_filters(
+            session=session,
+            user_id=current_user.id if current_user else None,
+            tag=tag,
+            author=author,
+            favorited=favorited,
+            since=since,
         )
-        return ArticlesFeedDTO(articles=articles, articles_count=articles_count)
 
     async def add_article_into_favorites(
         self, session: AsyncSession, slug: str, current_user: UserDTO
     ) -> ArticleDTO:
-        article = await self.get_article_by_slug(
-            session=session, slug=slug, current_user=current_user
-        )
-        if article.favorited:
-            raise ArticleAlreadyFavoritedException()
-
-        await self._favorite_repo.create(
-            session=session, article_id=article.id, user_id=current_user.id
-        )
-        return ArticleDTO.with_updated_fields(
-            dto=article,
-            updated_fields=dict(
-                favorited=True, favorites_count=article.favorites_count + 1
-            ),
+        return await self._set_favorited(
+            session=session, slug=slug, current_user=current_user, favorited=True
         )
 
     async def remove_article_from_favorites(
         self, session: AsyncSession, slug: str, current_user: UserDTO
     ) -> ArticleDTO:
-        article = await self.get_article_by_slug(
-            session=session, slug=slug, current_user=current_user
+        return await self._set_favorited(
+            session=session, slug=slug, current_user=current_user, favorited=False
         )
-        if not article.favorited:
-            raise ArticleNotFavoritedException()
 
-        await self._favorite_repo.delete(
-            session=session, article_id=article.id, user_id=current_user.id
+    async def _set_favorited(
+        self,
+        session: AsyncSession,
+        slug: str,
+        current_user: UserDTO,
+        favorited: bool,
+    ) -> ArticleDTO:
+        """
+        Favorite (or unfavorite) an article with a single statement, which
+        tells whether it changed anything; if so, the favorites count is
+        adjusted. Repeating it is harmless.
+        """
+        if self._favorite_buffer is not None:
+            return await self._record_favorited(
+                session=session,
+                slug=slug,
+                current_user=current_user,
+                favorited=favorited,
+                favorite_buffer=self._favorite_buffer,
+            )
+        if favorited:
+            article_id = await self._favorite_repo.create_by_slug(
+                session=session, slug=slug, user_id=current_user.id
+            )
+        else:
+            article_id = await self._favorite_repo.delete_by_slug(
+                session=session, slug=slug, user_id=current_user.id
+            )
+        if article_id is None:
+            # No such article (raised when read), or nothing to change.
+            return await self.get_article_by_slug(
+                session=session, slug=slug, current_user=current_user
+            )
+
+        article = await self._article_repo.add_to_favorites_count(
+            session=session, article_id=article_id, delta=1 if favorited else -1
         )
-        return ArticleDTO.with_updated_fields(
-            dto=article,
-            updated_fields=dict(
-                favorited=False, favorites_count=article.favorites_count - 1
-            ),
+        profile = await self._profile_service.get_profile_by_user_id(
+            session=session, user_id=article.author_id, current_user=current_user
+        )
+        return await self._get_article_info(
+            session=session, article=article, profile=profile, favorited=favorited
+        )
+
+    async def _record_favorited(
+        self,
+        session: AsyncSession,
+        slug: str,
+        current_user: UserDTO,
+        favorited: bool,
+        favorite_buffer: IFavoriteBuffer,
+    ) -> ArticleDTO:
+        """
+        Favorite (or unfavorite) an article through the write-behind buffer:
+        nothing is written before the buffer is flushed.
+        """
+        article = await self._article_repo.get_by_slug(session=session, slug=slug)
+        was_favorited = favorite_buffer.favorited(
+            user_id=current_user.id, article_id=article.id
+        )
+        if was_favorited is None:
+            was_favorited = await self._favorite_repo.exists(
+                session=session, author_id=current_user.id, article_id=article.id
+            )
+        favorite_buffer.record(
+            user_id=current_user.id,
+            article_id=article.id,
+            favorited=favorited,
+            was_favorited=was_favorited,
+        )
+        profile = await self._profile_service.get_profile_by_user_id(
+            session=session, user_id=article.author_id, current_user=current_user
+        )
+        return await self._get_article_info(
+            session=session, article=article, profile=profile, favorited=favorited
+        )
+
+    def _with_buffered_favorites(
+        self, articles: list[ArticleDTO], user_id: int | None
+    ) -> list[ArticleDTO]:
+        """
+        Overlay the favorites not written yet: the user's own, and the counts.
+        """
+        if self._favorite_buffer is None:
+            return articles
+        overlaid = []
+        for article in articles:
+            favorited = (
+                self._favorite_buffer.favorited(user_id=user_id, article_id=article.id)
+                if user_id
+                else None
+            )
+            delta = self._favorite_buffer.count_delta(article_id=article.id)
+            if favorited is not None or delta:
+                article = ArticleDTO.with_updated_fields(
+                    dto=article,
+                    updated_fields=dict(
+                        favorited=article.favorited if favorited is None else favorited,
+                        favorites_count=article.favorites_count + delta,
+                    ),
+                )
+            overlaid.append(article)
+        return overlaid
+
+    async def _fan_out_article(
+        self,
+        session: AsyncSession,
+        article: ArticleRecordDTO,
+        timeline_repo: ITimelineRepository,
+    ) -> None:
+        """
+        Push a new article to the timelines of its author's followers, unless
+        the author has more than the celebrity threshold of them: those
+        authors are marked for fan-in, and their articles are merged into
+        feeds when read.
+        """
+        threshold = self._timeline_celebrity_threshold
+        followers = await timeline_repo.count_followers(
+            session=session, author_id=article.author_id, limit=threshold + 1
         )
+        if followers > threshold:
+            await timeline_repo.add_fan_in_author(
+                session=session, author_id=article.author_id
+            )
+        elif followers:
+            await timeline_repo.add_for_followers(
+                session=session,
+                author_id=article.author_id,
+                article_id=article.id,
+                created_at=article.created_at,
+            )
 
     async def _get_article_info(
         self,
@@ -252,6 +461,7 @@ class ArticleService(IArticleService):
         article: ArticleRecordDTO,
         profile: ProfileDTO,
         user_id: int | None = None,
+        favorited: bool | None = None,
     ) -> ArticleDTO:
         article_tags = [
             tag.tag
@@ -259,18 +469,24 @@ class ArticleService(IArticleService):
                 session=session, article_id=article.id
             )
         ]
-        favorites_count = await self._favorite_repo.count(
-            session=session, article_id=article.id
-        )
-        is_favorited_by_user = (
-            await self._favorite_repo.exists(
-                session=session, author_id=user_id, article_id=article.id
+        favorites_count = article.favorites_count
+        if self._favorite_buffer is not None:
+            favorites_count += self._favorite_buffer.count_delta(article_id=article.id)
+            if favorited is None and user_id:
+                favorited = self._favorite_buffer.favorited(
+                    user_id=user_id, article_id=article.id
+                )
+        # Looked up for `user_id`, unless known already.
+        if favorited is None:
+            favorited = (
+                await self._favorite_repo.exists(
+                    session=session, author_id=user_id, article_id=article.id
+                )
+                if user_id
+                else False
             )
-            if user_id
-            else False
-        )
-        return ArticleDTO(
-            **asdict(article),
+        return ArticleDTO.from_record(
+            record=article,
             author=ArticleAuthorDTO(
                 username=profile.username,
                 bio=profile.bio,
@@ -278,7 +494,7 @@ class ArticleService(IArticleService):
                 following=profile.following,
             ),
             tags=article_tags,
-            favorited=is_favorited_by_user,
+            favorited=favorited,
             favorites_count=favorites_count,
         )
 
@@ -1,31 +1,20 @@
+import datetime
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from bobverse.core.exceptions import CommentPermissionException
-from bobverse.domain.dtos.comment import (
-    CommentDTO,
-    CommentRecordDTO,
-    CommentsListDTO,
-    CreateCommentDTO,
-)
+from bobverse.core.exceptions import CommentPermissionException, InvalidCursorException
+from bobverse.core.utils.cursor import decode_cursor, encode_cursor
+from bobverse.domain.dtos.comment import CommentDTO, CommentsListDTO, CreateCommentDTO
 from bobverse.domain.dtos.profile import ProfileDTO
 from bobverse.domain.dtos.user import UserDTO
-from bobverse.domain.repositories.article import IArticleRepository
 from bobverse.domain.repositories.comment import ICommentRepository
 from bobverse.domain.services.comment import ICommentService
-from bobverse.domain.services.profile import IProfileService
 
 
 class CommentService(ICommentService):
 
-    def __init__(
-        self,
-        article_repo: IArticleRepository,
-        comment_repo: ICommentRepository,
-        profile_service: IProfileService,
-    ) -> None:
-        self._article_repo = article_repo
+    def __init__(self, comment_repo: ICommentRepository) -> None:
         self._comment_repo = comment_repo
-        self._profile_service = profile_service
 
     async def create_article_comment(
         self,
@@ -34,7 +23,6 @@ class CommentService(ICommentService):
         comment_to_create: CreateCommentDTO,
         current_user: UserDTO,
     ) -> CommentDTO:
-        article = await self._article_repo.get_by_slug(session=session, slug=slug)
         profile = ProfileDTO(
             user_id=current_user.id,
             username=current_user.username,
@@ -42,10 +30,10 @@ class CommentService(ICommentService):
             image=current_user.image_url,
             following=False,
         )
-        comment_record_dto = await self._comment_repo.add(
+        comment_record_dto = await self._comment_repo.add_by_article_slug(
             session=session,
             author_id=current_user.id,
-            article_id=article.id,
+            slug=slug,
             create_item=comment_to_create,
         )
         return CommentDTO(
@@ -57,51 +45,55 @@ class CommentService(ICommentService):
         )
 
     async def get_article_comments(
-        self, session: AsyncSession, slug: str, current_user: UserDTO | None = None
+        self,
+        session: AsyncSession,
+        slug: str,
+        current_user: UserDTO | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
     ) -> CommentsListDTO:
-        article = await self._article_repo.get_by_slug(session=session, slug=slug)
-        comment_records = await self._comment_repo.list(
-            session=session, article_id=article.id
-        )
-        profiles_map = await self._get_profiles_mapping(
-            session=session, comments=comment_records, current_user=current_user
+        after = None
+        if cursor:
+            created_at, comment_id = decode_cursor(cursor=cursor, size=2)
+            if not isinstance(created_at, str) or not isinstance(comment_id, int):
+                raise InvalidCursorException()
+            try:
+                after = (datetime.datetime.fromisoformat(created_at), comment_id)
+            except ValueError:
+                raise InvalidCursorException()
+
+        # Fetch one extra comment to find out whether there is a next page.
+        comments_list = await self._comment_repo.list_with_authors(
+            session=session,
+            slug=slug,
+            user_id=current_user.id if current_user else None,
+            limit=limit + 1 if limit else None,
+            after=after,
         )
-        comments = [
-            CommentDTO(
-                id=comment_record_dto.id,
-                body=comment_record_dto.body,
-                author=profiles_map[comment_record_dto.author_id],
-                created_at=comment_record_dto.created_at,
-                updated_at=comment_record_dto.updated_at,
+        comments = comments_list.comments
+        next_cursor = None
+        if limit and len(comments) > limit:
+            comments = comments[:limit]
+            next_cursor = encode_cursor(
+                comments[-1].created_at.isoformat(), comments[-1].id
             )
-            for comment_record_dto in comment_records
-        ]
-        comments_count = await self._comment_repo.count(
-            session=session, article_id=article.id
+        return CommentsListDTO(
+            comments=comments,
+            comments_count=comments_list.comments_count,
+            next_cursor=next_cursor,
         )
-        return CommentsListDTO(comments=comments, comments_count=comments_count)
 
     async def delete_article_comment(
         self, session: AsyncSession, slug: str, comment_id: int, current_user: UserDTO
     ) -> None:
-        # Check if article exists before deleting the comment.
-        await self._article_repo.get_by_slug(session=session, slug=slug)
-
-        comment = await self._comment_repo.get(session=session, comment_id=comment_id)
-        if comment.author_id != current_user.id:
-            raise CommentPermissionException()
-
-        await self._comment_repo.delete(session=session, comment_id=comment_id)
+        deleted = await self._comment_repo.delete_by_article_slug(
+            session=session, slug=slug, comment_id=comment_id, author_id=current_user.id
+        )
+        if deleted:
+            return
 
-    async def _get_profiles_mapping(
-        self,
-        session: AsyncSession,
-        comments: list[CommentRecordDTO],
-        current_user: UserDTO | None,
-    ) -> dict[int, ProfileDTO]:
-        comments_profiles = await self._profile_service.get_profiles_by_user_ids(
-            session=session,
-            user_ids=list({comment.author_id for comment in comments}),
-            current_user=current_user,
+        # Nothing was deleted: find out why only on this (rare) path.
+        await self._comment_repo.get_by_article_slug(
+            session=session, slug=slug, comment_id=comment_id
         )
-        return {profile.user_id: profile for profile in comments_profiles}
+        raise CommentPermissionException()
@@ -1,6 +1,8 @@
 from passlib.context import CryptContext
 import hashlib
 
+from bobverse.core.metrics import PASSWORD_HASH_DURATION, PASSWORD_HASHES_IN_PROGRESS
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
@@ -8,14 +10,18 @@ def get_password_hash(password: str) -> str:
     """
     Convert user password to hash string.
     """
-    return pwd_context.hash(secret=password)
+    with PASSWORD_HASHES_IN_PROGRESS.track_in_progress():
+        with PASSWORD_HASH_DURATION.time(operation="hash"):
+            return pwd_context.hash(secret=password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Check if the user password from request is valid.
     """
-    return pwd_context.verify(secret=plain_password, hash=hashed_password)
+    with PASSWORD_HASHES_IN_PROGRESS.track_in_progress():
+        with PASSWORD_HASH_DURATION.time(operation="verify"):
+            return pwd_context.verify(secret=plain_password, hash=hashed_password)
 
 
 # CWE-327: Weak Cryptography
@@ -2,15 +2,24 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from structlog import get_logger
 
 from bobverse.core.exceptions import (
+    InvalidCursorException,
     OwnProfileFollowingException,
     ProfileAlreadyFollowedException,
     ProfileNotFollowedFollowedException,
     ProfileNotFoundException,
     UserNotFoundException,
 )
-from bobverse.domain.dtos.profile import ProfileDTO
+from bobverse.core.utils.cursor import decode_cursor, encode_cursor
+from bobverse.core.utils.search import lower_ascii
+from bobverse.domain.dtos.profile import (
+    FollowResultDTO,
+    FollowStatus,
+    ProfileDTO,
+    ProfilesListDTO,
+)
 from bobverse.domain.dtos.user import UserDTO
 from bobverse.domain.repositories.follower import IFollowerRepository
+from bobverse.domain.repositories.timeline import ITimelineRepository
 from bobverse.domain.services.profile import IProfileService
 from bobverse.domain.services.user import IUserService
 
@@ -20,9 +29,18 @@ logger = get_logger()
 class ProfileService(IProfileService):
     """Service to handle user profiles and following logic."""
 
-    def __init__(self, user_service: IUserService, follower_repo: IFollowerRepository):
+    def __init__(
+        self,
+        user_service: IUserService,
+        follower_repo: IFollowerRepository,
+        timeline_repo: ITimelineRepository | None = None,
+        timeline_backfill_limit: int = 0,
+    ):
         self._user_service = user_service
         self._follower_repo = follower_repo
+        # Materialized timelines are kept in step with follows when set.
+        self._timeline_repo = timeline_repo
+        self._timeline_backfill_limit = timeline_backfill_limit
 
     async def get_profile_by_username(
         self, session: AsyncSession, username: str, current_user: UserDTO | None = None
@@ -32,7 +50,7 @@ class ProfileService(IProfileService):
                 session=session, username=username
             )
         except UserNotFoundException:
-            logger.exception("Profile not found", username=username)
+            logger.info("Profile not found", username=username)
             raise ProfileNotFoundException()
 
         profile = ProfileDTO(
@@ -95,39 +113,223 @@ class ProfileService(IProfileService):
             for user_dto in target_users
         ]
 
+    async def search_profiles(
+        self,
+        session: AsyncSession,
+        query: str,
+        limit: int,
+        current_user: UserDTO | None,
+        cursor: str | None = None,
+    ) -> ProfilesListDTO:
+        if not (prefix := lower_ascii(query.strip())):
+            return ProfilesListDTO(profiles=[])
+
+        after = None
+        if cursor:
+            username, user_id = decode_cursor(cursor=cursor, size=2)
+            if not isinstance(username, str) or not isinstance(user_id, int):
+                raise InvalidCursorException()
+            after = (username, user_id)
+
+        # Fetch one extra user to find out whether there is a next page.
+        target_users = await self._user_service.search_users_by_prefix(
+            session=session, prefix=prefix, limit=limit + 1, after=after
+        )
+        next_cursor = None
+        if len(target_users) > limit:
+            target_users = target_users[:limit]
+            last_user = target_users[-1]
+            next_cursor = encode_cursor(lower_ascii(last_user.username), last_user.id)
+
+        following_user_ids = (
+            set(
+                await self._follower_repo.list(
+                    session=session,
+                    follower_id=current_user.id,
+                    following_ids=[user.id for user in target_users],
+                )
+            )
+            if current_user and target_users
+            else set()
+        )
+        profiles = [
+            ProfileDTO(
+                user_id=user_dto.id,
+                username=user_dto.username,
+                bio=user_dto.bio,
+                image=user_dto.image_url,
+                following=user_dto.id in following_user_ids,
+            )
+            for user_dto in target_users
+        ]
+        return ProfilesListDTO(profiles=profiles, next_cursor=next_cursor)
+
     async def follow_user(
         self, session: AsyncSession, username: str, current_user: UserDTO
-    ) -> None:
+    ) -> ProfileDTO:
         if username == current_user.username:
             raise OwnProfileFollowingException()
 
         target_user = await self._user_service.get_user_by_username(
             session=session, username=username
         )
-        if await self._follower_repo.exists(
-            session, follower_id=current_user.id, following_id=target_user.id
+        if not await self._follower_repo.create(
+            session=session, follower_id=current_user.id, following_id=target_user.id
         ):
             raise ProfileAlreadyFollowedException()
 
-        await self._follower_repo.create(
-            session=session, follower_id=current_user.id, following_id=target_user.id
-        )
+        if self._timeline_repo is not None:
+            await self._timeline_repo.backfill(
+                session=session,
+                user_id=current_user.id,
+                author_id=target_user.id,
+                limit=self._timeline_backfill_limit,
+            )
+        return self._to_profile(user=target_user, following=True)
 
     async def unfollow_user(
         self, session: AsyncSession, username: str, current_user: UserDTO
-    ) -> None:
+    ) -> ProfileDTO:
         if username == current_user.username:
             raise OwnProfileFollowingException()
 
         target_user = await self._user_service.get_user_by_username(
             session=session, username=username
         )
-        if not await self._follower_repo.exists(
-            session, follower_id=current_user.id, following_id=target_user.id
+        if not await self._follower_repo.delete(
+            session=session, follower_id=current_user.id, following_id=target_user.id
         ):
-            logger.exception("User not followed", username=username)
+            logger.info("User not followed", username=username)
             raise ProfileNotFollowedFollowedException()
 
-        await self._follower_repo.delete(
-            session=session, follower_id=current_user.id, following_id=target_user.id
+        if self._timeline_repo is not None:
+            await self._timeline_repo.trim(
+                session=session, user_id=current_user.id, author_id=target_user.id
+            )
+        return self._to_profile(user=target_user, following=False)
+
+    async def follow_users(
+        self, session: AsyncSession, usernames: list[str], current_user: UserDTO
+    ) -> list[FollowResultDTO]:
+        """
+        Follow every given user at once: one query resolves the usernames and
+        one multi-row insert creates the missing follows.
+        """
+        target_users = await self._get_follow_targets(
+            session=session, usernames=usernames, current_user=current_user
+        )
+        target_ids = [user.id for user in target_users.values() if user]
+        followed_ids = (
+            await self._follower_repo.create_many(
+                session=session, follower_id=current_user.id, following_ids=target_ids
+            )
+            if target_ids
+            else []
+        )
+        if self._timeline_repo is not None:
+            for user_id in followed_ids:
+                await self._timeline_repo.backfill(
+                    session=session,
+                    user_id=current_user.id,
+                    author_id=user_id,
+                    limit=self._timeline_backfill_limit,
+                )
+        return self._follow_results(
+            target_users=target_users,
+            current_user=current_user,
+            following=True,
+            changed_ids=set(followed_ids),
+            changed_status=FollowStatus.followed,
+            unchanged_status=FollowStatus.already_followed,
+        )
+
+    async def unfollow_users(
+        self, session: AsyncSession, usernames: list[str], current_user: UserDTO
+    ) -> list[FollowResultDTO]:
+        """
+        Unfollow every given user at once: one query resolves the usernames and
+        one delete removes the existing follows.
+        """
+        target_users = await self._get_follow_targets(
+            session=session, usernames=usernames, current_user=current_user
+        )
+        target_ids = [user.id for user in target_users.values() if user]
+        unfollowed_ids = (
+            await self._follower_repo.delete_many(
+                session=session, follower_id=current_user.id, following_ids=target_ids
+            )
+            if target_ids
+            else []
+        )
+        if self._timeline_repo is not None:
+            for user_id in unfollowed_ids:
+                await self._timeline_repo.trim(
+                    session=session, user_id=current_user.id, author_id=user_id
+                )
+        return self._follow_results(
+            target_users=target_users,
+            current_user=current_user,
+            following=False,
+            changed_ids=set(unfollowed_ids),
+            changed_status=FollowStatus.unfollowed,
+            unchanged_status=FollowStatus.not_followed,
+        )
+
+    async def _get_follow_targets(
+        self, session: AsyncSession, usernames: list[str], current_user: UserDTO
+    ) -> dict[str, UserDTO | None]:
+        """
+        Map every distinct username, in request order, to its user (None when
+        there is no such user, or it is the current user).
+        """
+        usernames = list(dict.fromkeys(usernames))
+        others = [
+            username for username in usernames if username != current_user.username
+        ]
+        users = (
+            await self._user_service.get_users_by_usernames(
+                session=session, usernames=others
+            )
+            if others
+            else []
+        )
+        users_by_username = {user.username: user for user in users}
+        return {username: users_by_username.get(username) for username in usernames}
+
+    def _follow_results(
+        self,
+        target_users: dict[str, UserDTO | None],
+        current_user: UserDTO,
+        following: bool,
+        changed_ids: set[int],
+        changed_status: str,
+        unchanged_status: str,
+    ) -> list[FollowResultDTO]:
+        results = []
+        for username, user in target_users.items():
+            if username == current_user.username:
+                results.append(
+                    FollowResultDTO(username=username, status=FollowStatus.own_profile)
+                )
+            elif user is None:
+                results.append(
+                    FollowResultDTO(username=username, status=FollowStatus.not_found)
+                )
+            else:
+                # Either way, the user ends up (un)followed.
+                profile = self._to_profile(user=user, following=following)
+                status = changed_status if user.id in changed_ids else unchanged_status
+                results.append(
+                    FollowResultDTO(username=username, status=status, profile=profile)
+                )
+        return results
+
+    @staticmethod
+    def _to_profile(user: UserDTO, following: bool) -> ProfileDTO:
+        return ProfileDTO(
+            user_id=user.id,
+            username=user.username,
+            bio=user.bio,
+            image=user.image_url,
+            following=following,
         )
@@ -11,5 +11,10 @@ class TagService(ITagService):
     def __init__(self, tag_repo: ITagRepository):
         self._tag_repo = tag_repo
 
-    async def get_all_tags(self, session: AsyncSession) -> list[TagDTO]:
-        return await self._tag_repo.list(session=session)
+    async def get_all_tags(
+        self, session: AsyncSession, limit: int | None = None
+    ) -> list[TagDTO]:
+        return await self._tag_repo.list(session=session, limit=limit)
+
+    async def get_popular_tags(self, session: AsyncSession, limit: int) -> list[TagDTO]:
+        return await self._tag_repo.list_popular(session=session, limit=limit)
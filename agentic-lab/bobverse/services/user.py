@@ -53,6 +53,24 @@ class UserService(IUserService):
     ) -> list[UserDTO]:
         return await self._user_repo.list_by_users(session=session, user_ids=user_ids)
 
+    async def get_users_by_usernames(
+        self, session: AsyncSession, usernames: Collection[str]
+    ) -> list[UserDTO]:
+        return await self._user_repo.list_by_usernames(
+            session=session, usernames=usernames
+        )
+
+    async def search_users_by_prefix(
+        self,
+        session: AsyncSession,
+        prefix: str,
+        limit: int,
+        after: tuple[str, int] | None = None,
+    ) -> list[UserDTO]:
+        return await self._user_repo.search_by_prefix(
+            session=session, prefix=prefix, limit=limit, after=after
+        )
+
     async def update_user(
         self,
         session: AsyncSession,
@@ -255,6 +255,9 @@ async def seed_initial_data(initial_date: datetime.datetime | None = None):
                 session=session,
                 slug=article_slug,
                 current_user=user)
+            if article.body is None:
+                # only listed articles come without their body.
+                continue
             replaced_body = replace_with_slugs(article.body, slug_by_name)
             if article.body != replaced_body:
                 update_article = UpdateArticleDTO(
@@ -0,0 +1,30 @@
+"""
+Rebuild the materialized home feeds (`timeline`) from the current follows.
+
+Timelines are only written while `TIMELINE_ENABLED` is on: run this when
+turning it on for a database that already has follows and articles, before
+serving with it (otherwise home feeds come out empty).
+
+Usage:
+    python rebuild_timelines.py
+"""
+
+import asyncio
+
+from bobverse.core.config import get_app_settings
+from bobverse.core.container import container
+from bobverse.infrastructure.repositories.timeline import TimelineRepository
+
+
+async def main() -> None:
+    settings = get_app_settings()
+    async with container.context_session() as session:
+        await TimelineRepository().rebuild(
+            session=session,
+            celebrity_threshold=settings.timeline_celebrity_threshold,
+            limit=settings.timeline_backfill_limit,
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,9 +1,15 @@
+import json
+import sqlite3
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bobverse.api.schemas.responses.article import ArticleResponse
-from bobverse.domain.dtos.article import ArticleDTO
+from bobverse.core.config import get_app_settings
+from bobverse.core.dependencies import IArticleService
+from bobverse.core.utils.slug import get_slug_unique_part
+from bobverse.domain.dtos.article import ArticleDTO, CreateArticleDTO
 from bobverse.infrastructure.repositories.article import ArticleRepository
 from bobverse.infrastructure.repositories.user import UserRepository
 from tests.utils import create_another_test_article, create_another_test_user
@@ -159,3 +165,219 @@ async def test_user_can_delete_own_article(
 
     response = await authorized_test_client.get(url=f"/articles/{test_article.slug}")
     assert response.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_user_can_search_articles(
+    test_client: AsyncClient, test_article: ArticleDTO
+) -> None:
+    response = await test_client.get(url="/articles/search", params={"q": "test art"})
+    assert response.status_code == 200
+
+    articles = response.json()["articles"]
+    assert [article["slug"] for article in articles] == [test_article.slug]
+    assert "<mark>" in articles[0]["snippet"]
+    assert set(articles[0]["tagList"]) == set(test_article.tags)
+
+
+@pytest.mark.anyio
+async def test_search_does_not_return_deleted_articles(
+    authorized_test_client: AsyncClient, test_article: ArticleDTO
+) -> None:
+    response = await authorized_test_client.delete(url=f"/articles/{test_article.slug}")
+    assert response.status_code == 204
+
+    response = await authorized_test_client.get(
+        url="/articles/search", params={"q": "test"}
+    )
+    assert response.json()["articles"] == []
+
+
+@pytest.mark.anyio
+async def test_search_articles_paginates_with_cursor(
+    authorized_test_client: AsyncClient,
+) -> None:
+    for title in ("Bob modes one", "Bob modes two", "Bob modes three"):
+        await authorized_test_client.post(
+            url="/articles",
+            json={
+                "article": {
+                    "title": title,
+                    "body": "body",
+                    "description": "description",
+                    "tagList": [],
+                }
+            },
+        )
+
+    slugs: list[str] = []
+    params = {"q": "modes", "limit": 2}
+    while True:
+        response = await authorized_test_client.get(
+            url="/articles/search", params=params
+        )
+        page = response.json()
+        slugs.extend(article["slug"] for article in page["articles"])
+        if not page["nextCursor"]:
+            break
+        params["cursor"] = page["nextCursor"]
+
+    assert len(slugs) == len(set(slugs)) == 3
+
+
+@pytest.mark.anyio
+async def test_search_articles_with_invalid_cursor(test_client: AsyncClient) -> None:
+    response = await test_client.get(
+        url="/articles/search", params={"q": "test", "cursor": "not-a-cursor"}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_user_can_export_articles_as_ndjson(
+    test_client: AsyncClient,
+    test_article: ArticleDTO,
+    session: AsyncSession,
+    user_repository: UserRepository,
+    article_repository: ArticleRepository,
+) -> None:
+    another_user = await create_another_test_user(
+        session=session, user_repository=user_repository
+    )
+    another_article = await create_another_test_article(
+        session=session,
+        article_repository=article_repository,
+        author_id=another_user.id,
+    )
+    await session.commit()
+
+    response = await test_client.get(url="/articles/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    articles = [json.loads(line) for line in response.text.splitlines()]
+    assert [article["slug"] for article in articles] == [
+        test_article.slug,
+        another_article.slug,
+    ]
+    assert articles[1]["author"]["username"] == another_user.username
+    assert sorted(articles[0]["tagList"]) == ["tag1", "tag2"]
+
+    response = await test_client.get(
+        url="/articles/export", params={"author": another_user.username}
+    )
+    assert [json.loads(line)["slug"] for line in response.text.splitlines()] == [
+        another_article.slug
+    ]
+
+    response = await test_client.get(
+        url="/articles/export", params={"since": articles[0]["updatedAt"]}
+    )
+    assert [json.loads(line)["slug"] for line in response.text.splitlines()] == [
+        another_article.slug
+    ]
+
+
+@pytest.mark.anyio
+async def test_user_can_favorite_and_unfavorite_article_idempotently(
+    authorized_test_client: AsyncClient, test_article: ArticleDTO
+) -> None:
+    url = f"/articles/{test_article.slug}/favorite"
+    for _ in range(2):
+        response = await authorized_test_client.post(url=url)
+        assert response.status_code == 200
+        assert response.json()["article"]["favorited"] is True
+        assert response.json()["article"]["favoritesCount"] == 1
+
+    for _ in range(2):
+        response = await authorized_test_client.delete(url=url)
+        assert response.status_code == 200
+        assert response.json()["article"]["favorited"] is False
+        assert response.json()["article"]["favoritesCount"] == 0
+
+
+@pytest.mark.anyio
+async def test_user_can_favorite_article_by_slug_with_outdated_title(
+    authorized_test_client: AsyncClient, test_article: ArticleDTO
+) -> None:
+    slug = f"outdated-title-{get_slug_unique_part(slug=test_article.slug)}"
+    url = f"/articles/{slug}/favorite"
+    response = await authorized_test_client.post(url=url)
+    assert response.status_code == 200
+    assert response.json()["article"]["slug"] == test_article.slug
+    assert response.json()["article"]["favorited"] is True
+    assert response.json()["article"]["favoritesCount"] == 1
+
+    response = await authorized_test_client.delete(url=url)
+    assert response.status_code == 200
+    assert response.json()["article"]["favorited"] is False
+    assert response.json()["article"]["favoritesCount"] == 0
+
+
+@pytest.mark.anyio
+async def test_user_can_not_favorite_not_existing_article(
+    authorized_test_client: AsyncClient,
+) -> None:
+    url = "/articles/not-existing-article-slug/favorite"
+    response = await authorized_test_client.post(url=url)
+    assert response.status_code == 404
+    response = await authorized_test_client.delete(url=url)
+    assert response.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_fast_json_article_responses_match_response_models(
+    monkeypatch: pytest.MonkeyPatch,
+    authorized_test_client: AsyncClient,
+    test_article: ArticleDTO,
+) -> None:
+    settings = get_app_settings()
+    url = f"/articles/{test_article.slug}"
+
+    monkeypatch.setattr(settings, "fast_json_responses", True)
+    fast_response = await authorized_test_client.post(url=f"{url}/favorite")
+    fast_article = (await authorized_test_client.get(url=url)).json()
+
+    monkeypatch.setattr(settings, "fast_json_responses", False)
+    model_article = (await authorized_test_client.get(url=url)).json()
+
+    assert fast_response.headers["content-type"] == "application/json"
+    assert fast_response.json() == fast_article
+    assert fast_article == model_article
+    assert fast_article["article"]["favoritesCount"] == 1
+    assert fast_article["article"]["createdAt"].endswith("Z")
+
+
+@pytest.mark.anyio
+@pytest.mark.skipif(
+    sqlite3.sqlite_version_info < (3, 44, 0),
+    reason="Article list queries use string_agg, added in SQLite 3.44.",
+)
+async def test_lite_article_lists_leave_out_bodies(
+    authorized_test_client: AsyncClient,
+    test_article: ArticleDTO,
+    session: AsyncSession,
+    user_repository: UserRepository,
+    article_service: IArticleService,
+) -> None:
+    another_user = await create_another_test_user(
+        session=session, user_repository=user_repository
+    )
+    await article_service.create_new_article(
+        session=session,
+        author_id=another_user.id,
+        article_to_create=CreateArticleDTO(
+            title="Followed", description="desc", body="long body", tags=["tag"]
+        ),
+    )
+    await session.commit()
+    await authorized_test_client.post(url=f"/profiles/{another_user.username}/follow")
+
+    for url in ("/articles", "/articles/feed"):
+        response = await authorized_test_client.get(url=url)
+        assert all("body" in article for article in response.json()["articles"])
+
+        response = await authorized_test_client.get(url=url, params={"lite": True})
+        articles = response.json()["articles"]
+        assert articles
+        assert all("body" not in article for article in articles)
+        assert all(article["title"] for article in articles)
@@ -0,0 +1,131 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bobverse.domain.dtos.article import ArticleDTO
+from bobverse.domain.dtos.comment import CreateCommentDTO
+from bobverse.domain.dtos.user import UserDTO
+from bobverse.infrastructure.repositories.comment import CommentRepository
+from bobverse.infrastructure.repositories.user import UserRepository
+from tests.utils import create_another_test_user
+
+
+@pytest.mark.anyio
+async def test_user_can_create_and_list_comments(
+    authorized_test_client: AsyncClient, test_article: ArticleDTO, test_user: UserDTO
+) -> None:
+    response = await authorized_test_client.post(
+        url=f"/articles/{test_article.slug}/comments",
+        json={"comment": {"body": "first!"}},
+    )
+    assert response.status_code == 200
+
+    response = await authorized_test_client.get(
+        url=f"/articles/{test_article.slug}/comments"
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["commentsCount"] == 1
+    assert data["nextCursor"] is None
+    assert data["comments"][0]["body"] == "first!"
+    assert data["comments"][0]["author"] == {
+        "username": test_user.username,
+        "bio": test_user.bio,
+        "image": test_user.image_url,
+        "following": False,
+    }
+
+
+@pytest.mark.anyio
+async def test_comments_are_paginated_with_cursor(
+    authorized_test_client: AsyncClient, test_article: ArticleDTO
+) -> None:
+    url = f"/articles/{test_article.slug}/comments"
+    for body in ("one", "two", "three"):
+        await authorized_test_client.post(url=url, json={"comment": {"body": body}})
+
+    bodies: list[str] = []
+    cursor = None
+    while True:
+        params = {"limit": 2} | ({"cursor": cursor} if cursor else {})
+        response = await authorized_test_client.get(url=url, params=params)
+        data = response.json()
+        assert data["commentsCount"] == 3
+        bodies.extend(comment["body"] for comment in data["comments"])
+        if not (cursor := data["nextCursor"]):
+            break
+
+    assert bodies == ["one", "two", "three"]
+
+
+@pytest.mark.anyio
+async def test_comments_list_rejects_invalid_cursor(
+    test_client: AsyncClient, test_article: ArticleDTO
+) -> None:
+    response = await test_client.get(
+        url=f"/articles/{test_article.slug}/comments", params={"cursor": "bogus"}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_comments_of_unknown_article_are_not_found(
+    authorized_test_client: AsyncClient,
+) -> None:
+    url = "/articles/missing-article-abc123/comments"
+    response = await authorized_test_client.get(url=url)
+    assert response.status_code == 404
+
+    response = await authorized_test_client.post(
+        url=url, json={"comment": {"body": "hello"}}
+    )
+    assert response.status_code == 404
+
+    response = await authorized_test_client.delete(url=f"{url}/1")
+    assert response.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_user_can_delete_own_comment(
+    authorized_test_client: AsyncClient, test_article: ArticleDTO
+) -> None:
+    url = f"/articles/{test_article.slug}/comments"
+    response = await authorized_test_client.post(
+        url=url, json={"comment": {"body": "to be deleted"}}
+    )
+    comment_id = response.json()["comment"]["id"]
+
+    response = await authorized_test_client.delete(url=f"{url}/{comment_id}")
+    assert response.status_code == 204
+
+    response = await authorized_test_client.delete(url=f"{url}/{comment_id}")
+    assert response.status_code == 404
+
+    response = await authorized_test_client.get(url=url)
+    assert response.json()["commentsCount"] == 0
+    assert response.json()["comments"] == []
+
+
+@pytest.mark.anyio
+async def test_user_cannot_delete_comment_of_another_user(
+    authorized_test_client: AsyncClient,
+    test_article: ArticleDTO,
+    session: AsyncSession,
+    user_repository: UserRepository,
+    comment_repository: CommentRepository,
+) -> None:
+    another_user = await create_another_test_user(
+        session=session, user_repository=user_repository
+    )
+    comment = await comment_repository.add(
+        session=session,
+        author_id=another_user.id,
+        article_id=test_article.id,
+        create_item=CreateCommentDTO(body="not yours"),
+    )
+    await session.commit()
+
+    response = await authorized_test_client.delete(
+        url=f"/articles/{test_article.slug}/comments/{comment.id}"
+    )
+    assert response.status_code == 403
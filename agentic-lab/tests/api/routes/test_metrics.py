@@ -0,0 +1,24 @@
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.anyio
+async def test_metrics_expose_route_latency(test_client: AsyncClient) -> None:
+    await test_client.get("/tags")
+
+    response = await test_client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    lines = response.text.splitlines()
+    assert "# TYPE bobverse_http_request_duration_seconds histogram" in lines
+    assert any(
+        line.startswith(
+            "bobverse_http_request_duration_seconds_count"
+            '{method="GET",route="/api/tags",status="200"}'
+        )
+        for line in lines
+    )
+    assert "bobverse_http_requests_in_flight 1" in lines
+    assert any(
+        line.startswith("bobverse_db_pool_checkout_seconds_count") for line in lines
+    )
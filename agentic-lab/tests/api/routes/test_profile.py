@@ -1,9 +1,11 @@
+import sys
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bobverse.api.schemas.responses.profile import ProfileResponse
-from bobverse.domain.dtos.user import UserDTO
+from bobverse.domain.dtos.user import CreateUserDTO, UserDTO
 from bobverse.infrastructure.repositories.user import UserRepository
 from tests.utils import create_another_test_user
 
@@ -149,6 +151,79 @@ async def test_authenticated_user_can_unfollow_already_unfollowed_profile(
     assert response.status_code == 400
 
 
+@pytest.mark.anyio
+async def test_authenticated_user_can_follow_many_profiles(
+    authorized_test_client: AsyncClient,
+    test_user: UserDTO,
+    user_repository: UserRepository,
+    session: AsyncSession,
+) -> None:
+    new_user = await create_another_test_user(
+        session=session, user_repository=user_repository
+    )
+    usernames = [new_user.username, "missing-user", test_user.username]
+    response = await authorized_test_client.post(
+        url="/profiles/follow", json={"usernames": usernames + [new_user.username]}
+    )
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["username"] for result in results] == usernames
+    assert [result["status"] for result in results] == [
+        "followed",
+        "not_found",
+        "own_profile",
+    ]
+    assert results[0]["profile"]["following"] is True
+    assert results[1]["profile"] is None
+
+    response = await authorized_test_client.post(
+        url="/profiles/follow", json={"usernames": [new_user.username]}
+    )
+    assert response.json()["results"][0]["status"] == "already_followed"
+
+    response = await authorized_test_client.get(url=f"/profiles/{new_user.username}")
+    assert response.json()["profile"]["following"] is True
+
+
+@pytest.mark.anyio
+async def test_authenticated_user_can_unfollow_many_profiles(
+    authorized_test_client: AsyncClient,
+    user_repository: UserRepository,
+    session: AsyncSession,
+) -> None:
+    new_user = await create_another_test_user(
+        session=session, user_repository=user_repository
+    )
+    response = await authorized_test_client.post(
+        url=f"/profiles/{new_user.username}/follow"
+    )
+    assert response.status_code == 200
+
+    payload = {"usernames": [new_user.username]}
+    response = await authorized_test_client.request(
+        method="DELETE", url="/profiles/follow", json=payload
+    )
+    assert response.status_code == 200
+    result = response.json()["results"][0]
+    assert result["status"] == "unfollowed"
+    assert result["profile"]["following"] is False
+
+    response = await authorized_test_client.request(
+        method="DELETE", url="/profiles/follow", json=payload
+    )
+    assert response.json()["results"][0]["status"] == "not_followed"
+
+
+@pytest.mark.anyio
+async def test_bulk_follow_rejects_empty_usernames(
+    authorized_test_client: AsyncClient,
+) -> None:
+    response = await authorized_test_client.post(
+        url="/profiles/follow", json={"usernames": []}
+    )
+    assert response.status_code == 422
+
+
 @pytest.mark.parametrize(
     "api_method, api_path",
     (
@@ -165,3 +240,98 @@ async def test_user_can_not_retrieve_not_existing_profile(
         method=api_method, url=api_path.format(username="not-existing-username")
     )
     assert response.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_user_can_search_profiles_by_username_prefix(
+    authorized_test_client: AsyncClient,
+    user_repository: UserRepository,
+    session: AsyncSession,
+) -> None:
+    new_user = await create_another_test_user(
+        session=session, user_repository=user_repository
+    )
+    await authorized_test_client.post(url=f"/profiles/{new_user.username}/follow")
+
+    response = await authorized_test_client.get(
+        url="/profiles/search", params={"q": "TEMP-"}
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "profiles": [
+            {
+                "username": new_user.username,
+                "bio": new_user.bio,
+                "image": new_user.image_url,
+                "following": True,
+            }
+        ],
+        "nextCursor": None,
+    }
+
+
+@pytest.mark.anyio
+async def test_user_can_search_profiles_by_email_prefix(
+    test_client: AsyncClient, test_user: UserDTO
+) -> None:
+    response = await test_client.get(
+        url="/profiles/search", params={"q": test_user.email[:6]}
+    )
+    profiles = response.json()["profiles"]
+    assert [profile["username"] for profile in profiles] == [test_user.username]
+    assert not profiles[0]["following"]
+
+
+@pytest.mark.anyio
+async def test_user_can_search_profiles_by_non_ascii_prefix(
+    test_client: AsyncClient, user_repository: UserRepository, session: AsyncSession
+) -> None:
+    user = await user_repository.add(
+        session=session,
+        create_item=CreateUserDTO(
+            username="Élise", email="elise@gmail.com", password="password"
+        ),
+    )
+    response = await test_client.get(url="/profiles/search", params={"q": "Él"})
+    assert [profile["username"] for profile in response.json()["profiles"]] == [
+        user.username
+    ]
+
+
+@pytest.mark.anyio
+async def test_search_profiles_by_last_code_point_prefix(
+    test_client: AsyncClient,
+) -> None:
+    response = await test_client.get(
+        url="/profiles/search", params={"q": chr(sys.maxunicode)}
+    )
+    assert response.status_code == 200
+    assert response.json()["profiles"] == []
+
+
+@pytest.mark.anyio
+async def test_search_profiles_paginates_with_cursor(
+    test_client: AsyncClient,
+    test_user: UserDTO,
+    user_repository: UserRepository,
+    session: AsyncSession,
+) -> None:
+    await create_another_test_user(session=session, user_repository=user_repository)
+
+    response = await test_client.get(
+        url="/profiles/search", params={"q": "te", "limit": 1}
+    )
+    first_page = response.json()
+    assert len(first_page["profiles"]) == 1
+    assert first_page["nextCursor"]
+
+    response = await test_client.get(
+        url="/profiles/search",
+        params={"q": "te", "limit": 1, "cursor": first_page["nextCursor"]},
+    )
+    second_page = response.json()
+    assert second_page["nextCursor"] is None
+    assert {
+        first_page["profiles"][0]["username"],
+        second_page["profiles"][0]["username"],
+    } == {test_user.username, "temp-user"}
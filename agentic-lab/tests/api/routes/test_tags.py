@@ -18,3 +18,47 @@ async def test_list_of_tags_when_article_with_tags_exists(
     response_tags = response.json()["tags"]
     assert len(response_tags) == len(set(test_article.tags))
     assert all(tag in test_article.tags for tag in response_tags)
+
+
+@pytest.mark.anyio
+async def test_popular_tags_are_ordered_by_article_count(
+    authorized_test_client: AsyncClient, test_article: ArticleDTO
+) -> None:
+    response = await authorized_test_client.post(
+        url="/articles",
+        json={
+            "article": {
+                "title": "Another Article",
+                "description": "Description",
+                "body": "Body",
+                "tagList": ["tag2", "tag3"],
+            }
+        },
+    )
+    slug = response.json()["article"]["slug"]
+
+    response = await authorized_test_client.get(
+        url="/tags", params={"order": "popular", "limit": 2}
+    )
+    assert response.json()["tags"][0] == "tag2"
+    assert len(response.json()["tags"]) == 2
+
+    await authorized_test_client.delete(url=f"/articles/{slug}")
+    response = await authorized_test_client.get(
+        url="/tags", params={"order": "popular"}
+    )
+    assert set(response.json()["tags"]) == {"tag1", "tag2"}
+
+
+@pytest.mark.anyio
+async def test_tags_are_listed_by_name_up_to_limit(
+    authorized_test_client: AsyncClient, test_article: ArticleDTO
+) -> None:
+    response = await authorized_test_client.get(url="/tags", params={"limit": 1})
+    assert response.json() == {"tags": ["tag1"]}
+
+
+@pytest.mark.anyio
+async def test_unknown_tags_order_is_rejected(test_client: AsyncClient) -> None:
+    response = await test_client.get(url="/tags", params={"order": "newest"})
+    assert response.status_code == 422
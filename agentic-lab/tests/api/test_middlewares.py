@@ -0,0 +1,179 @@
+import asyncio
+import gzip
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import brotli
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+from structlog.testing import capture_logs
+
+from bobverse.api.middlewares import CompressionMiddleware, ProfilingMiddleware
+from bobverse.core.container import Container
+from bobverse.core.settings.base import BaseAppSettings
+from bobverse.domain.dtos.article import ArticleDTO
+from bobverse.infrastructure.models import User
+
+LARGE_PAYLOAD = {"body": "lorem ipsum dolor sit amet " * 200}
+
+
+async def large_json(request: Request) -> Response:
+    return JSONResponse(LARGE_PAYLOAD)
+
+
+async def small_json(request: Request) -> Response:
+    return JSONResponse({"ok": True})
+
+
+async def image(request: Request) -> Response:
+    return Response(b"\x89PNG" * 1000, media_type="image/png")
+
+
+async def ndjson(request: Request) -> Response:
+    async def lines() -> AsyncIterator[str]:
+        for number in range(100):
+            yield f'{{"line": {number}}}\n'
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@pytest.fixture
+def compression_middleware() -> CompressionMiddleware:
+    app = Starlette(
+        routes=[
+            Route("/large", large_json),
+            Route("/small", small_json),
+            Route("/image", image),
+            Route("/ndjson", ndjson),
+        ]
+    )
+    return CompressionMiddleware(app=app, minimum_size=1024)
+
+
+@pytest.fixture
+async def client(compression_middleware: CompressionMiddleware) -> AsyncClient:
+    async with AsyncClient(
+        app=compression_middleware, base_url="http://test"
+    ) as client:
+        yield client
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("encoding", ["gzip", "br"])
+async def test_large_responses_are_compressed(
+    client: AsyncClient, encoding: str
+) -> None:
+    response = await client.get("/large", headers={"Accept-Encoding": encoding})
+    assert response.headers["content-encoding"] == encoding
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert response.json() == LARGE_PAYLOAD
+
+
+@pytest.mark.anyio
+async def test_brotli_is_preferred_over_gzip(client: AsyncClient) -> None:
+    response = await client.get("/large", headers={"Accept-Encoding": "gzip, br"})
+    assert response.headers["content-encoding"] == "br"
+
+    response = await client.get("/large", headers={"Accept-Encoding": "gzip, br;q=0"})
+    assert response.headers["content-encoding"] == "gzip"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("path", ["/small", "/image"])
+async def test_small_or_binary_responses_are_not_compressed(
+    client: AsyncClient, path: str
+) -> None:
+    response = await client.get(path, headers={"Accept-Encoding": "gzip, br"})
+    assert "content-encoding" not in response.headers
+
+
+@pytest.mark.anyio
+async def test_streamed_responses_are_compressed_incrementally(
+    client: AsyncClient,
+) -> None:
+    response = await client.get("/ndjson", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert response.text.splitlines()[-1] == '{"line": 99}'
+
+
+def test_compressed_bodies_are_cached(
+    compression_middleware: CompressionMiddleware,
+) -> None:
+    body = b"hot article " * 1000
+    compressed = compression_middleware.compress(body=body, encoding="gzip")
+    assert gzip.decompress(compressed) == body
+    assert compression_middleware.compress(body=body, encoding="gzip") is compressed
+
+    compressed = compression_middleware.compress(body=body, encoding="br")
+    assert brotli.decompress(compressed) == body
+
+
+def test_compression_cache_is_bounded() -> None:
+    middleware = CompressionMiddleware(app=small_json, cache_max_bytes=100)
+    first = middleware.compress(body=b"a" * 10_000, encoding="gzip")
+    middleware.compress(body=b"b" * 10_000, encoding="gzip")
+    middleware.compress(body=b"c" * 10_000, encoding="gzip")
+    assert middleware.compress(body=b"a" * 10_000, encoding="gzip") is not first
+
+
+@pytest.mark.anyio
+async def test_query_stats_headers(
+    test_client: AsyncClient, test_article: ArticleDTO
+) -> None:
+    response = await test_client.get(f"/articles/{test_article.slug}")
+    assert int(response.headers["x-db-queries"]) > 0
+    assert response.headers["server-timing"].startswith("db;dur=")
+
+
+@pytest.mark.anyio
+async def test_slow_queries_are_logged_with_parameter_shapes(
+    settings: BaseAppSettings,
+) -> None:
+    container = Container(
+        settings=settings.model_copy(update={"slow_query_threshold_ms": 0})
+    )
+    with capture_logs() as logs:
+        async with container.context_session() as session:
+            await session.execute(select(User.id).where(User.email == "secret"))
+
+    [log] = [log for log in logs if log["event"] == "Slow query"]
+    assert "FROM user" in log["statement"]
+    assert log["parameters"] == ["str"]
+
+
+async def slow_endpoint(request: Request) -> Response:
+    await asyncio.sleep(0.05)
+    return JSONResponse({"ok": True})
+
+
+@pytest.mark.anyio
+async def test_requests_with_profile_header_are_profiled(tmp_path: Path) -> None:
+    app = Starlette(routes=[Route("/slow", slow_endpoint)])
+    middleware = ProfilingMiddleware(
+        app=app, directory=str(tmp_path), token="secret", interval=0.001
+    )
+    async with AsyncClient(app=middleware, base_url="http://test") as client:
+        response = await client.get("/slow")
+        assert "x-profile-id" not in response.headers
+
+        response = await client.get("/slow", headers={"X-Profile": "wrong"})
+        assert "x-profile-id" not in response.headers
+
+        response = await client.get("/slow", headers={"X-Profile": "secret"})
+
+    profile = tmp_path / response.headers["x-profile-id"]
+    deadline = time.monotonic() + 5
+    while not profile.exists() and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+    # The awaited `asyncio.sleep` is sampled too, as a wall-clock profiler.
+    stacks = profile.read_text().splitlines()
+    assert any("slow_endpoint" in stack for stack in stacks)
+    assert list(tmp_path.iterdir()) == [profile]
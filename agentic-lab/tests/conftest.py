@@ -11,14 +11,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from bobverse.app import create_app
 from bobverse.core.config import get_app_settings
-from bobverse.core.container import Container
+from bobverse.core.container import Container, container
 from bobverse.core.dependencies import IArticleService, IAuthTokenService
 from bobverse.core.settings.base import BaseAppSettings
 from bobverse.domain.dtos.article import ArticleDTO, CreateArticleDTO
 from bobverse.domain.dtos.user import CreateUserDTO, UserDTO
 from bobverse.domain.repositories.article import IArticleRepository
+from bobverse.domain.repositories.comment import ICommentRepository
 from bobverse.domain.repositories.user import IUserRepository
 from bobverse.infrastructure.models import Base
+from tests.utils import QueryCounter
 
 SetupFixture: TypeAlias = None
 
@@ -69,6 +71,13 @@ async def session(di_container: Container) -> AsyncSession:
         yield session
 
 
+@pytest.fixture
+def query_counter() -> Generator[QueryCounter, None, None]:
+    # Routes run their statements on the application container engine.
+    with QueryCounter(engine=container.engine) as counter:
+        yield counter
+
+
 @pytest.fixture
 def user_repository(di_container: Container) -> IUserRepository:
     return di_container.user_repository()
@@ -79,6 +88,11 @@ def article_repository(di_container: Container) -> IArticleRepository:
     return di_container.article_repository()
 
 
+@pytest.fixture
+def comment_repository(di_container: Container) -> ICommentRepository:
+    return di_container.comment_repository()
+
+
 @pytest.fixture
 def article_service(di_container: Container) -> IArticleService:
     return di_container.article_service()
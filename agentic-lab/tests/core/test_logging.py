@@ -0,0 +1,29 @@
+import logging
+
+import pytest
+import structlog
+
+from bobverse.core.logging import SamplingProcessor
+
+
+def test_sampling_processor_drops_sampled_out_events() -> None:
+    processor = SamplingProcessor(rates={"Noisy": 0.0, "Kept": 1.0})
+    with pytest.raises(structlog.DropEvent):
+        processor(logging.getLogger(), "info", {"event": "Noisy"})
+
+    assert processor(logging.getLogger(), "info", {"event": "Kept"})
+    assert processor(logging.getLogger(), "info", {"event": "Other"})
+
+
+def test_sampling_processor_keeps_warnings_and_errors() -> None:
+    processor = SamplingProcessor(rates={"Noisy": 0.0})
+    for method_name in ("warning", "error"):
+        assert processor(logging.getLogger(), method_name, {"event": "Noisy"})
+
+
+def test_root_logger_only_enqueues_records() -> None:
+    handlers = logging.getLogger().handlers
+    assert [type(handler).__name__ for handler in handlers].count(
+        "_DeferredFormattingQueueHandler"
+    ) == 1
+    assert not any(type(handler) is logging.StreamHandler for handler in handlers)
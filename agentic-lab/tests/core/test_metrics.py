@@ -0,0 +1,62 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from bobverse.core.metrics import MetricsRegistry
+
+
+def test_registry_renders_prometheus_text() -> None:
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests.", labels=["route"])
+    latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    requests.inc(route="/api/tags")
+    requests.inc(route="/api/tags")
+    latency.observe(0.05)
+    latency.observe(0.5)
+
+    assert registry.render().splitlines() == [
+        "# HELP requests_total Requests.",
+        "# TYPE requests_total counter",
+        'requests_total{route="/api/tags"} 2',
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{le="0.1"} 1',
+        'latency_seconds_bucket{le="1.0"} 2',
+        'latency_seconds_bucket{le="+Inf"} 2',
+        "latency_seconds_sum 0.55",
+        "latency_seconds_count 2",
+    ]
+
+
+def test_label_values_are_escaped() -> None:
+    registry = MetricsRegistry()
+    registry.gauge("info", "Info.", labels=["name"]).set(1, name='a"b\\c')
+    assert 'info{name="a\\"b\\\\c"} 1' in registry.render()
+
+
+def test_multiprocess_metrics_are_summed(tmp_path: Path) -> None:
+    workers = [MetricsRegistry(multiprocess_dir=str(tmp_path)) for _ in range(2)]
+    for number, registry in enumerate(workers, start=1):
+        registry.counter("requests_total", "Requests.").inc(number)
+    # Both "workers" share a pid here, so give the first one its own file.
+    workers[0].flush()
+    (tmp_path / "worker-1.json").write_text(next(tmp_path.glob("*.json")).read_text())
+
+    assert "requests_total 3" in workers[1].render().splitlines()
+
+
+def test_multiprocess_gauges_of_dead_workers_are_left_out(tmp_path: Path) -> None:
+    registry = MetricsRegistry(multiprocess_dir=str(tmp_path))
+    registry.counter("requests_total", "Requests.").inc(2)
+    registry.gauge("requests_in_flight", "Requests in flight.").inc()
+    registry.flush()
+    dead_worker = subprocess.Popen([sys.executable, "-c", ""])
+    dead_worker.wait()
+    (tmp_path / f"{dead_worker.pid}.json").write_text(
+        next(tmp_path.glob("*.json")).read_text()
+    )
+
+    lines = registry.render().splitlines()
+
+    assert "requests_total 4" in lines
+    assert "requests_in_flight 1" in lines
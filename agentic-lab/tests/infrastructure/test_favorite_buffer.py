@@ -0,0 +1,126 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bobverse.core.container import Container
+from bobverse.core.settings.base import BaseAppSettings
+from bobverse.domain.dtos.article import ArticleDTO
+from bobverse.domain.dtos.user import UserDTO
+from bobverse.infrastructure.favorite_buffer import FavoriteBuffer
+from bobverse.infrastructure.models import Article, Favorite
+from bobverse.infrastructure.repositories.user import UserRepository
+from tests.utils import create_another_test_user
+
+
+@pytest.fixture
+async def another_user(
+    session: AsyncSession, user_repository: UserRepository
+) -> UserDTO:
+    return await create_another_test_user(
+        session=session, user_repository=user_repository
+    )
+
+
+async def get_favorites(
+    di_container: Container, article_id: int
+) -> tuple[list[int], int]:
+    """Users who favorited the article, and its favorites count."""
+    async with di_container.context_session() as session:
+        user_ids = await session.scalars(
+            select(Favorite.user_id).where(Favorite.article_id == article_id)
+        )
+        favorites_count = await session.scalar(
+            select(Article.favorites_count).where(Article.id == article_id)
+        )
+        return sorted(user_ids), favorites_count
+
+
+@pytest.mark.anyio
+async def test_buffered_favorites_are_coalesced_and_written_on_flush(
+    di_container: Container,
+    test_user: UserDTO,
+    another_user: UserDTO,
+    test_article: ArticleDTO,
+) -> None:
+    buffer = FavoriteBuffer(session_factory=di_container.context_session)
+    buffer.record(test_user.id, test_article.id, favorited=True, was_favorited=False)
+    buffer.record(another_user.id, test_article.id, favorited=True, was_favorited=False)
+    buffer.record(another_user.id, test_article.id, favorited=False, was_favorited=True)
+
+    assert buffer.favorited(test_user.id, test_article.id) is True
+    assert buffer.favorited(another_user.id, test_article.id) is False
+    assert buffer.count_delta(test_article.id) == 1
+    assert await get_favorites(di_container, test_article.id) == ([], 0)
+
+    await buffer.flush()
+
+    assert await get_favorites(di_container, test_article.id) == ([test_user.id], 1)
+    assert buffer.favorited(test_user.id, test_article.id) is None
+    assert buffer.count_delta(test_article.id) == 0
+    await buffer.close()
+
+
+@pytest.mark.anyio
+async def test_counts_are_adjusted_by_the_favorites_written(
+    di_container: Container, test_user: UserDTO, test_article: ArticleDTO
+) -> None:
+    # Another worker has written the favorite already.
+    first, second = (
+        FavoriteBuffer(session_factory=di_container.context_session) for _ in range(2)
+    )
+    for buffer in (first, second):
+        buffer.record(
+            test_user.id, test_article.id, favorited=True, was_favorited=False
+        )
+        await buffer.close()
+
+    assert await get_favorites(di_container, test_article.id) == ([test_user.id], 1)
+
+
+@pytest.mark.anyio
+async def test_buffered_favorites_are_flushed_in_the_background(
+    di_container: Container, test_user: UserDTO, test_article: ArticleDTO
+) -> None:
+    buffer = FavoriteBuffer(
+        session_factory=di_container.context_session, flush_interval=0
+    )
+    buffer.record(test_user.id, test_article.id, favorited=True, was_favorited=False)
+    for _ in range(100):
+        if buffer.favorited(test_user.id, test_article.id) is None:
+            break
+        await asyncio.sleep(0.01)
+
+    assert await get_favorites(di_container, test_article.id) == ([test_user.id], 1)
+    await buffer.close()
+
+
+@pytest.mark.anyio
+async def test_users_read_their_buffered_favorites(
+    settings: BaseAppSettings, test_user: UserDTO, test_article: ArticleDTO
+) -> None:
+    container = Container(
+        settings=settings.model_copy(
+            update={
+                "favorites_write_behind_enabled": True,
+                "favorites_flush_interval_ms": 60_000,
+            }
+        )
+    )
+    article_service = container.article_service()
+
+    async with container.context_session() as session:
+        article = await article_service.add_article_into_favorites(
+            session=session, slug=test_article.slug, current_user=test_user
+        )
+        assert (article.favorited, article.favorites_count) == (True, 1)
+        article = await article_service.get_article_by_slug(
+            session=session, slug=test_article.slug, current_user=test_user
+        )
+        assert (article.favorited, article.favorites_count) == (True, 1)
+    assert await get_favorites(container, test_article.id) == ([], 0)
+
+    await container.close()
+
+    assert await get_favorites(container, test_article.id) == ([test_user.id], 1)
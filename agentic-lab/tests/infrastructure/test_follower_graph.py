@@ -0,0 +1,162 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bobverse.core.container import Container
+from bobverse.domain.dtos.user import UserDTO
+from bobverse.infrastructure import follower_graph
+from bobverse.infrastructure.follower_graph import CHANGE_RETENTION, FollowerGraph
+from bobverse.infrastructure.models import FollowerChange
+from bobverse.infrastructure.repositories.follower import (
+    CachedFollowerRepository,
+    FollowerRepository,
+)
+from bobverse.infrastructure.repositories.user import UserRepository
+from tests.utils import create_another_test_user
+
+
+@pytest.fixture
+async def another_user(
+    session: AsyncSession, user_repository: UserRepository
+) -> UserDTO:
+    return await create_another_test_user(
+        session=session, user_repository=user_repository
+    )
+
+
+def test_follower_graph_applies_follows_and_unfollows() -> None:
+    graph = FollowerGraph()
+    for following_id in (5, 1, 3, 3):
+        graph.apply(1, following_id, following=True)
+    graph.apply(1, 3, following=False)
+    graph.apply(2, 9, following=False)
+
+    assert [graph.follows(1, user_id) for user_id in range(1, 6)] == [
+        True,
+        False,
+        False,
+        False,
+        True,
+    ]
+    assert not graph.follows(2, 9)
+
+
+@pytest.mark.anyio
+async def test_cached_follows_are_visible_in_their_transaction_then_committed(
+    di_container: Container, test_user: UserDTO, another_user: UserDTO
+) -> None:
+    graph = FollowerGraph()
+    repository = CachedFollowerRepository(graph=graph)
+
+    async with di_container.context_session() as session:
+        await repository.create(
+            session=session, follower_id=test_user.id, following_id=another_user.id
+        )
+        assert await repository.exists(
+            session=session, follower_id=test_user.id, following_id=another_user.id
+        )
+        assert await repository.list(
+            session=session, follower_id=test_user.id, following_ids=[another_user.id]
+        ) == [another_user.id]
+
+    assert graph.follows(test_user.id, another_user.id)
+
+
+@pytest.mark.anyio
+async def test_rolled_back_follows_are_discarded(
+    di_container: Container, test_user: UserDTO, another_user: UserDTO
+) -> None:
+    graph = FollowerGraph()
+    repository = CachedFollowerRepository(graph=graph)
+
+    with pytest.raises(RuntimeError):
+        async with di_container.context_session() as session:
+            await repository.create(
+                session=session, follower_id=test_user.id, following_id=another_user.id
+            )
+            raise RuntimeError()
+
+    assert not graph.follows(test_user.id, another_user.id)
+
+
+@pytest.mark.anyio
+async def test_workers_pick_up_each_others_follows(
+    di_container: Container, test_user: UserDTO, another_user: UserDTO
+) -> None:
+    worker = CachedFollowerRepository(graph=FollowerGraph(sync_interval=0))
+    other_worker = CachedFollowerRepository(graph=FollowerGraph(sync_interval=0))
+    async with di_container.context_session() as session:
+        assert not await other_worker.exists(
+            session=session, follower_id=test_user.id, following_id=another_user.id
+        )
+
+    for create in (True, False):
+        async with di_container.context_session() as session:
+            change = worker.create if create else worker.delete
+            await change(
+                session=session, follower_id=test_user.id, following_id=another_user.id
+            )
+        async with di_container.context_session() as session:
+            assert (
+                await other_worker.exists(
+                    session=session,
+                    follower_id=test_user.id,
+                    following_id=another_user.id,
+                )
+                is create
+            )
+
+
+@pytest.mark.anyio
+async def test_old_changes_are_pruned_as_changes_are_logged(
+    di_container: Container, test_user: UserDTO, another_user: UserDTO
+) -> None:
+    async with di_container.context_session() as session:
+        session.add(
+            FollowerChange(
+                follower_id=another_user.id,
+                following_id=test_user.id,
+                following=True,
+                created_at=datetime.now() - CHANGE_RETENTION - timedelta(minutes=1),
+            )
+        )
+    repository = CachedFollowerRepository(graph=FollowerGraph())
+
+    async with di_container.context_session() as session:
+        await repository.create(
+            session=session, follower_id=test_user.id, following_id=another_user.id
+        )
+
+    async with di_container.context_session() as session:
+        result = await session.execute(select(FollowerChange.follower_id))
+        assert list(result.scalars()) == [test_user.id]
+
+
+@pytest.mark.anyio
+async def test_workers_that_have_not_synced_for_long_reload_the_graph(
+    di_container: Container,
+    test_user: UserDTO,
+    another_user: UserDTO,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repository = CachedFollowerRepository(graph=FollowerGraph(sync_interval=0))
+    async with di_container.context_session() as session:
+        assert not await repository.exists(
+            session=session, follower_id=test_user.id, following_id=another_user.id
+        )
+        await repository.create(
+            session=session, follower_id=test_user.id, following_id=another_user.id
+        )
+    # Unfollowed, with the change pruned from the log before the worker synced.
+    async with di_container.context_session() as session:
+        await FollowerRepository().delete(
+            session=session, follower_id=test_user.id, following_id=another_user.id
+        )
+    monkeypatch.setattr(follower_graph, "RELOAD_AFTER", 0)
+
+    async with di_container.context_session() as session:
+        assert not await repository.exists(
+            session=session, follower_id=test_user.id, following_id=another_user.id
+        )
@@ -0,0 +1,56 @@
+from datetime import datetime
+
+import pytest
+
+from bobverse.core.container import Container
+from bobverse.domain.dtos.article import ArticleDTO
+from bobverse.domain.dtos.tag import TagDTO
+from bobverse.infrastructure.mappers.tag import TagModelMapper
+from bobverse.infrastructure.popular_tags import PopularTags
+from bobverse.infrastructure.repositories.article_tag import ArticleTagRepository
+from bobverse.infrastructure.repositories.tag import TagRepository
+
+
+def make_tag(tag_id: int, article_count: int) -> TagDTO:
+    return TagDTO(
+        id=tag_id,
+        tag=f"tag{tag_id}",
+        created_at=datetime.now(),
+        article_count=article_count,
+    )
+
+
+def test_popular_tags_apply_changed_counts() -> None:
+    popular_tags = PopularTags(size=2)
+    popular_tags.load([make_tag(1, 3), make_tag(2, 2)])
+    popular_tags.apply([make_tag(3, 5), make_tag(1, 0)])
+
+    assert [tag.id for tag in popular_tags.top(3)] == [3, 2]
+    assert not popular_tags.stale
+
+
+@pytest.mark.anyio
+async def test_popular_tags_are_patched_when_counts_are_committed(
+    di_container: Container, test_article: ArticleDTO
+) -> None:
+    popular_tags = PopularTags(refresh_interval=60)
+    tag_repository = TagRepository(
+        tag_mapper=TagModelMapper(), popular_tags=popular_tags
+    )
+    article_tag_repository = ArticleTagRepository(
+        tag_mapper=TagModelMapper(), popular_tags=popular_tags
+    )
+
+    async with di_container.context_session() as session:
+        tags = await tag_repository.list_popular(session=session, limit=10)
+        assert {(tag.tag, tag.article_count) for tag in tags} == {
+            ("tag1", 1),
+            ("tag2", 1),
+        }
+
+    async with di_container.context_session() as session:
+        await article_tag_repository.delete_many(
+            session=session, article_id=test_article.id
+        )
+        assert len(popular_tags.top(10)) == 2
+    assert popular_tags.top(10) == []
@@ -0,0 +1,58 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bobverse.core.container import Container
+from bobverse.domain.dtos.article import ArticleDTO, ArticleRecordDTO
+from bobverse.domain.dtos.user import UserDTO
+from bobverse.infrastructure.mappers.tag import TagModelMapper
+from bobverse.infrastructure.repositories.article import ArticleRepository
+from bobverse.infrastructure.repositories.article_tag import ArticleTagRepository
+from bobverse.infrastructure.tag_ids import TagIds
+from tests.utils import QueryCounter, create_another_test_article
+
+
+@pytest.fixture
+async def another_article(
+    session: AsyncSession, article_repository: ArticleRepository, test_user: UserDTO
+) -> ArticleRecordDTO:
+    return await create_another_test_article(
+        session=session, article_repository=article_repository, author_id=test_user.id
+    )
+
+
+def test_tag_ids_keep_the_most_recently_used() -> None:
+    tag_ids = TagIds(max_size=2)
+    tag_ids.add({"tag1": 1, "tag2": 2})
+    assert tag_ids.get_many(["tag1", "tag3"]) == {"tag1": 1}
+
+    tag_ids.add({"tag3": 3})
+
+    assert tag_ids.get_many(["tag1", "tag2", "tag3"]) == {"tag1": 1, "tag3": 3}
+
+
+@pytest.mark.anyio
+async def test_known_tags_skip_the_tag_upsert(
+    di_container: Container, test_article: ArticleDTO, another_article: ArticleRecordDTO
+) -> None:
+    tag_ids = TagIds()
+    repository = ArticleTagRepository(tag_mapper=TagModelMapper(), tag_ids=tag_ids)
+
+    async with di_container.context_session() as session:
+        tags = await repository.add_many(
+            session=session, article_id=another_article.id, tags=["tag1", "new", "new"]
+        )
+        assert tag_ids.get_many(["tag1", "new"]) == {}
+    assert {(tag.tag, tag.article_count) for tag in tags} == {("tag1", 2), ("new", 1)}
+    assert tag_ids.get_many(["tag1", "new"]).keys() == {"tag1", "new"}
+
+    with QueryCounter(engine=di_container.engine) as counter:
+        async with di_container.context_session() as session:
+            await repository.add_many(
+                session=session, article_id=test_article.id, tags=["new"]
+            )
+    assert not any(
+        statement.startswith("INSERT INTO tag ") for statement in counter.statements
+    )
+    async with di_container.context_session() as session:
+        tags = await repository.list(session=session, article_id=test_article.id)
+    assert {tag.tag for tag in tags} == {"tag1", "tag2", "new"}
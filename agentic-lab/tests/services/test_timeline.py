@@ -0,0 +1,202 @@
+import sqlite3
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bobverse.core.container import Container
+from bobverse.core.settings.base import BaseAppSettings
+from bobverse.domain.dtos.article import ArticleDTO, CreateArticleDTO
+from bobverse.domain.dtos.user import CreateUserDTO, UserDTO
+from bobverse.domain.services.article import IArticleService
+from bobverse.domain.services.profile import IProfileService
+from bobverse.infrastructure.models import Timeline, TimelineFanIn
+from bobverse.infrastructure.repositories.timeline import TimelineRepository
+from bobverse.infrastructure.repositories.user import UserRepository
+from tests.utils import create_another_test_user
+
+
+@pytest.fixture
+def timeline_container(settings: BaseAppSettings) -> Container:
+    # Authors with more than one follower are fanned in.
+    return Container(
+        settings=settings.model_copy(
+            update={"timeline_enabled": True, "timeline_celebrity_threshold": 1}
+        )
+    )
+
+
+@pytest.fixture
+def timeline_article_service(timeline_container: Container) -> IArticleService:
+    return timeline_container.article_service()
+
+
+@pytest.fixture
+def timeline_profile_service(timeline_container: Container) -> IProfileService:
+    return timeline_container.profile_service()
+
+
+@pytest.fixture
+async def follower(
+    session: AsyncSession,
+    user_repository: UserRepository,
+    timeline_profile_service: IProfileService,
+    test_user: UserDTO,
+) -> UserDTO:
+    user = await create_another_test_user(
+        session=session, user_repository=user_repository
+    )
+    await timeline_profile_service.follow_user(
+        session=session, username=test_user.username, current_user=user
+    )
+    return user
+
+
+async def publish(
+    session: AsyncSession, article_service: IArticleService, author: UserDTO, title: str
+) -> ArticleDTO:
+    return await article_service.create_new_article(
+        session=session,
+        author_id=author.id,
+        article_to_create=CreateArticleDTO(
+            title=title, description="Description", body="Body", tags=["tag1"]
+        ),
+    )
+
+
+async def timeline_article_ids(session: AsyncSession, user_id: int) -> set[int]:
+    result = await session.execute(
+        select(Timeline.article_id).where(Timeline.user_id == user_id)
+    )
+    return set(result.scalars())
+
+
+@pytest.mark.anyio
+async def test_new_article_is_pushed_to_follower_timelines(
+    session: AsyncSession,
+    timeline_article_service: IArticleService,
+    test_user: UserDTO,
+    follower: UserDTO,
+) -> None:
+    article = await publish(session, timeline_article_service, test_user, "Pushed")
+
+    assert await timeline_article_ids(session, follower.id) == {article.id}
+    assert not await timeline_article_ids(session, test_user.id)
+
+
+@pytest.mark.anyio
+async def test_articles_of_authors_above_celebrity_threshold_are_fanned_in(
+    session: AsyncSession,
+    user_repository: UserRepository,
+    timeline_article_service: IArticleService,
+    timeline_profile_service: IProfileService,
+    test_user: UserDTO,
+    follower: UserDTO,
+) -> None:
+    second_follower = await user_repository.add(
+        session=session,
+        create_item=CreateUserDTO(
+            username="second", email="second@gmail.com", password="password"
+        ),
+    )
+    await timeline_profile_service.follow_user(
+        session=session, username=test_user.username, current_user=second_follower
+    )
+
+    await publish(session, timeline_article_service, test_user, "Fanned In")
+
+    assert not await timeline_article_ids(session, follower.id)
+    fan_in_authors = await session.execute(select(TimelineFanIn.author_id))
+    assert list(fan_in_authors.scalars()) == [test_user.id]
+
+
+@pytest.mark.anyio
+async def test_follow_backfills_and_unfollow_trims_timeline(
+    session: AsyncSession,
+    user_repository: UserRepository,
+    timeline_article_service: IArticleService,
+    timeline_profile_service: IProfileService,
+    test_user: UserDTO,
+) -> None:
+    article = await publish(session, timeline_article_service, test_user, "Older")
+    user = await create_another_test_user(
+        session=session, user_repository=user_repository
+    )
+
+    await timeline_profile_service.follow_user(
+        session=session, username=test_user.username, current_user=user
+    )
+    assert await timeline_article_ids(session, user.id) == {article.id}
+
+    await timeline_profile_service.unfollow_user(
+        session=session, username=test_user.username, current_user=user
+    )
+    assert not await timeline_article_ids(session, user.id)
+
+
+@pytest.mark.anyio
+async def test_rebuild_fills_timelines_from_existing_follows(
+    session: AsyncSession,
+    user_repository: UserRepository,
+    di_container: Container,
+    article_service: IArticleService,
+    test_user: UserDTO,
+) -> None:
+    # Followed and published while timelines were off.
+    article = await publish(session, article_service, test_user, "Before")
+    celebrity = await create_another_test_user(
+        session=session, user_repository=user_repository
+    )
+    follower = await user_repository.add(
+        session=session,
+        create_item=CreateUserDTO(
+            username="second", email="second@gmail.com", password="password"
+        ),
+    )
+    profile_service = di_container.profile_service()
+    for user, followed in (
+        (test_user, celebrity),
+        (follower, celebrity),
+        (follower, test_user),
+    ):
+        await profile_service.follow_user(
+            session=session, username=followed.username, current_user=user
+        )
+
+    await TimelineRepository().rebuild(session=session, celebrity_threshold=1, limit=1)
+
+    assert await timeline_article_ids(session, follower.id) == {article.id}
+    fan_in = await session.execute(select(TimelineFanIn.author_id))
+    assert list(fan_in.scalars()) == [celebrity.id]
+
+
+@pytest.mark.anyio
+@pytest.mark.skipif(
+    sqlite3.sqlite_version_info < (3, 44, 0), reason="SQLite < 3.44 lacks string_agg"
+)
+async def test_feed_merges_pushed_and_fanned_in_articles(
+    session: AsyncSession,
+    user_repository: UserRepository,
+    timeline_article_service: IArticleService,
+    timeline_profile_service: IProfileService,
+    test_user: UserDTO,
+    follower: UserDTO,
+) -> None:
+    pushed = await publish(session, timeline_article_service, test_user, "Pushed")
+    second_follower = await user_repository.add(
+        session=session,
+        create_item=CreateUserDTO(
+            username="second", email="second@gmail.com", password="password"
+        ),
+    )
+    await timeline_profile_service.follow_user(
+        session=session, username=test_user.username, current_user=second_follower
+    )
+    fanned_in = await publish(session, timeline_article_service, test_user, "Pulled")
+
+    feed = await timeline_article_service.get_articles_feed_v2(
+        session=session, current_user=follower, limit=10, offset=0
+    )
+
+    assert [article.id for article in feed.articles] == [fanned_in.id, pushed.id]
+    assert feed.articles_count == 2
@@ -1,4 +1,9 @@
-from sqlalchemy.ext.asyncio import AsyncSession
+from dataclasses import dataclass, field
+from typing import Any
+
+from httpx import AsyncClient, Request, Response
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from bobverse.domain.dtos.article import ArticleRecordDTO, CreateArticleDTO
 from bobverse.domain.dtos.user import CreateUserDTO, UserDTO
@@ -27,3 +32,57 @@ async def create_another_test_article(
     return await article_repository.add(
         session=session, author_id=author_id, create_item=create_article_dto
     )
+
+
+@dataclass
+class RequestQueries:
+    request: str
+    statements: list[str] = field(default_factory=list)
+
+    def assert_within_budget(self, budget: int) -> None:
+        assert len(self.statements) <= budget, (
+            f"{self.request} issued {len(self.statements)} queries, "
+            f"budget is {budget}:\n" + "\n".join(self.statements)
+        )
+
+
+class QueryCounter:
+    """
+    Count the statements executed on an engine, per request made through the
+    tracked test clients.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine.sync_engine
+        self._started_at = 0
+        self.statements: list[str] = []
+        self.requests: list[RequestQueries] = []
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self._engine, "after_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        event.remove(self._engine, "after_cursor_execute", self._on_execute)
+
+    @property
+    def last(self) -> RequestQueries:
+        return self.requests[-1]
+
+    def track(self, client: AsyncClient) -> AsyncClient:
+        event_hooks = client.event_hooks
+        event_hooks["request"].append(self._on_request)
+        event_hooks["response"].append(self._on_response)
+        client.event_hooks = event_hooks
+        return client
+
+    def _on_execute(self, conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        self.statements.append(statement)
+
+    async def _on_request(self, request: Request) -> None:
+        self._started_at = len(self.statements)
+
+    async def _on_response(self, response: Response) -> None:
+        request = f"{response.request.method} {response.request.url.path}"
+        statements = self.statements[self._started_at :]
+        self.requests.append(RequestQueries(request=request, statements=statements))